@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import ecc_calculations
+from cryptographic_functions import rsa_calculations
+from cryptographic_functions.core import discrete_log
+from cryptographic_functions.core import ecc
+from cryptographic_functions.core import ecdlp
+from cryptographic_functions.core import ecdsa
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import point_counting
+from cryptographic_functions.core import prime_generation
+from cryptographic_functions.core import primality
+from cryptographic_functions.core import rsa
+from cryptographic_functions.core import tables
+from math import pi, sqrt
+from tabulate import tabulate
+import contextlib
+import os
+import random
+import timeit
+import tracemalloc
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Curves over 256-bit prime fields (a = 0 and a = -3) with their generator and its prime order
+ECC_CURVES = [
+    ('secp256k1', (0, 7, 2 ** 256 - 2 ** 32 - 977),
+     (0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+      0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8),
+     0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141),
+    ('P-256', (-3, 0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+               2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 1),
+     (0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+      0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5),
+     0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551),
+]
+
+
+# Average runtime of a function call in microseconds
+def measure(function, repeat=5):
+    number, _ = timeit.Timer(function).autorange()
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+# Modular exponentiation crossover from toy to real key sizes
+def modexp_crossover(bit_lengths=(8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096), naive_limit=16):
+    print(tabulate([['Benchmark: Modulare Exponentiation']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        n = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+        b = random.randrange(2, n)
+        e = random.randrange(n >> 1, n)
+
+        # The full integer b^e is only computable for toy key sizes
+        naive = f'{measure(lambda: (b ** e) % n):.2f}' if bits <= naive_limit else '-'
+        builtin = measure(lambda: modexp.modexp(b, e, n))
+        window = measure(lambda: modexp.sliding_window(b, e, n))
+        modexp.fixed_base(b, e, n)
+        fixed = measure(lambda: modexp.fixed_base(b, e, n))
+        rows.append([bits, naive, f'{builtin:.2f}', f'{window:.2f}', f'{fixed:.2f}', f'{builtin / fixed:.2f}'])
+
+    print(tabulate(rows, headers=['Bits', '(b ** e) % n [µs]', 'pow [µs]', 'Sliding-Window [µs]', 'Fixed-Base [µs]',
+                                  'Faktor pow / Fixed-Base'], tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Primality test comparison between trial division and the tiered primality test
+def primality_comparison(exponents=(6, 9, 12, 14, 18, 24, 50, 100, 300), trial_division_limit=14):
+    print(tabulate([['Benchmark: Primzahltest']], tablefmt='fancy_grid'))
+
+    rows = []
+    for k in exponents:
+        # Smallest prime number greater than or equal to 10^k (worst case for trial division)
+        n = 10 ** k + 1
+        while not primality.is_prime(n):
+            n += 2
+
+        trial = f'{measure(lambda: primality.trial_division(n), 1):.2f}' if k <= trial_division_limit else '-'
+        tiered = measure(lambda: primality.certainty(n))
+        rows.append([f'10^{k}', n.bit_length(), trial, f'{tiered:.2f}',
+                     ['zusammengesetzt', 'wahrscheinlich prim', 'prim'][primality.certainty(n)]])
+
+    print(tabulate(rows, headers=['n ≥', 'Bits', 'Probedivision [µs]', 'Gestufter Test [µs]', 'Gewissheit'],
+                   tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# RSA keypairs per second depending on the bit length and the number of processes
+def rsa_keypair_generation(bit_lengths=(512, 1024, 2048), processes=(1, os.cpu_count()), keypairs=5):
+    print(tabulate([['Benchmark: RSA Schlüsselerzeugung']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        row = [bits]
+        for n in processes:
+            start = timeit.default_timer()
+            for _ in range(keypairs):
+                rsa.random_keypair_generation(bits, processes=n)
+            row.append(f'{keypairs / (timeit.default_timer() - start):.2f}')
+        rows.append(row)
+
+    print(tabulate(rows, headers=['Bits'] + [f'Schlüsselpaare/s ({n} Prozesse)' for n in processes],
+                   tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# RSA decryption with and without the Chinese remainder theorem depending on the bit length
+def rsa_crt_decryption(bit_lengths=(512, 1024, 2048, 3072, 4096)):
+    print(tabulate([['Benchmark: RSA Entschlüsselung mit Chinesischem Restsatz']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        public_key, private_key = rsa.random_keypair_generation(bits)
+        c = rsa.encryption(public_key, random.randrange(public_key[1]))
+        plain = measure(lambda: rsa.decryption(private_key, c, False), 1)
+        crt = measure(lambda: rsa.decryption(private_key, c), 1)
+        checked = measure(lambda: rsa.decryption(private_key, c, e=public_key[0]), 1)
+        rows.append([bits, f'{plain:.2f}', f'{crt:.2f}', f'{checked:.2f}', f'{plain / crt:.2f}'])
+
+    print(tabulate(rows, headers=['Bits', 'c^d mod n [µs]', 'CRT [µs]', 'CRT mit Fehlerprüfung [µs]',
+                                  'Faktor c^d mod n / CRT'], tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# RSA batch encryption throughput compared to a Python loop over the single value functions
+def rsa_batch_encryption(bit_lengths=(16, 32, 48, 64, 128), count=100000, loop_count=2000):
+    print(tabulate([['Benchmark: RSA Stapelverschlüsselung']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        public_key, private_key = rsa.random_keypair_generation(bits)
+        values = [random.randrange(public_key[1]) for _ in range(count)]
+
+        # Python loop over the functions with and without calculation path output
+        start = timeit.default_timer()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for p in values[:loop_count]:
+                rsa_calculations.encryption(public_key, p)
+        narrated = loop_count / (timeit.default_timer() - start)
+        start = timeit.default_timer()
+        for p in values[:loop_count]:
+            rsa_calculations.encryption(public_key, p, quiet=True)
+        quiet = loop_count / (timeit.default_timer() - start)
+
+        # Batch encryption and decryption
+        array = modexp.as_array(values, public_key[1])
+        start = timeit.default_timer()
+        c = rsa.encrypt_many(public_key, array)
+        encrypt = count / (timeit.default_timer() - start)
+        start = timeit.default_timer()
+        rsa.decrypt_many(private_key, c)
+        decrypt = count / (timeit.default_timer() - start)
+        rows.append([bits, f'{narrated:.0f}', f'{quiet:.0f}', f'{encrypt:.0f}', f'{decrypt:.0f}',
+                     f'{encrypt / quiet:.2f}'])
+
+    print(tabulate(rows, headers=['Bits', 'Schleife mit Ausgabe [1/s]', 'Schleife quiet [1/s]', 'encrypt_many [1/s]',
+                                  'decrypt_many [1/s]', 'Faktor encrypt_many / quiet'], tablefmt='pretty'),
+          end='\n\n')
+    return rows
+
+
+# Runtime and peak memory of the baby-step giant-step tables depending on the bit length and the memory budget
+def bsgs_memory(bit_lengths=(24, 32, 40), budgets=(1 << 26, 1 << 20, 1 << 16)):
+    print(tabulate([['Benchmark: Babystep-Giantstep Speicherbedarf']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        p = prime_generation.random_prime(bits)
+        g = 3
+        h = pow(g, random.randrange(p - 1), p)
+        solvers = [('dict', lambda: discrete_log.hashed_bsgs(g, h, p))]
+        solvers += [(f'NumPy ({budget >> 10} KiB)',
+                     lambda budget=budget: discrete_log.sorted_bsgs(g, h, p, memory=budget)) for budget in budgets]
+        for name, solver in solvers:
+            tracemalloc.start()
+            start = timeit.default_timer()
+            solver()
+            runtime = timeit.default_timer() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            rows.append([bits, name, f'{runtime:.3f}', f'{peak / (1 << 20):.2f}'])
+
+    print(tabulate(rows, headers=['Bits', 'Tabelle', 'Laufzeit [s]', 'Spitzenspeicher [MiB]'], tablefmt='pretty'),
+          end='\n\n')
+    return rows
+
+
+# Parallel giant-step search depending on the number of processes
+def bsgs_scaling(bit_lengths=(36, 40, 44), processes=(1, 2, 4, 8)):
+    print(tabulate([['Benchmark: Parallele Giantstep-Suche']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        p = prime_generation.random_prime(bits)
+        g = 3
+        h = pow(g, random.randrange(p - 1), p)
+        row = [bits]
+        for n in processes:
+            start = timeit.default_timer()
+            discrete_log.bsgs(g, h, p, processes=n)
+            row.append(f'{timeit.default_timer() - start:.3f}')
+        rows.append(row)
+
+    print(tabulate(rows, headers=['Bits'] + [f'Laufzeit [s] ({n} Prozesse)' for n in processes], tablefmt='pretty'),
+          end='\n\n')
+    return rows
+
+
+# Generation of the addition, multiplication and power tables with list comprehensions and with NumPy
+def table_generation(moduli=(1000, 10000, 50000), rows=200):
+    print(tabulate([['Benchmark: Erzeugung der Modulo-Tabellen']], tablefmt='fancy_grid'))
+
+    # The first rows of every table are generated, since the full tables of large moduli do not fit into memory
+    generators = [
+        ('Addition', lambda m, r: [[(x + y) % m for y in range(m)] for x in range(r)],
+         lambda m, r: tables.addition_table(m, range(r))),
+        ('Multiplikation', lambda m, r: [[(x * y) % m for y in range(m)] for x in range(r)],
+         lambda m, r: tables.multiplication_table(m, range(r))),
+        ('Potenz', lambda m, r: [[modexp.modexp(x, y, m) for y in range(1, m)] for x in range(1, r)],
+         lambda m, r: tables.power_table(m, range(1, r))),
+    ]
+
+    rows_out = []
+    for m in moduli:
+        for name, python, vectorized in generators:
+            start = timeit.default_timer()
+            python(m, rows)
+            python_time = timeit.default_timer() - start
+            start = timeit.default_timer()
+            vectorized(m, rows)
+            numpy_time = timeit.default_timer() - start
+            rows_out.append([m, name, f'{python_time * 1e3:.2f}', f'{numpy_time * 1e3:.2f}',
+                             f'{python_time / numpy_time:.1f}'])
+
+    print(tabulate(rows_out, headers=['m', 'Tabelle', f'Python [ms] ({rows} Zeilen)', f'NumPy [ms] ({rows} Zeilen)',
+                                      'Faktor Python / NumPy'], tablefmt='pretty'), end='\n\n')
+    return rows_out
+
+
+# Elliptic curve arithmetic in affine coordinates (one inversion per operation) and in Jacobian coordinates
+def ecc_arithmetic(operations=1000):
+    print(tabulate([['Benchmark: Arithmetik auf elliptischen Kurven']], tablefmt='fancy_grid'))
+
+    rows = []
+    for name, curve, g, _ in ECC_CURVES:
+        # Chain of additions R = R + G followed by a doubling in every step
+        def affine():
+            r = g
+            for _ in range(operations):
+                r = ecc.double(curve, ecc.addition(curve, r, g))
+            return r
+
+        def jacobian():
+            r = ecc.to_jacobian(g)
+            for _ in range(operations):
+                r = ecc.jacobian_double(curve, ecc.jacobian_addition(curve, r, ecc.to_jacobian(g)))
+            return ecc.to_affine(curve, r)
+
+        if affine() != jacobian():
+            return -1
+        affine_time = measure(affine, repeat=3) / (2 * operations)
+        jacobian_time = measure(jacobian, repeat=3) / (2 * operations)
+        rows.append([name, operations, f'{affine_time:.2f}', f'{jacobian_time:.2f}',
+                     f'{affine_time / jacobian_time:.2f}'])
+
+    print(tabulate(rows, headers=['Kurve', 'Additionen + Verdopplungen', 'Affin [µs/Operation]',
+                                  'Jacobi [µs/Operation]', 'Faktor Affin / Jacobi'], tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Elliptic curve scalar multiplication with the different methods and multi-scalar multiplication
+def ecc_scalar_multiplication(counts=(2, 16, 128, 512)):
+    print(tabulate([['Benchmark: Skalarmultiplikation auf elliptischen Kurven']], tablefmt='fancy_grid'))
+
+    rows = []
+    for name, curve, g, _ in ECC_CURVES:
+        k = random.randrange(1, curve[2])
+        ecc.scalar_mul(curve, k, g, 'comb')
+        rows.append([name, 'k * G', '1', *(f'{measure(lambda m=m: ecc.scalar_mul(curve, k, g, m), repeat=3) / 1e3:.2f}'
+                                           for m in ('ladder', 'wnaf', 'comb'))])
+
+        # Sum of many multiples k_i * P_i compared to separate wNAF multiplications
+        for count in counts:
+            scalars = [random.randrange(1, curve[2]) for _ in range(count)]
+            points = [ecc.scalar_mul(curve, random.randrange(1, curve[2]), g) for _ in range(count)]
+            start = timeit.default_timer()
+            r = ecc.INFINITY
+            for k_i, p_i in zip(scalars, points):
+                r = ecc.addition(curve, r, ecc.scalar_mul(curve, k_i, p_i))
+            separate = timeit.default_timer() - start
+            start = timeit.default_timer()
+            if ecc.multi_scalar_mul(curve, scalars, points) != r:
+                return -1
+            rows.append([name, 'Σ k_i * P_i', count, '-', f'{separate * 1e3:.2f}',
+                         f'{(timeit.default_timer() - start) * 1e3:.2f}'])
+
+    print(tabulate(rows, headers=['Kurve', 'Berechnung', 'Punkte', 'Montgomery-Leiter [ms]', 'wNAF [ms]',
+                                  'Kamm / Straus / Pippenger [ms]'], tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Point counting with the sum of Legendre symbols, Shanks-Mestre and Schoof depending on the size of the field
+def ecc_point_counting(bit_lengths=(16, 20, 24, 32, 48, 64, 96, 128), processes=(1, os.cpu_count())):
+    print(tabulate([['Benchmark: Gruppenordnung elliptischer Kurven']], tablefmt='fancy_grid'))
+
+    # Methods with the range of bit lengths in which they are measured
+    methods = [
+        (point_counting.legendre_order, 1, 24),
+        (point_counting.shanks_mestre_order, 1, 64),
+        (point_counting.schoof_order, 48, 128),
+    ]
+
+    rows = []
+    for bits in bit_lengths:
+        n = prime_generation.random_prime(bits)
+        curve = (random.randrange(n), random.randrange(n), n)
+        row = [bits]
+        orders = set()
+        for method, low, high in methods:
+            if not low <= bits <= high:
+                row.append('-')
+                continue
+            start = timeit.default_timer()
+            orders.add(method(curve))
+            row.append(f'{timeit.default_timer() - start:.3f}')
+        if len(orders) != 1:
+            return -1
+        rows.append(row)
+
+    print(tabulate(rows, headers=['Bits', 'Legendre [s]', 'Shanks-Mestre [s]', 'Schoof [s]'], tablefmt='pretty'),
+          end='\n\n')
+
+    # Search for a curve with prime order over a 64-bit field
+    n = prime_generation.random_prime(64)
+    rows = []
+    for count in processes:
+        start = timeit.default_timer()
+        point_counting.prime_order_curve(n, count)
+        rows.append([count, f'{timeit.default_timer() - start:.3f}'])
+    print(tabulate(rows, headers=['Prozesse', 'Suche einer Kurve mit Primzahlordnung (64 Bits) [s]'],
+                   tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Enumeration of all points of a curve with on_curve for every pair (x, y) and with the vectorized square roots
+def ecc_point_enumeration(bit_lengths=(8, 10, 12, 16, 20, 24), naive_limit=12):
+    print(tabulate([['Benchmark: Aufzählung der Punkte elliptischer Kurven']], tablefmt='fancy_grid'))
+
+    rows = []
+    for bits in bit_lengths:
+        n = prime_generation.random_prime(bits)
+        curve = (random.randrange(n), random.randrange(n), n)
+
+        # The naive enumeration checks all n^2 pairs and is only feasible for toy fields
+        naive = '-'
+        if bits <= naive_limit:
+            start = timeit.default_timer()
+            [(x, y) for x in range(n) for y in range(n) if ecc_calculations.on_curve(curve, (x, y), quiet=True)]
+            naive = f'{timeit.default_timer() - start:.3f}'
+        start = timeit.default_timer()
+        points = point_counting.curve_points(curve)
+        rows.append([bits, len(points) + 1, naive, f'{timeit.default_timer() - start:.3f}',
+                     f'{points.nbytes / (1 << 20):.2f}'])
+
+    print(tabulate(rows, headers=['Bits', '#E', 'on_curve für alle (x, y) [s]', 'Vektorisiert [s]', 'Array [MiB]'],
+                   tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Discrete logarithms on curves of prime order with the expected and actual number of iterations, from whose rate the
+# runtime on larger curves is extrapolated
+def ecdlp_survival(bit_lengths=(30, 34, 38, 42), extrapolation=(48, 52, 56, 60), processes=os.cpu_count()):
+    print(tabulate([['Benchmark: Diskreter Logarithmus auf elliptischen Kurven']], tablefmt='fancy_grid'))
+
+    rows = []
+    rate = 0
+    for bits in bit_lengths:
+        n = prime_generation.random_prime(bits)
+        curve, order = point_counting.prime_order_curve(n, processes)
+        p = point_counting.random_point(curve)
+        q = ecc.scalar_mul(curve, random.randrange(order), p)
+        trace = []
+        start = timeit.default_timer()
+        ecdlp.discrete_log(curve, p, q, processes, trace)
+        runtime = timeit.default_timer() - start
+        _, _, _, method, iterations, expected = trace[0]
+        rate = iterations / runtime
+        rows.append([bits, method, expected, iterations, f'{runtime:.3f}'])
+
+    # Pollard's rho needs about sqrt(pi * n / 2) iterations at the rate measured on the largest curve
+    for bits in extrapolation:
+        expected = round(sqrt(pi * 2 ** bits / 2))
+        rows.append([bits, 'Pollard-Rho', expected, '-', f'~{expected / rate:.0f}'])
+
+    print(tabulate(rows, headers=['Bits', 'Verfahren', 'Erwartete Iterationen', 'Iterationen', 'Laufzeit [s]'],
+                   tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Signatures per second of ECDSA signing, single verification and batch verification of signatures by a few signers
+def ecdsa_verification(batch_sizes=(16, 64, 256), signers=4):
+    print(tabulate([['Benchmark: ECDSA Stapelverifizierung']], tablefmt='fancy_grid'))
+
+    rows = []
+    for name, curve, g, n in ECC_CURVES:
+        keys = [ecdsa.keypair_generation(curve, g, n) for _ in range(signers)]
+        for count in batch_sizes:
+            batch = []
+            start = timeit.default_timer()
+            for i in range(count):
+                public_key, private_key = keys[i % signers]
+                m = random.getrandbits(256)
+                batch.append((public_key, m, ecdsa.sign(public_key, private_key, m)))
+            signing = count / (timeit.default_timer() - start)
+
+            start = timeit.default_timer()
+            if not all(ecdsa.verify(*triple) for triple in batch):
+                return -1
+            single = count / (timeit.default_timer() - start)
+
+            start = timeit.default_timer()
+            if not ecdsa.batch_verify(batch):
+                return -1
+            combined = count / (timeit.default_timer() - start)
+            rows.append([name, count, f'{signing:.0f}', f'{single:.0f}', f'{combined:.0f}', f'{combined / single:.2f}'])
+
+    print(tabulate(rows, headers=['Kurve', 'Signaturen', 'Signieren [1/s]', 'Einzeln verifiziert [1/s]',
+                                  'Stapelverifiziert [1/s]', 'Faktor'], tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Modular square roots of 256-bit primes of every residue class with the selected method and the general algorithms
+def square_roots(bits=256, count=200):
+    print(tabulate([['Benchmark: Modulare Quadratwurzeln']], tablefmt='fancy_grid'))
+
+    # Prime numbers p ≡ 3 mod 4, p ≡ 5 mod 8, p ≡ 1 mod 8 with small s and p = c * 2^(bits / 2) + 1 with large s
+    primes = []
+    for modulus, residue in ((4, 3), (8, 5), (16, 9)):
+        p = prime_generation.random_prime(bits)
+        while p % modulus != residue:
+            p = prime_generation.random_prime(bits)
+        primes.append(p)
+    p = 4
+    while not primality.is_prime(p):
+        p = (random.getrandbits(bits // 2) | 1 << (bits // 2 - 1)) << (bits // 2) | 1
+    primes.append(p)
+
+    rows = []
+    for p in primes:
+        s = modulo.sylow_decomposition(p)[1]
+        values = [pow(random.randrange(1, p), 2, p) for _ in range(count)]
+        row = [p % 8, s]
+        for method in (modulo.sqrt_mod, modulo.tonelli_shanks, modulo.cipolla):
+            start = timeit.default_timer()
+            for a in values:
+                method(p, a)
+            row.append(f'{(timeit.default_timer() - start) / count * 1e6:.2f}')
+        rows.append(row)
+
+    print(tabulate(rows, headers=['p mod 8', 's', 'sqrt_mod [µs]', 'Tonelli-Shanks [µs]', 'Cipolla [µs]'],
+                   tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+# Size of compressed point sets and their decompression point by point and with the vectorized square roots
+def point_compression(bit_lengths=(16, 24, 31), count=100000):
+    print(tabulate([['Benchmark: Punktkompression']], tablefmt='fancy_grid'))
+
+    curves = []
+    for bits in bit_lengths:
+        n = prime_generation.random_prime(bits)
+        curves.append((f'{bits} Bits', (random.randrange(n), random.randrange(n), n)))
+    curves += [(name, curve) for name, curve, _, _ in ECC_CURVES]
+
+    rows = []
+    for name, curve in curves:
+        points = [point_counting.random_point(curve) for _ in range(count if curve[2] < 1 << 32 else count // 100)]
+        data = ecc.compress_many(curve, points)
+        length = 1 + ecc.field_bytes(curve)
+        start = timeit.default_timer()
+        for i in range(0, len(data), length):
+            ecc.decompress(curve, data[i:i + length])
+        single = len(points) / (timeit.default_timer() - start)
+        start = timeit.default_timer()
+        ecc.decompress_many(curve, data)
+        bulk = len(points) / (timeit.default_timer() - start)
+        rows.append([name, len(points), 2 * (length - 1) * len(points), len(data), f'{single:.0f}', f'{bulk:.0f}'])
+
+    print(tabulate(rows, headers=['Kurve', 'Punkte', 'Unkomprimiert [B]', 'Komprimiert [B]', 'Einzeln [1/s]',
+                                  'decompress_many [1/s]'], tablefmt='pretty'), end='\n\n')
+    return rows
+
+
+if __name__ == '__main__':
+    # modexp_crossover()
+    # primality_comparison()
+    # rsa_keypair_generation()
+    # rsa_crt_decryption()
+    # rsa_batch_encryption()
+    # bsgs_memory()
+    # bsgs_scaling()
+    # table_generation()
+    # ecc_arithmetic()
+    # ecc_scalar_multiplication()
+    # ecc_point_counting()
+    # ecc_point_enumeration()
+    # ecdlp_survival()
+    # ecdsa_verification()
+    # square_roots()
+    # point_compression()
+    pass
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import numpy as np
+import os
+import tempfile
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Directory of the persistent cache (disabled if None), configured by the environment or by enable()
+DIRECTORY = os.environ.get('CRYPTOGRAPHIC_FUNCTIONS_CACHE')
+
+# Maximum total size of the cache files in bytes before the least recently used entries are evicted
+SIZE_LIMIT = int(os.environ.get('CRYPTOGRAPHIC_FUNCTIONS_CACHE_SIZE', 1 << 30))
+
+# Minimum number of entries from which a precomputed table is worth a file access
+MIN_TABLE_SIZE = 1 << 12
+
+
+# Enable the persistent cache in the given directory with a size limit in bytes
+def enable(directory=os.path.join(os.path.expanduser('~'), '.cache', 'cryptographic_functions'), size_limit=None):
+    global DIRECTORY, SIZE_LIMIT
+    os.makedirs(directory, exist_ok=True)
+    DIRECTORY = directory
+    if size_limit is not None:
+        SIZE_LIMIT = size_limit
+
+
+# Disable the persistent cache (the files are kept)
+def disable():
+    global DIRECTORY
+    DIRECTORY = None
+
+
+# File of a cache entry, named by the kind of data and a hash of the group parameters
+def entry_path(kind, key, suffix):
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+    return os.path.join(DIRECTORY, f'{kind}-{digest}{suffix}')
+
+
+# Atomic replacement of a cache file, so that concurrent processes never read a partially written entry
+def write_entry(path, write):
+    os.makedirs(DIRECTORY, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=DIRECTORY, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(temporary, path)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        return
+    evict()
+
+
+# Removal of the least recently used entries until the cache fits into its size limit
+def evict():
+    entries = []
+    for entry in os.scandir(DIRECTORY):
+        if entry.is_file() and not entry.name.endswith('.tmp'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= SIZE_LIMIT:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+# Memory-mapped NumPy array of a cache entry (None if the cache is disabled or the entry does not exist)
+def load_array(kind, key):
+    if DIRECTORY is None:
+        return None
+    path = entry_path(kind, key, '.npy')
+    try:
+        array = np.load(path, mmap_mode='r')
+
+        # The modification time marks the last use for the LRU eviction
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return array
+
+
+# Store a NumPy array as cache entry
+def store_array(kind, key, array):
+    if DIRECTORY is not None:
+        write_entry(entry_path(kind, key, '.npy'), lambda f: np.save(f, array))
+
+
+# JSON value of a cache entry (None if the cache is disabled or the entry does not exist)
+def load_value(kind, key):
+    if DIRECTORY is None:
+        return None
+    path = entry_path(kind, key, '.json')
+    try:
+        with open(path) as f:
+            value = json.load(f)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return value
+
+
+# Store a JSON serializable value as cache entry
+def store_value(kind, key, value):
+    if DIRECTORY is not None:
+        write_entry(entry_path(kind, key, '.json'), lambda f: f.write(json.dumps(value).encode()))
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import shared_functions
+from cryptographic_functions.core import modexp
+import random
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Diffie–Hellman key exchange
+def key_exchange(p, g, a=None, b=None):
+    # Choose an integer p that is a prime number and an integer g such that 1 < g < p
+    if not shared_functions.is_prime(p) or g not in range(2, p):
+        return -1
+
+    # Choose an integer a such that 1 < a < p
+    if a is None:
+        a = random.randrange(2, p)
+
+    # Choose an integer b such that 1 < b < p and a != b
+    if b is None:
+        b = a
+        while b == a:
+            b = random.randrange(2, p)
+
+    if a == b or a not in range(2, p) or b not in range(2, p):
+        return -1
+
+    # Secret generation
+    a_secret = modexp.fixed_base(g, a, p)
+    b_secret = modexp.fixed_base(g, b, p)
+    a_shared_key = modexp.modexp(b_secret, a, p)
+    b_shared_key = modexp.modexp(a_secret, b, p)
+
+    if a_shared_key != b_shared_key:
+        return -1
+    return a_shared_key
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cryptographic_functions.core import cache
+from cryptographic_functions.core import factorization
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import primality
+from math import isqrt
+import numpy as np
+import os
+import random
+import tempfile
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Prime subgroup orders below this limit are solved with BSGS (at most 2^16 table entries), above with Pollard's rho
+BSGS_LIMIT = 1 << 32
+
+# Number of random starting points of Pollard's rho for logarithms before it gives up
+RHO_RESTARTS = 16
+
+# Memory budget of the baby-step table in bytes and the size of one entry (uint64 value and int64 exponent)
+MEMORY_BUDGET = 1 << 26
+ENTRY_SIZE = 16
+
+# Number of giant-step ranges per process of the parallel search
+RANGES_PER_PROCESS = 4
+
+
+# Baby-step giant-step for g^x = h mod p with a dictionary as baby-step table (moduli of arbitrary size)
+def hashed_bsgs(g, h, p, order=None):
+    order = p - 1 if order is None else order
+    m = isqrt(order - 1) + 1 if order > 1 else 1
+
+    # Calculation of g^{0...(m-1)} mod p (baby-step) by incremental multiplication
+    tab = {}
+    b = 1
+    for r in range(m):
+        tab.setdefault(b, r)
+        b = (b * g) % p
+
+    # Find match in table (giant-step) with z = h * g^(-m * q) mod p
+    y = pow(g, -m, p)
+    z = h % p
+    for q in range(m):
+        if z in tab:
+            return q * m + tab[z]
+        z = (z * y) % p
+    return -1
+
+
+# Vectorized powers g^0, g^1, ..., g^(count - 1) mod p < 2^56 as uint64 array by repeated doubling
+def powers(g, p, count):
+    result = np.ones(count, dtype=np.uint64)
+    k = 1
+    g_k = g % p
+    while k < count:
+        n = min(k, count - k)
+        result[k:k + n] = modexp.mulmod_many(result[:n], np.uint64(g_k), p)
+        g_k = (g_k * g_k) % p
+        k *= 2
+    return result
+
+
+# Sorted baby-step table of g^(start + r) mod p for 0 ≤ r < size with the exponents r in the order of the values
+def baby_step_table(g, p, start, size):
+    # Warm start from the persistent cache
+    if size >= cache.MIN_TABLE_SIZE:
+        table = cache.load_array('baby_steps', (p, g, start, size))
+        if table is not None:
+            return table[0], table[1]
+
+    values = modexp.mulmod_many(powers(g, p, size), np.uint64(pow(g, start, p)), p)
+    index = np.argsort(values, kind='stable')
+    if size >= cache.MIN_TABLE_SIZE:
+        cache.store_array('baby_steps', (p, g, start, size), np.stack((values[index], index.astype(np.uint64))))
+    return values[index], index
+
+
+# Baby-step giant-step for g^x = h mod p < 2^56 with sorted uint64 baby-step tables within a fixed memory budget
+def sorted_bsgs(g, h, p, order=None, memory=MEMORY_BUDGET, chunk_size=modexp.CHUNK_SIZE):
+    order = p - 1 if order is None else order
+    m = isqrt(order - 1) + 1 if order > 1 else 1
+
+    # The baby steps g^{0...(m-1)} are split into passes of at most t entries if they exceed the memory budget
+    t = max(1, min(m, memory // ENTRY_SIZE))
+    passes = -(-m // t)
+
+    # Giant steps are looked up in blocks z * y^{0...(c-1)} with y = g^(-m) mod p
+    giant = powers(pow(g, -m, p), p, min(chunk_size, m))
+    y_c = pow(g, -m * len(giant), p)
+
+    x = -1
+    limit = m
+    for i in range(passes):
+        keys, index = baby_step_table(g, p, i * t, min(t, m - i * t))
+        z = h % p
+        for q in range(0, limit, len(giant)):
+            block = modexp.mulmod_many(giant[:min(len(giant), limit - q)], np.uint64(z), p)
+            position = np.minimum(np.searchsorted(keys, block), len(keys) - 1)
+            match = np.flatnonzero(keys[position] == block)
+            if len(match):
+                # Later passes only have to search the giant steps before the smallest match so far
+                k = int(match[0])
+                x = (q + k) * m + i * t + int(index[position[k]])
+                limit = q + k
+                break
+            z = (z * y_c) % p
+    return x
+
+
+# Giant steps q = start, ..., stop - 1 with stride t against the memory-mapped baby-step table of a parallel search
+def giant_step_range(directory, g, h, p, start, stop, chunk_size=modexp.CHUNK_SIZE):
+    keys = np.load(os.path.join(directory, 'keys.npy'), mmap_mode='r')
+    index = np.load(os.path.join(directory, 'index.npy'), mmap_mode='r')
+    limit = np.load(os.path.join(directory, 'limit.npy'), mmap_mode='r')
+    t = len(keys)
+
+    # Every worker advances its own running product z = h * g^(-t * q) mod p
+    y = pow(g, -t, p)
+    giant = powers(y, p, min(chunk_size, stop - start))
+    y_c = pow(y, len(giant), p)
+    z = (h * pow(y, start, p)) % p
+    for q in range(start, stop, len(giant)):
+        # Another worker already found a match in an earlier range
+        if limit[0] <= start:
+            return -1
+        block = modexp.mulmod_many(giant[:min(len(giant), stop - q)], np.uint64(z), p)
+        position = np.minimum(np.searchsorted(keys, block), t - 1)
+        match = np.flatnonzero(keys[position] == block)
+        if len(match):
+            k = int(match[0])
+            return (q + k) * t + int(index[position[k]])
+        z = (z * y_c) % p
+    return -1
+
+
+# Baby-step giant-step for g^x = h mod p < 2^56 with the giant steps split across a process pool
+def parallel_bsgs(g, h, p, order=None, processes=None, memory=MEMORY_BUDGET):
+    order = p - 1 if order is None else order
+    processes = os.cpu_count() if processes is None else processes
+
+    # A single baby-step table of t entries within the memory budget and giant steps with stride t
+    t = max(1, min(isqrt(order - 1) + 1 if order > 1 else 1, memory // ENTRY_SIZE))
+    steps = -(-order // t)
+    keys, index = baby_step_table(g, p, 0, t)
+
+    # The table is shared read-only with the workers as memory-mapped files
+    with tempfile.TemporaryDirectory() as directory:
+        np.save(os.path.join(directory, 'keys.npy'), keys)
+        np.save(os.path.join(directory, 'index.npy'), index)
+        np.save(os.path.join(directory, 'limit.npy'), np.array([steps], dtype=np.int64))
+        limit = np.load(os.path.join(directory, 'limit.npy'), mmap_mode='r+')
+
+        size = -(-steps // (processes * RANGES_PER_PROCESS))
+        ranges = [(start, min(start + size, steps)) for start in range(0, steps, size)]
+        matches = {}
+        with ProcessPoolExecutor(processes) as executor:
+            futures = {executor.submit(giant_step_range, directory, g, h % p, p, start, stop): i
+                       for i, (start, stop) in enumerate(ranges)}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                x = future.result()
+                if x == -1:
+                    continue
+
+                # Workers and pending ranges after the first match are cancelled, earlier ranges may still match
+                i = futures[future]
+                matches[i] = x
+                limit[0] = min(int(limit[0]), ranges[i][1])
+                limit.flush()
+                for f, j in futures.items():
+                    if j > i:
+                        f.cancel()
+        del limit
+    return matches[min(matches)] if matches else -1
+
+
+# Baby-step giant-step for g^x = h mod p with 0 ≤ x < order (-1 if no solution exists)
+def bsgs(g, h, p, order=None, memory=MEMORY_BUDGET, processes=None):
+    if p >= modexp.VECTORIZED_LIMIT:
+        return hashed_bsgs(g, h, p, order)
+    if processes is not None and processes > 1:
+        return parallel_bsgs(g, h, p, order, processes, memory)
+    return sorted_bsgs(g, h, p, order, memory)
+
+
+# Pollard's rho for logarithms with Floyd's cycle detection for g^x = h mod p, where g has the prime order q
+def pollard_rho(g, h, p, q, restarts=RHO_RESTARTS):
+    h %= p
+    if h == 1:
+        return 0
+
+    # One step of the walk through x = g^a * h^b depending on the partition x mod 3
+    def step(x, a, b):
+        s = x % 3
+        if s == 0:
+            return (x * x) % p, (2 * a) % q, (2 * b) % q
+        if s == 1:
+            return (x * g) % p, (a + 1) % q, b
+        return (x * h) % p, a, (b + 1) % q
+
+    for _ in range(restarts + 1):
+        # Random starting point of both the tortoise and the hare
+        a = random.randrange(q)
+        b = random.randrange(q)
+        x = (pow(g, a, p) * pow(h, b, p)) % p
+        x_2, a_2, b_2 = x, a, b
+        while True:
+            x, a, b = step(x, a, b)
+            x_2, a_2, b_2 = step(*step(x_2, a_2, b_2))
+            if x == x_2:
+                break
+
+        # g^a * h^b = g^a_2 * h^b_2 yields (b_2 - b) * x ≡ a - a_2 mod q
+        r = (b_2 - b) % q
+        if r == 0:
+            continue
+        x = ((a - a_2) * pow(r, -1, q)) % q
+        if pow(g, x, p) == h:
+            return x
+    return -1
+
+
+# Discrete logarithm in a subgroup of prime order q with the solver selected by the size of q
+def prime_order_log(g, h, p, q):
+    if g % p == 1:
+        return 0 if h % p == 1 else -1
+    if q < BSGS_LIMIT:
+        return bsgs(g, h, p, q)
+    return pollard_rho(g, h, p, q)
+
+
+# Multiplicative order of g mod p from the factorization of a multiple n of the order as (prime, exponent) tuples
+def element_order(g, p, factors):
+    order = 1
+    for q, e in factors:
+        order *= q ** e
+    for q, e in factors:
+        for _ in range(e):
+            if pow(g, order // q, p) != 1:
+                break
+            order //= q
+    return order
+
+
+# Pohlig-Hellman decomposition of g^x = h mod p for the order of g given by its factorization
+def pohlig_hellman(g, h, p, factors, trace=None):
+    order = 1
+    for q, e in factors:
+        order *= q ** e
+
+    x, m = 0, 1
+    for q, e in factors:
+        # Projection into the subgroup of order q^e and its generator gamma of order q
+        q_e = q ** e
+        g_q = pow(g, order // q_e, p)
+        h_q = pow(h, order // q_e, p)
+        gamma = pow(g_q, q_e // q, p)
+
+        # Digit-wise calculation of x_q = d_0 + d_1 * q + ... + d_(e-1) * q^(e-1)
+        x_q = 0
+        for k in range(e):
+            h_k = pow((pow(g_q, -x_q, p) * h_q) % p, q ** (e - 1 - k), p)
+            d = prime_order_log(gamma, h_k, p, q)
+            if d == -1:
+                return -1
+            x_q += d * q ** k
+
+        # The intermediate results are only recorded on request
+        if trace is not None:
+            trace.append((q, e, g_q, h_q, x_q))
+
+        # Chinese remainder theorem for x ≡ x_q mod q^e
+        x += m * (((x_q - x) * pow(m, -1, q_e)) % q_e)
+        m *= q_e
+    return x % m
+
+
+# Discrete logarithm of h to the base g mod p with the solver selected by the factorization of the order of g
+def discrete_log(g, h, p, factors=None, trace=None):
+    g %= p
+    h %= p
+    if p < 3 or g == 0 or h == 0:
+        return -1
+
+    # Factorization of p - 1 and reduction to the order of g (both cached per group)
+    if factors is None:
+        factors = cache.load_value('factorization', p - 1)
+        if factors is None:
+            factors = factorization.factorize(p - 1)
+            cache.store_value('factorization', p - 1, factors)
+    order = cache.load_value('order', (p, g))
+    if order is None:
+        order = element_order(g, p, factors)
+        cache.store_value('order', (p, g), order)
+    factors = [(q, sum(1 for k in range(1, e + 1) if order % q ** k == 0)) for q, e in factors]
+    factors = [(q, e) for q, e in factors if e]
+
+    # Prime orders are solved directly, composite orders by the Pohlig-Hellman decomposition
+    if primality.is_prime(order):
+        x = prime_order_log(g, h, p, order)
+        if trace is not None and x != -1:
+            trace.append((order, 1, g, h, x))
+    else:
+        x = pohlig_hellman(g, h, p, factors, trace)
+    if x == -1 or pow(g, x, p) != h:
+        return -1
+    return x
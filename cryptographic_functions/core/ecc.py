@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import cache
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import primality
+from functools import lru_cache
+import numpy as np
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Point at infinity (identity element of the group of points) in affine coordinates
+INFINITY = None
+
+# Point at infinity in Jacobian coordinates (X, Y, Z) with Z = 0
+JACOBIAN_INFINITY = (1, 1, 0)
+
+# Window width of the non-adjacent form (wNAF) of the scalars
+WNAF_WIDTH = 5
+
+# Number of teeth of the fixed-base comb tables (2^w - 1 precomputed points per generator)
+COMB_WIDTH = 5
+
+# Maximum number of points of a multi-scalar multiplication with Straus' algorithm (Pippenger's algorithm beyond)
+STRAUS_LIMIT = 128
+
+
+# Extended elliptic curve point verification
+def on_curve(curve, p):
+    if p is INFINITY:
+        return True
+    a, b, n = curve
+    x_p, y_p = p
+    return (y_p ** 2) % n == ((x_p ** 3) + (a * x_p) + b) % n
+
+
+# Additive inverse -P = (x_p|-y_p) of an affine point
+def negation(curve, p):
+    if p is INFINITY:
+        return INFINITY
+    return p[0], -p[1] % curve[2]
+
+
+# Conversion of an affine point (x|y) into Jacobian coordinates (x, y, 1)
+def to_jacobian(p):
+    if p is INFINITY:
+        return JACOBIAN_INFINITY
+    return p[0], p[1], 1
+
+
+# Conversion of a Jacobian point (X, Y, Z) into the affine point (X / Z^2|Y / Z^3) with a single inversion
+def to_affine(curve, p):
+    n = curve[2]
+    x, y, z = p
+    if z % n == 0:
+        return INFINITY
+    z_i = modulo.mim(n, z % n)
+    if z_i == -1:
+        return -1
+    z_i_2 = (z_i * z_i) % n
+    return (x * z_i_2) % n, (y * z_i_2 * z_i) % n
+
+
+# Conversion of many Jacobian points into affine points with a single inversion for all of them (Montgomery's trick)
+def to_affine_many(curve, points):
+    n = curve[2]
+    finite = [i for i, p in enumerate(points) if p[2] % n != 0]
+    result = [INFINITY] * len(points)
+    for i, z_i in zip(finite, modulo.inverse_many(n, [points[i][2] for i in finite])):
+        if z_i == -1:
+            result[i] = -1
+            continue
+        x, y, _ = points[i]
+        z_i_2 = (z_i * z_i) % n
+        result[i] = (x * z_i_2) % n, (y * z_i_2 * z_i) % n
+    return result
+
+
+# Additive inverse -P = (X, -Y, Z) of a Jacobian point
+def jacobian_negation(curve, p):
+    return p[0], -p[1] % curve[2], p[2]
+
+
+# Point doubling 2P in Jacobian coordinates without inversion (dbl-2007-bl, for any curve parameter a)
+def jacobian_double(curve, p):
+    a, _, n = curve
+    x, y, z = p
+
+    # The identity and the points of order 2 (y = 0) are doubled to the identity
+    if z % n == 0 or y % n == 0:
+        return JACOBIAN_INFINITY
+
+    xx = (x * x) % n
+    yy = (y * y) % n
+    yyyy = (yy * yy) % n
+    zz = (z * z) % n
+    s = 2 * ((x + yy) ** 2 - xx - yyyy) % n
+    m = (3 * xx + a * zz * zz) % n
+    x_r = (m * m - 2 * s) % n
+    y_r = (m * (s - x_r) - 8 * yyyy) % n
+    z_r = ((y + z) ** 2 - yy - zz) % n
+    return x_r, y_r, z_r
+
+
+# Point addition P + Q in Jacobian coordinates without inversion (add-2007-bl, mixed addition for Z_Q = 1)
+def jacobian_addition(curve, p, q):
+    n = curve[2]
+    x_p, y_p, z_p = p
+    x_q, y_q, z_q = q
+
+    # The identity is the neutral element of the addition
+    if z_p % n == 0:
+        return q
+    if z_q % n == 0:
+        return p
+
+    z_p_2 = (z_p * z_p) % n
+    u_q = (x_q * z_p_2) % n
+    s_q = (y_q * z_p * z_p_2) % n
+
+    # For an affine point Q the products with powers of Z_Q are omitted
+    if z_q == 1:
+        u_p = x_p % n
+        s_p = y_p % n
+    else:
+        z_q_2 = (z_q * z_q) % n
+        u_p = (x_p * z_q_2) % n
+        s_p = (y_p * z_q * z_q_2) % n
+    h = (u_q - u_p) % n
+    r = 2 * (s_q - s_p) % n
+
+    # Equal x coordinates either belong to P = Q (doubling) or to P = -Q (identity)
+    if h == 0:
+        return jacobian_double(curve, p) if r == 0 else JACOBIAN_INFINITY
+
+    i = (4 * h * h) % n
+    j = (h * i) % n
+    v = (u_p * i) % n
+    x_r = (r * r - j - 2 * v) % n
+    y_r = (r * (v - x_r) - 2 * s_p * j) % n
+    if z_q == 1:
+        z_r = (2 * z_p * h) % n
+    else:
+        z_r = (((z_p + z_q) ** 2 - z_p_2 - z_q_2) * h) % n
+    return x_r, y_r, z_r
+
+
+# Elliptic curve point addition (including doubling and the point at infinity)
+def addition(curve, p, q):
+    # Choose points p and q that lie on the elliptic curve
+    if not on_curve(curve, p) or not on_curve(curve, q):
+        return -1
+
+    # Jacobian addition with a single inversion for the normalization of the result
+    r = to_affine(curve, jacobian_addition(curve, to_jacobian(p), to_jacobian(q)))
+
+    # Choose a point r that lies on the elliptic curve
+    if r == -1 or not on_curve(curve, r):
+        return -1
+    return r
+
+
+# Elliptic curve point doubling
+def double(curve, p):
+    return addition(curve, p, p)
+
+
+# Conversion of many Jacobian points into Jacobian points with Z = 1, which allow the cheaper mixed addition
+def normalize_many(curve, points):
+    affine = to_affine_many(curve, points)
+    if any(p == -1 for p in affine):
+        return -1
+    return [to_jacobian(p) for p in affine]
+
+
+# Width-w non-adjacent form of a non-negative scalar k (least significant digit first, odd digits |d| < 2^(w - 1))
+def wnaf(k, w=WNAF_WIDTH):
+    digits = []
+    while k > 0:
+        d = 0
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+# Precomputation of the odd multiples P, 3P, ..., (2^(w - 1) - 1)P with Z = 1
+def odd_multiples(curve, p, w=WNAF_WIDTH):
+    p_2 = jacobian_double(curve, p)
+    multiples = [p]
+    for _ in range((1 << (w - 2)) - 1):
+        multiples.append(jacobian_addition(curve, multiples[-1], p_2))
+    return normalize_many(curve, multiples)
+
+
+# Scalar multiplication k * P of a Jacobian point with the width-w non-adjacent form of k
+def multiplication_wnaf(curve, k, p, w=WNAF_WIDTH, trace=None):
+    multiples = odd_multiples(curve, p, w)
+    if multiples == -1:
+        return -1
+
+    r = JACOBIAN_INFINITY
+    for d in reversed(wnaf(k, w)):
+        r = jacobian_double(curve, r)
+        if d > 0:
+            r = jacobian_addition(curve, r, multiples[d >> 1])
+        elif d < 0:
+            r = jacobian_addition(curve, r, jacobian_negation(curve, multiples[-d >> 1]))
+        if trace is not None:
+            trace.append((d, r))
+    return r
+
+
+# Scalar multiplication k * P of a Jacobian point with the Montgomery ladder over a fixed number of bits
+def montgomery_ladder(curve, k, p, bits=None, trace=None):
+    # Every bit costs one addition and one doubling regardless of its value (the Python integer arithmetic itself
+    # is not constant-time)
+    if bits is None:
+        bits = max(k.bit_length(), curve[2].bit_length() + 1)
+    r_0, r_1 = JACOBIAN_INFINITY, p
+    for i in range(bits - 1, -1, -1):
+        if (k >> i) & 1:
+            r_0, r_1 = jacobian_addition(curve, r_0, r_1), jacobian_double(curve, r_1)
+        else:
+            r_0, r_1 = jacobian_double(curve, r_0), jacobian_addition(curve, r_0, r_1)
+        if trace is not None:
+            trace.append(((k >> i) & 1, r_0))
+    return r_0
+
+
+# Precomputation of the comb table sum(2^(i * d) * P for all set bits i of j) for j = 1, ..., 2^w - 1 with
+# d = ceil(bits / w) for a fixed generator P (e.g. the base point of a curve)
+@lru_cache(maxsize=32)
+def comb_table(curve, p, bits, w=COMB_WIDTH):
+    # Warm start from the persistent cache, which stores the coordinates as big-endian bytes (the point at infinity
+    # as (n|n))
+    n = curve[2]
+    width = (n.bit_length() + 8) // 8
+    stored = cache.load_array('comb', (curve, p, bits, w))
+    if stored is not None:
+        table = [tuple(int.from_bytes(c.tobytes(), 'big') for c in entry) for entry in stored]
+        return tuple(INFINITY if q == (n, n) else q for q in table)
+
+    # Teeth B_i = 2^(i * d) * P and the table entries T_j = T_(j without its lowest bit) + B_(lowest bit of j)
+    d = -(-bits // w)
+    teeth = [to_jacobian(p)]
+    for _ in range(w - 1):
+        q = teeth[-1]
+        for _ in range(d):
+            q = jacobian_double(curve, q)
+        teeth.append(q)
+    table = [JACOBIAN_INFINITY]
+    for j in range(1, 1 << w):
+        low = (j & -j).bit_length() - 1
+        table.append(jacobian_addition(curve, table[j & (j - 1)], teeth[low]))
+    table = to_affine_many(curve, table[1:])
+    if any(q == -1 for q in table):
+        return -1
+    stored = b''.join(c.to_bytes(width, 'big') for q in table for c in ((n, n) if q is INFINITY else q))
+    cache.store_array('comb', (curve, p, bits, w), np.frombuffer(stored, dtype=np.uint8).reshape(len(table), 2, width))
+    return tuple(table)
+
+
+# Scalar multiplication k * P for a fixed generator P with a cached comb table (d doublings and d additions)
+def multiplication_comb(curve, k, p, w=COMB_WIDTH, trace=None):
+    bits = curve[2].bit_length() + 1
+    if k.bit_length() > bits:
+        return multiplication_wnaf(curve, k, to_jacobian(p), trace=trace)
+    table = comb_table(curve, p, bits, w)
+    if table == -1:
+        return -1
+
+    d = -(-bits // w)
+    r = JACOBIAN_INFINITY
+    for column in range(d - 1, -1, -1):
+        r = jacobian_double(curve, r)
+        j = 0
+        for i in range(w):
+            j |= ((k >> (i * d + column)) & 1) << i
+        if j:
+            r = jacobian_addition(curve, r, to_jacobian(table[j - 1]))
+        if trace is not None:
+            trace.append((j, r))
+    return r
+
+
+# Elliptic curve scalar multiplication k * P (mode 'wnaf', 'ladder' for the constant sequence of operations or
+# 'comb' for fixed generators)
+def scalar_mul(curve, k, p, mode='wnaf', trace=None):
+    # Choose a point p that lies on the elliptic curve
+    if not on_curve(curve, p) or mode not in ('wnaf', 'ladder', 'comb'):
+        return -1
+
+    # Negative scalars are applied to the negated point
+    if k < 0:
+        k, p = -k, negation(curve, p)
+    if k == 0 or p is INFINITY:
+        return INFINITY
+
+    if mode == 'ladder':
+        r = montgomery_ladder(curve, k, to_jacobian(p), trace=trace)
+    elif mode == 'comb':
+        r = multiplication_comb(curve, k, p, trace=trace)
+    else:
+        r = multiplication_wnaf(curve, k, to_jacobian(p), trace=trace)
+    if r == -1:
+        return -1
+    return to_affine(curve, r)
+
+
+# Multi-scalar multiplication with Straus' algorithm (interleaved wNAF with shared doublings)
+def straus(curve, scalars, points, w=WNAF_WIDTH):
+    # Odd multiples of all points with a single inversion for their normalization
+    m = 1 << (w - 2)
+    multiples = []
+    for p in points:
+        p_2 = jacobian_double(curve, p)
+        multiples.append(p)
+        for _ in range(m - 1):
+            multiples.append(jacobian_addition(curve, multiples[-1], p_2))
+    multiples = normalize_many(curve, multiples)
+    if multiples == -1:
+        return -1
+
+    digits = [wnaf(k, w) for k in scalars]
+    r = JACOBIAN_INFINITY
+    for i in range(max(map(len, digits), default=0) - 1, -1, -1):
+        r = jacobian_double(curve, r)
+        for j, k_digits in enumerate(digits):
+            d = k_digits[i] if i < len(k_digits) else 0
+            if d > 0:
+                r = jacobian_addition(curve, r, multiples[j * m + (d >> 1)])
+            elif d < 0:
+                r = jacobian_addition(curve, r, jacobian_negation(curve, multiples[j * m + (-d >> 1)]))
+    return r
+
+
+# Multi-scalar multiplication with Pippenger's bucket algorithm for many points
+def pippenger(curve, scalars, points, c=None):
+    if c is None:
+        c = max(2, len(points).bit_length() - 3)
+    points = normalize_many(curve, points)
+    if points == -1:
+        return -1
+
+    r = JACOBIAN_INFINITY
+    mask = (1 << c) - 1
+    for shift in range(-(-max(scalars, default=0).bit_length() // c) * c - c, -1, -c):
+        for _ in range(c):
+            r = jacobian_double(curve, r)
+
+        # Every point is added into the bucket of its c-bit digit, then the buckets are weighted by running sums
+        buckets = [JACOBIAN_INFINITY] * (1 << c)
+        for k, p in zip(scalars, points):
+            d = (k >> shift) & mask
+            if d:
+                buckets[d] = jacobian_addition(curve, buckets[d], p)
+        running = total = JACOBIAN_INFINITY
+        for bucket in reversed(buckets[1:]):
+            running = jacobian_addition(curve, running, bucket)
+            total = jacobian_addition(curve, total, running)
+        r = jacobian_addition(curve, r, total)
+    return r
+
+
+# Elliptic curve multi-scalar multiplication sum(k_i * P_i) (Straus for few points, Pippenger for many points)
+def multi_scalar_mul(curve, scalars, points):
+    scalars, points = list(scalars), list(points)
+    if len(scalars) != len(points) or not all(on_curve(curve, p) for p in points):
+        return -1
+
+    # Negative scalars are applied to the negated points, the point at infinity and zero scalars are omitted
+    terms = [(-k, negation(curve, p)) if k < 0 else (k, p) for k, p in zip(scalars, points)]
+    terms = [(k, to_jacobian(p)) for k, p in terms if k != 0 and p is not INFINITY]
+    if not terms:
+        return INFINITY
+
+    scalars, points = zip(*terms)
+    r = straus(curve, scalars, points) if len(terms) <= STRAUS_LIMIT else pippenger(curve, scalars, points)
+    if r == -1:
+        return -1
+    return to_affine(curve, r)
+
+
+# Number of bytes of a coordinate of the prime field
+def field_bytes(curve):
+    return (curve[2].bit_length() + 7) // 8
+
+
+# Compressed point encoding 02 || x or 03 || x with the parity of y in the prefix (00 for the point at infinity)
+def compress(curve, p):
+    if not on_curve(curve, p):
+        return -1
+    if p is INFINITY:
+        return b'\x00'
+    return bytes([2 | (p[1] & 1)]) + p[0].to_bytes(field_bytes(curve), 'big')
+
+
+# Affine point of a compressed point encoding (-1 for invalid encodings)
+def decompress(curve, data):
+    if data == b'\x00':
+        return INFINITY
+    a, b, n = curve
+    if len(data) != 1 + field_bytes(curve) or data[0] not in (2, 3):
+        return -1
+    x = int.from_bytes(data[1:], 'big')
+    y = modulo.sqrt_mod(n, x ** 3 + a * x + b) if x < n else -1
+    if y == -1:
+        return -1
+
+    # The root with the parity of the prefix is selected (y = 0 and y = 1 mod 2 have no negated counterpart)
+    y = (n - y) % n if (y & 1) != (data[0] & 1) else y
+    if (y & 1) != (data[0] & 1):
+        return -1
+    return x, y
+
+
+# Compressed encodings of many affine points as fixed-width records of 1 + field_bytes bytes (vectorized for arrays of
+# shape (k, 2) with coordinates below 2^56)
+def compress_many(curve, points):
+    n = curve[2]
+    if isinstance(points, np.ndarray) and points.dtype != object and n < modexp.VECTORIZED_LIMIT:
+        if points.ndim != 2 or points.shape[1] != 2:
+            return -1
+
+        # Coordinates below n and y^2 = x^3 + a * x + b mod n for all points at once (negative values wrap above n)
+        a, b = curve[0] % n, curve[1] % n
+        points = points.astype(np.uint64)
+        x, y = points[:, 0], points[:, 1]
+        if np.any(x >= np.uint64(n)) or np.any(y >= np.uint64(n)):
+            return -1
+        x_2 = modexp.mulmod_many(x, x, n)
+        v = (modexp.mulmod_many(x_2, x, n) + modexp.mulmod_many(np.full_like(x, a), x, n) + np.uint64(b)) % np.uint64(n)
+        if np.any(modexp.mulmod_many(y, y, n) != v):
+            return -1
+
+        length = field_bytes(curve)
+        records = np.empty((len(points), 1 + length), dtype=np.uint8)
+        records[:, 0] = 2 | (points[:, 1] & np.uint64(1))
+        for i in range(length):
+            records[:, 1 + i] = (points[:, 0] >> np.uint64(8 * (length - 1 - i))) & np.uint64(0xFF)
+        return records.tobytes()
+
+    records = []
+    for p in points:
+        p = tuple(int(c) for c in p) if p is not INFINITY else p
+        if p is INFINITY or not on_curve(curve, p):
+            return -1
+        records.append(compress(curve, p))
+    return b''.join(records)
+
+
+# Affine points of fixed-width compressed records as array of shape (k, 2) with a single vectorized square root
+# computation for all x coordinates (-1 if any record is invalid)
+def decompress_many(curve, data):
+    a, b, n = curve
+    if not primality.is_prime(n):
+        return -1
+    length = field_bytes(curve)
+    if len(data) % (1 + length) != 0:
+        return -1
+    records = np.frombuffer(data, dtype=np.uint8).reshape(-1, 1 + length)
+    prefix = records[:, 0]
+    if not np.all((prefix == 2) | (prefix == 3)):
+        return -1
+
+    # Big-endian x coordinates and the right-hand side x^3 + a * x + b mod n of all records at once
+    if n < modexp.VECTORIZED_LIMIT:
+        x = np.zeros(len(records), dtype=np.uint64)
+        for i in range(length):
+            x = (x << np.uint64(8)) | records[:, 1 + i].astype(np.uint64)
+        if np.any(x >= np.uint64(n)):
+            return -1
+        x_2 = modexp.mulmod_many(x, x, n)
+        v = (modexp.mulmod_many(x_2, x, n) + modexp.mulmod_many(np.full_like(x, a % n), x, n)) % np.uint64(n)
+        v = (v + np.uint64(b % n)) % np.uint64(n)
+        parity = (prefix & 1).astype(np.uint64)
+    else:
+        x = np.array([int.from_bytes(r[1:].tobytes(), 'big') for r in records], dtype=object)
+        if np.any(x >= n):
+            return -1
+        v = ((x * x % n) * x + a * x + b) % n
+        parity = (prefix & 1).astype(object)
+
+    # The root with the parity of the prefix is selected (y = 0 only exists with the even prefix)
+    y, residues = modulo.sqrt_many(n, v)
+    y = np.where((y & 1) != parity, (n - y) % n, y)
+    if not np.all(residues) or np.any((y & 1) != parity):
+        return -1
+    return np.column_stack([x, y])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import ecc
+from cryptographic_functions.core import primality
+import secrets
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Check of the domain parameters, a point G of prime order n on a curve over a prime field
+def valid_domain(curve, g, n):
+    return (curve[2] > 3 and primality.is_prime(curve[2]) and n > 3 and primality.is_prime(n)
+            and g is not ecc.INFINITY and ecc.on_curve(curve, g) and ecc.scalar_mul(curve, n, g) is ecc.INFINITY)
+
+
+# Elliptic curve Diffie–Hellman key exchange (returns the x coordinate of the shared point K = a * b * G)
+def key_exchange(curve, g, n, a=None, b=None):
+    if not valid_domain(curve, g, n):
+        return -1
+
+    # Choose integers a and b such that 1 ≤ {a, b} < n and a != b
+    if a is None:
+        a = secrets.randbelow(n - 1) + 1
+    if b is None:
+        b = a
+        while b == a:
+            b = secrets.randbelow(n - 1) + 1
+
+    if a == b or a not in range(1, n) or b not in range(1, n):
+        return -1
+
+    # Secret generation with the comb method for the fixed generator and wNAF for the received points
+    a_secret = ecc.scalar_mul(curve, a, g, 'comb')
+    b_secret = ecc.scalar_mul(curve, b, g, 'comb')
+    a_shared_key = ecc.scalar_mul(curve, a, b_secret)
+    b_shared_key = ecc.scalar_mul(curve, b, a_secret)
+
+    if a_shared_key != b_shared_key or a_shared_key is ecc.INFINITY:
+        return -1
+    return a_shared_key[0]
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from cryptographic_functions.core import ecc
+from cryptographic_functions.core import factorization
+from cryptographic_functions.core import point_counting
+from math import isqrt, pi, sqrt
+import multiprocessing
+import os
+import secrets
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Prime orders below 2^36 are solved with the baby-step giant-step method, larger ones with Pollard's rho
+BSGS_LIMIT = 1 << 36
+
+# Number of steps which are normalized with a single inversion
+CHUNK_SIZE = 1024
+
+# Number of partitions of the additive walk of Pollard's rho
+RHO_PARTITIONS = 32
+
+# Number of simultaneous walks per process, whose points are normalized with a single inversion per step
+RHO_WALKS = 64
+
+# Minimum number of steps of every walk per batch, after which the distinguished points are collected
+RHO_STEPS = 16
+
+# Average number of distinguished points per walk over the expected runtime
+RHO_DISTINGUISHED = 16
+
+# Minimum prime order from which Pollard's rho is spread across a process pool
+RHO_PARALLEL_LIMIT = 1 << 40
+
+
+# Order of a point as divisor of the group order #E of the curve
+def point_order(curve, p):
+    if p is ecc.INFINITY:
+        return 1
+    order = point_counting.curve_order(curve)
+    if order == -1:
+        return -1
+    for q, e in factorization.factorize(order):
+        for _ in range(e):
+            if ecc.scalar_mul(curve, order // q, p) is not ecc.INFINITY:
+                break
+            order //= q
+    return order
+
+
+# Baby-step giant-step with the negation map for k * P = Q with 0 ≤ k < n, where n is a multiple of ord(P) (the baby
+# steps ±j * P share their x coordinate, which halves the table and the number of giant steps)
+def bsgs(curve, p, q, n, trace=None):
+    if q is ecc.INFINITY:
+        return 0
+
+    # Baby steps j * P for j = 1, ..., m with a single inversion for their normalization
+    m = isqrt(n // 2) + 1
+    baby = [ecc.to_jacobian(p)]
+    for _ in range(m - 1):
+        baby.append(ecc.jacobian_addition(curve, baby[-1], baby[0]))
+    table = {}
+    for j, point in enumerate(ecc.to_affine_many(curve, baby), start=1):
+        # Points of order j ≤ m are solved by the table of all their multiples
+        if point is ecc.INFINITY:
+            if trace is not None:
+                trace.append(('BSGS', j, m + n // (4 * m)))
+            if q[0] not in table:
+                return -1
+            i, y = table[q[0]]
+            return (i if y == q[1] else -i) % j
+        table.setdefault(point[0], (j, point[1]))
+
+    # Giant steps Q - i * 2m * P, normalized in chunks (k = i * 2m ± j)
+    giant = ecc.jacobian_negation(curve, ecc.to_jacobian(ecc.scalar_mul(curve, 2 * m, p)))
+    r = ecc.to_jacobian(q)
+    steps = n // (2 * m) + 1
+    for i_0 in range(0, steps, CHUNK_SIZE):
+        chunk = []
+        for _ in range(min(CHUNK_SIZE, steps - i_0)):
+            chunk.append(r)
+            r = ecc.jacobian_addition(curve, r, giant)
+        for i, point in enumerate(ecc.to_affine_many(curve, chunk), start=i_0):
+            if point is ecc.INFINITY:
+                k = i * 2 * m
+            elif point[0] in table:
+                j, y = table[point[0]]
+                k = i * 2 * m + (j if y == point[1] else -j)
+            else:
+                continue
+            if trace is not None:
+                trace.append(('BSGS', m + i + 1, m + n // (4 * m)))
+            return k % n
+    if trace is not None:
+        trace.append(('BSGS', m + steps, m + n // (4 * m)))
+    return -1
+
+
+# Random partition table of the additive walk as points R_j = a_j * P + b_j * Q with their coefficients
+def rho_table(curve, p, q, n, partitions=RHO_PARTITIONS):
+    table = []
+    for _ in range(partitions):
+        a, b = secrets.randbelow(n), secrets.randbelow(n)
+        table.append((ecc.multi_scalar_mul(curve, [a, b], [p, q]), a, b))
+    return table
+
+
+# Simultaneous additive walks W = a * P + b * Q -> W + R_(x mod r) which report their distinguished points (x with
+# d trailing zero bits) as (W, a, b) and restart at a random point afterwards, returned together with the number of
+# performed iterations (the walks are kept in state between batches and stop early once the stop event is set)
+def rho_walks(curve, p, q, n, table, d, steps, state=None, walks=RHO_WALKS, stop=None):
+    mask = (1 << d) - 1
+    r = len(table)
+
+    def start():
+        a, b = secrets.randbelow(n), secrets.randbelow(n)
+        return ecc.to_jacobian(ecc.multi_scalar_mul(curve, [a, b], [p, q])), a, b
+
+    state = {} if state is None else state
+    if not state:
+        walk = [start() for _ in range(walks)]
+        state['points'] = [w for w, _, _ in walk]
+        state['coefficients'] = [(a, b) for _, a, b in walk]
+    points, coefficients = state['points'], state['coefficients']
+    distinguished = []
+    for step in range(steps):
+        if stop is not None and stop.is_set():
+            return distinguished, step * len(points)
+
+        # A single inversion for the normalization of all walks, so that the partition and the distinguished property
+        # are taken from the affine x coordinates
+        for i, w in enumerate(ecc.to_affine_many(curve, points)):
+            a, b = coefficients[i]
+            if w is ecc.INFINITY or w[0] & mask == 0:
+                distinguished.append((w, a, b))
+                points[i], a, b = start()
+                coefficients[i] = a, b
+                continue
+            s, a_s, b_s = table[w[0] % r]
+            points[i] = ecc.jacobian_addition(curve, ecc.to_jacobian(w), ecc.to_jacobian(s))
+            coefficients[i] = (a + a_s) % n, (b + b_s) % n
+    return distinguished, steps * len(points)
+
+
+# Walk parameters and walks of a worker process, which are transferred once by the initializer instead of with every
+# task and continued by the following tasks
+_worker_state = {}
+
+
+# Initializer of the worker processes of the parallel Pollard's rho
+def rho_initializer(curve, p, q, n, table, d, stop):
+    _worker_state['args'] = (curve, p, q, n, table, d)
+    _worker_state['walks'] = {}
+    _worker_state['stop'] = stop
+
+
+# Task of a worker process: the next batch of steps of its walks
+def rho_task(steps):
+    return rho_walks(*_worker_state['args'], steps, _worker_state['walks'], stop=_worker_state['stop'])
+
+
+# Pollard's rho with distinguished points for k * P = Q, where P has the prime order n, optionally across a process
+# pool whose workers report their distinguished points to a central table
+def pollard_rho(curve, p, q, n, processes=None, trace=None):
+    if q is ecc.INFINITY:
+        return 0
+
+    # More processes than CPUs only add overhead, and below RHO_PARALLEL_LIMIT the pool costs more than it saves
+    workers = min(processes or 1, os.cpu_count() or 1) if n >= RHO_PARALLEL_LIMIT else 1
+
+    # Distinguished points are rare enough to be stored centrally and frequent enough to detect a collision early
+    expected = sqrt(pi * n / 2)
+    d = max(0, int(expected / (workers * RHO_WALKS * RHO_DISTINGUISHED)).bit_length() - 1)
+    steps = max(RHO_STEPS, 1 << d)
+    table = rho_table(curve, p, q, n)
+
+    seen = {}
+    iterations = 0
+
+    # Two walks which reach the same distinguished point yield a * P + b * Q = a' * P + b' * Q
+    def collision(distinguished):
+        for w, a, b in distinguished:
+            a_2, b_2 = seen.setdefault(w, (a, b))
+            if (b - b_2) % n == 0:
+                continue
+            k = ((a_2 - a) * pow(b - b_2, -1, n)) % n
+            if ecc.scalar_mul(curve, k, p) == q:
+                return k
+        return -1
+
+    k = -1
+    if workers == 1:
+        state = {}
+        while k == -1:
+            distinguished, count = rho_walks(curve, p, q, n, table, d, steps, state)
+            iterations += count
+            k = collision(distinguished)
+    else:
+        # The stop event ends the running batches after their current step, so that the pool shuts down at once and
+        # the iterations of the abandoned batches are still counted
+        stop = multiprocessing.Event()
+        initargs = (curve, p, q, n, table, d, stop)
+        with ProcessPoolExecutor(workers, initializer=rho_initializer, initargs=initargs) as executor:
+            pending = {executor.submit(rho_task, steps) for _ in range(workers)}
+            while k == -1:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    distinguished, count = future.result()
+                    iterations += count
+                    if k == -1:
+                        k = collision(distinguished)
+                    if k == -1:
+                        pending.add(executor.submit(rho_task, steps))
+            stop.set()
+            for future in pending:
+                if not future.cancel():
+                    iterations += future.result()[1]
+    if trace is not None:
+        trace.append(('Pollard-Rho', iterations, round(expected)))
+    return k
+
+
+# Discrete logarithm in a subgroup of prime order n with the solver selected by the size of n
+def prime_order_log(curve, p, q, n, processes=None, trace=None):
+    if n < BSGS_LIMIT:
+        return bsgs(curve, p, q, n, trace)
+    return pollard_rho(curve, p, q, n, processes, trace)
+
+
+# Elliptic curve discrete logarithm k with k * P = Q by the Pohlig-Hellman decomposition of ord(P), the intermediate
+# results are recorded as (q, e, k_q, method, iterations, expected iterations) for every prime power q^e of ord(P)
+def discrete_log(curve, p, q, processes=None, trace=None):
+    if not ecc.on_curve(curve, p) or not ecc.on_curve(curve, q):
+        return -1
+    order = point_order(curve, p)
+    if order == -1:
+        return -1
+
+    k, m = 0, 1
+    for r, e in factorization.factorize(order):
+        # Projection into the subgroup of order r^e and its generator gamma of order r
+        r_e = r ** e
+        p_r = ecc.scalar_mul(curve, order // r_e, p)
+        q_r = ecc.scalar_mul(curve, order // r_e, q)
+        gamma = ecc.scalar_mul(curve, r_e // r, p_r)
+
+        # Digit-wise calculation of k_r = d_0 + d_1 * r + ... + d_(e-1) * r^(e-1)
+        k_r = 0
+        steps = []
+        for i in range(e):
+            h = ecc.scalar_mul(curve, r ** (e - 1 - i), ecc.addition(curve, q_r, ecc.scalar_mul(curve, -k_r, p_r)))
+            digit = prime_order_log(curve, gamma, h, r, processes, steps)
+            if digit == -1:
+                return -1
+            k_r += digit * r ** i
+
+        # The intermediate results are only recorded on request
+        if trace is not None:
+            methods = sorted({method for method, _, _ in steps})
+            trace.append((r, e, k_r, ', '.join(methods) or '-', sum(s[1] for s in steps), sum(s[2] for s in steps)))
+
+        # Chinese remainder theorem for k ≡ k_r mod r^e
+        k += m * (((k_r - k) * pow(m, -1, r_e)) % r_e)
+        m *= r_e
+    k %= m
+    if ecc.scalar_mul(curve, k, p) != q:
+        return -1
+    return k
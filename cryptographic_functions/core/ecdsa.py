@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import ecc
+from cryptographic_functions.core import ecdh
+from cryptographic_functions.core import modulo
+import secrets
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Bit length of the random weights of the batch verification (a forged signature passes with probability 2^-128)
+BATCH_WEIGHT_BITS = 128
+
+
+# ECDSA keypair generation
+def keypair_generation(curve, g, n, d=None):
+    if not ecdh.valid_domain(curve, g, n):
+        return -1
+
+    # Choose an integer d such that 1 ≤ d < n
+    if d is None:
+        d = secrets.randbelow(n - 1) + 1
+
+    if d not in range(1, n):
+        return -1
+
+    # Secret generation
+    q = ecc.scalar_mul(curve, d, g, 'comb')
+    return (curve, g, n, q), (n, d)
+
+
+# ECDSA signature signing of the message hash m (the recovery flag v holds the parity of y and whether x ≥ n for R)
+def sign(public_key, private_key, m, k=None):
+    curve, g, n, q = public_key
+    n_v, d = private_key
+
+    # The value of n must be identical in both keys
+    if n != n_v:
+        return -1
+
+    e = m % n
+    while True:
+        # Choose an integer k such that 1 ≤ k < n
+        if k is None:
+            k_i = secrets.randbelow(n - 1) + 1
+        elif k in range(1, n):
+            k_i = k
+        else:
+            return -1
+
+        # Signing, a chosen k that leads to r = 0 or s = 0 is rejected
+        x, y = ecc.scalar_mul(curve, k_i, g, 'comb')
+        r = x % n
+        s = (modulo.mim(n, k_i) * (e + r * d)) % n
+        if r != 0 and s != 0:
+            return r, s, (y & 1) | (2 if x >= n else 0)
+        if k is not None:
+            return -1
+
+
+# Verification equation of a signature as the multi-scalar multiplication u_1 * G + u_2 * Q (returns -1 for signatures
+# outside of the valid range)
+def verification_point(public_key, m, signature):
+    curve, g, n, q = public_key
+    r, s = signature[0], signature[1]
+
+    # Choose integers r and s such that 1 ≤ {r, s} < n
+    if r not in range(1, n) or s not in range(1, n):
+        return -1
+
+    w = modulo.mim(n, s)
+    return ecc.multi_scalar_mul(curve, [(m * w) % n, (r * w) % n], [g, q])
+
+
+# ECDSA signature verifying
+def verify(public_key, m, signature):
+    curve, g, n, q = public_key
+    if q is ecc.INFINITY or not ecc.on_curve(curve, q):
+        return False
+
+    x = verification_point(public_key, m, signature)
+    if x == -1 or x is ecc.INFINITY:
+        return False
+    return x[0] % n == signature[0]
+
+
+# Point R = k * G of a signature restored from r and the recovery flag v (returns -1 if no such point exists)
+def recover_r(curve, n, r, v):
+    a, b, p = curve
+    x = r + n if v & 2 else r
+    if x >= p:
+        return -1
+    y = modulo.sqrt_mod(p, x ** 3 + a * x + b)
+    if y == -1:
+        return -1
+    return x, p - y if (y & 1) != (v & 1) else y
+
+
+# Randomized linear combination sum(z_i * (u_1,i * G + u_2,i * Q_i - R_i)) = O of (public key, m, signature) triples,
+# which is evaluated as a single multi-scalar multiplication (rejects signatures without a recovery flag v or with a v
+# that does not match R_i, such as the malleated (r, n - s, v), even though verify accepts them)
+def batch_equation(batch):
+    batch = list(batch)
+    if not batch:
+        return True
+    curve, g, n, _ = batch[0][0]
+
+    # The weights of identical public keys are combined, so that a single signer adds only one point
+    u_g = 0
+    weights = {}
+    points = []
+    scalars = []
+    for public_key, m, signature in batch:
+        curve_i, g_i, n_i, q = public_key
+        if (curve_i, g_i, n_i) != (curve, g, n) or len(signature) < 3:
+            return False
+        r, s, v = signature
+        if r not in range(1, n) or s not in range(1, n) or q is ecc.INFINITY or not ecc.on_curve(curve, q):
+            return False
+        r_point = recover_r(curve, n, r, v)
+        if r_point == -1:
+            return False
+
+        # Random weight z_i of the verification equation of the i-th signature
+        z = secrets.randbits(BATCH_WEIGHT_BITS) | 1
+        w = modulo.mim(n, s)
+        u_g += z * m * w
+        weights[q] = (weights.get(q, 0) + z * r * w) % n
+        points.append(r_point)
+        scalars.append(n - z)
+
+    x = ecc.multi_scalar_mul(curve, [u_g % n] + list(weights.values()) + scalars, [g] + list(weights) + points)
+    return x is ecc.INFINITY
+
+
+# ECDSA batch verification of (public key, m, signature) triples, which falls back to verifying every signature on its
+# own if the combined equation fails, so that it accepts exactly the batches of signatures that verify accepts
+def batch_verify(batch):
+    batch = list(batch)
+    return batch_equation(batch) or all(verify(public_key, m, signature) for public_key, m, signature in batch)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import shared_functions
+from cryptographic_functions.core import discrete_log
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import modulo
+import random
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Choose a random integer r such that 1 ≤ r < p - 1 and such that r and p - 1 are coprime
+def _coprime_randrange(p):
+    r = random.randrange(1, p - 1)
+    while shared_functions.gcd(r, p - 1) != 1:
+        r = random.randrange(1, p - 1)
+    return r
+
+
+# ElGamal keypair generation
+def keypair_generation(p, g, d=None):
+    # Choose an integer p that is a prime number and an integer g such that 1 ≤ g < p
+    if not shared_functions.is_prime(p) or g not in range(1, p):
+        return -1
+
+    # Choose an integer d such that 1 ≤ d < (p - 1)
+    if d is None:
+        d = random.randrange(1, p - 1)
+
+    if d not in range(1, p - 1):
+        return -1
+
+    # Secret generation
+    e = modexp.fixed_base(g, d, p)
+    return (p, g, e), (p, d)
+
+
+# ElGamal encryption
+def encryption(public_key, m, k=None):
+    p, g, e = public_key
+
+    # Choose an integer m such that 1 ≤ m < p
+    if m not in range(1, p):
+        return -1
+
+    # Choose an integer k such that 1 ≤ k < p - 1 and such that k and p - 1 are coprime
+    if k is None:
+        k = _coprime_randrange(p)
+    elif shared_functions.gcd(k, p - 1) != 1 or k not in range(1, p - 1):
+        return -1
+
+    # Encryption
+    a = modexp.fixed_base(g, k, p)
+    b = (modexp.modexp(e, k, p) * m) % p
+    return a, b
+
+
+# ElGamal decryption
+def decryption(private_key, c):
+    p, d = private_key
+    a, b = c
+
+    # Choose integers a and b such that 1 ≤ {a, b} < p
+    if a not in range(1, p) or b not in range(1, p):
+        return -1
+
+    # Decryption
+    a_i = modulo.mim(p, modexp.modexp(a, d, p))
+    if a_i == -1:
+        return -1
+    return (a_i * b) % p
+
+
+# ElGamal signature signing
+def sign(public_key, private_key, m, r=None):
+    p, g, e = public_key
+    p_v, d = private_key
+
+    # The value of p must be identical in both keys and m must satisfy 1 ≤ m < p
+    if p != p_v or m not in range(1, p):
+        return -1
+
+    # Choose an integer r such that 1 ≤ r < p - 1 and such that r and p - 1 are coprime
+    if r is None:
+        r = _coprime_randrange(p)
+    elif shared_functions.gcd(r, p - 1) != 1 or r not in range(1, p - 1):
+        return -1
+
+    # Signing
+    r_i = modulo.mim(p - 1, r)
+    p_nb = modexp.fixed_base(g, r, p)
+    s = ((m - d * p_nb) * r_i) % (p - 1)
+    return m, p_nb, s
+
+
+# ElGamal signature verifying
+def verify(public_key, signed_message):
+    p, g, e = public_key
+    m, p_nb, s = signed_message
+
+    # Calculation of a and b
+    a = modexp.fixed_base(g, m, p)
+    b = (modexp.modexp(e, p_nb, p) * modexp.modexp(p_nb, s, p)) % p
+    return a, b
+
+
+# ElGamal homomorphic multiplicative scheme
+def homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2):
+    p, g, e = public_key
+    p_v, d = private_key
+    a_1, b_1 = c_1
+    a_2, b_2 = c_2
+
+    # The value of p must be identical in both keys
+    if p != p_v:
+        return -1
+
+    # Calculation of m
+    a_i = modulo.mim(p, modexp.modexp(a_1 * a_2, d, p))
+    if a_i == -1:
+        return -1
+    return (a_i * (b_1 * b_2)) % p
+
+
+# ElGamal homomorphic ciphertext extension
+def homomorphic_ciphertext_extension(public_key, private_key, m_1, a_b):
+    p, g, e = public_key
+    p_v, d = private_key
+
+    # The value of p must be identical in both keys
+    if p != p_v:
+        return -1
+
+    # Calculation of m and m_2
+    m = decryption(private_key, a_b)
+    m_1_i = modulo.mim(p, m_1)
+    if m == -1 or m_1_i == -1:
+        return -1
+    return (m * m_1_i) % p
+
+
+# ElGamal homomorphic multiplicative decryption
+def homomorphic_multiplicative_decryption(public_key, private_key, m_1, c_1, c_2):
+    p, g, e = public_key
+
+    # Calculation of m and m_2
+    m = homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2)
+    m_1_i = modulo.mim(p, m_1)
+    if m == -1 or m_1_i == -1:
+        return -1
+    return (m * m_1_i) % p
+
+
+# ElGamal homomorphic multiplicative decryption with identical random value
+def homomorphic_multiplicative_decryption_k(public_key, m_1, c_1, c_2):
+    p, g, e = public_key
+    a_1, b_1 = c_1
+    a_2, b_2 = c_2
+
+    # Calculation of m_2 assuming that the random numbers of both ciphertexts are identical
+    b_1_i = modulo.mim(p, b_1)
+    if b_1_i == -1:
+        return -1
+    return (b_1_i * b_2 * m_1) % p
+
+
+# ElGamal baby-step giant-step
+def bsgs(public_key, memory=discrete_log.MEMORY_BUDGET, processes=None):
+    p, g, e = public_key
+    return discrete_log.bsgs(g, e, p, p - 1, memory, processes)
+
+
+# ElGamal discrete logarithm with Pohlig-Hellman decomposition or Pollard's rho depending on the factorization of p - 1
+def discrete_logarithm(public_key, trace=None):
+    p, g, e = public_key
+    return discrete_log.discrete_log(g, e, p, trace=trace)
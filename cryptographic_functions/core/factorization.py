@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from cryptographic_functions.core import primality
+from math import gcd
+import random
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Number of steps whose differences are multiplied before a gcd is taken
+BATCH_SIZE = 128
+
+# Precomputed prime table for the trial division stage
+TRIAL_PRIMES = primality.sieve(1 << 14)
+
+# Smoothness bound of Pollard's p - 1 method
+P_MINUS_1_BOUND = 100000
+
+# Minimum bit length of a composite for which Pollard's p - 1 method is tried (exclusive)
+P_MINUS_1_BITS = 40
+
+# Maximum bit length of a composite which is split by Pollard's rho instead of ECM
+RHO_BITS = 80
+
+# Initial smoothness bound and number of curves per attempt of the elliptic curve method
+ECM_B1 = 2000
+ECM_CURVES = 8
+
+
+# Pollard's rho with Brent's cycle detection for f(x) = x^2 + c mod n (returns a divisor 1 < d ≤ n)
+def pollard_rho_brent(n, x=2, c=1, batch_size=BATCH_SIZE, trace=None):
+    y = x % n
+    r = 1
+    q = 1
+    d = 1
+    i = 0
+    while d == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and d == 1:
+            y_s = y
+            for _ in range(min(batch_size, r - k)):
+                y = (y * y + c) % n
+                q = (q * (x - y)) % n
+                i += 1
+
+                # The step history is only recorded on request
+                if trace is not None:
+                    trace.append((i, x, y))
+            d = gcd(q, n)
+            k += batch_size
+        r *= 2
+
+    # The accumulated product hit a multiple of n, so the last batch is repeated step by step
+    if d == n:
+        d = 1
+        while d == 1:
+            y_s = (y_s * y_s + c) % n
+            d = gcd(x - y_s, n)
+    return d
+
+
+# Pollard's rho with automatic restarts for new values of c (returns a non-trivial divisor of n or -1)
+def pollard_rho(n, x=None, c=None, restarts=16, trace=None):
+    if n < 4:
+        return -1
+    if n % 2 == 0:
+        return 2
+
+    for _ in range(restarts + 1):
+        c = random.randrange(1, n - 2) if c is None else c
+        if trace is not None:
+            trace.clear()
+        d = pollard_rho_brent(n, random.randrange(0, n) if x is None else x, c, trace=trace)
+        if d != n:
+            return d
+        c = (c + 1) % (n - 2) + 1
+    return -1
+
+
+# Pollard's p - 1 method (returns a non-trivial divisor of n or -1)
+def pollard_p_minus_1(n, bound=P_MINUS_1_BOUND, a=2):
+    for p in primality.sieve(bound + 1):
+        # Largest power of p not exceeding the bound
+        p_e = p
+        while p_e * p <= bound:
+            p_e *= p
+        a = pow(a, p_e, n)
+    d = gcd(a - 1, n)
+    return d if 1 < d < n else -1
+
+
+# Montgomery ladder for k * (x : z) on the curve b * y^2 = x^3 + a * x^2 + x with a24 = (a + 2) / 4
+def montgomery_ladder(k, x, z, a24, n):
+    x_0, z_0 = x, z
+    s = (x + z) ** 2 % n
+    t = (x - z) ** 2 % n
+    x_1, z_1 = (s * t) % n, ((s - t) * (t + a24 * (s - t))) % n
+    for bit in bin(k)[3:]:
+        # Differential addition of R0 and R1 (difference P) and doubling of R0 or R1
+        u = ((x_0 - z_0) * (x_1 + z_1)) % n
+        v = ((x_0 + z_0) * (x_1 - z_1)) % n
+        x_a, z_a = (z * (u + v) ** 2) % n, (x * (u - v) ** 2) % n
+        if bit == '1':
+            x_d, z_d = x_1, z_1
+        else:
+            x_d, z_d = x_0, z_0
+        s = (x_d + z_d) ** 2 % n
+        t = (x_d - z_d) ** 2 % n
+        x_d, z_d = (s * t) % n, ((s - t) * (t + a24 * (s - t))) % n
+        if bit == '1':
+            x_0, z_0, x_1, z_1 = x_a, z_a, x_d, z_d
+        else:
+            x_0, z_0, x_1, z_1 = x_d, z_d, x_a, z_a
+    return x_0, z_0
+
+
+# Lenstra's elliptic curve method with Suyama's parametrization (returns a non-trivial divisor of n or -1)
+def ecm(n, b1=ECM_B1, curves=ECM_CURVES):
+    primes = primality.sieve(b1 + 1)
+    for _ in range(curves):
+        sigma = random.randrange(6, n - 1)
+        u = (sigma * sigma - 5) % n
+        v = (4 * sigma) % n
+        x = pow(u, 3, n)
+        z = pow(v, 3, n)
+
+        # The curve parameter a24 = (v - u)^3 * (3u + v) / (16 * u^3 * v) requires an inverse modulo n
+        denominator = (16 * x * v) % n
+        d = gcd(denominator, n)
+        if 1 < d < n:
+            return d
+        if d == n:
+            continue
+        a24 = (pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n)) % n
+
+        # Stage 1: multiplication by all prime powers up to b1
+        for p in primes:
+            p_e = p
+            while p_e * p <= b1:
+                p_e *= p
+            x, z = montgomery_ladder(p_e, x, z, a24, n)
+        d = gcd(z, n)
+        if 1 < d < n:
+            return d
+    return -1
+
+
+# Integer k-th root ⌊n^(1/k)⌋ by Newton's method
+def integer_root(n, k):
+    if n < 2:
+        return n
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+# Decomposition of n = r^k with a maximal exponent k
+def perfect_power(n):
+    for k in primality.sieve(n.bit_length() + 1):
+        r = integer_root(n, k)
+        if r ** k == n:
+            r, e = perfect_power(r)
+            return r, e * k
+    return n, 1
+
+
+# Run independent attempts of a divisor search across a process pool until one of them succeeds
+def parallel_search(function, args, processes):
+    with ProcessPoolExecutor(processes) as executor:
+        pending = {executor.submit(function, *args) for _ in range(processes)}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                d = future.result()
+                if d != -1:
+                    for f in pending:
+                        f.cancel()
+                    return d
+                pending.add(executor.submit(function, *args))
+
+
+# Non-trivial divisor of a composite n which is neither a perfect power nor divisible by the trial primes (the optional
+# trace receives the method that found it as a (method, n, d) tuple)
+def find_divisor(n, processes=None, trace=None):
+    # Pollard's p - 1 finds factors p with a smooth p - 1 at low cost
+    if n.bit_length() > P_MINUS_1_BITS:
+        d = pollard_p_minus_1(n)
+        if d != -1:
+            if trace is not None:
+                trace.append(('Pollard-(p - 1)', n, d))
+            return d
+
+    # Pollard's rho for small composites, which is retried once with a fresh c before falling through to ECM
+    if n.bit_length() <= RHO_BITS:
+        for _ in range(2):
+            if processes is None or processes < 2:
+                d = pollard_rho(n)
+            else:
+                d = parallel_search(pollard_rho, (n,), processes)
+            if d != -1:
+                if trace is not None:
+                    trace.append(('Pollard-Rho', n, d))
+                return d
+
+    # Elliptic curve method with a growing smoothness bound for large composites
+    b1 = ECM_B1
+    while True:
+        if processes is None or processes < 2:
+            d = ecm(n, b1)
+        else:
+            d = parallel_search(ecm, (n, b1), processes)
+        if d != -1:
+            if trace is not None:
+                trace.append(('Elliptische-Kurven-Methode', n, d))
+            return d
+        b1 *= 4
+
+
+# Complete prime factorization of n as a sorted list of (prime, exponent) tuples (the optional trace receives every
+# split of a number n by a divisor d as a (method, n, d) tuple)
+def factorize(n, processes=None, trace=None):
+    if n < 1:
+        return -1
+    factors = {}
+
+    # Trial division by the precomputed prime table
+    for p in TRIAL_PRIMES:
+        if p * p > n:
+            break
+        if n % p == 0 and trace is not None:
+            trace.append(('Probedivision', n, p))
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+
+    # Split the remaining cofactors until all of them are prime numbers
+    stack = [(n, 1)] if n > 1 else []
+    while stack:
+        m, e = stack.pop()
+        if primality.is_prime(m):
+            factors[m] = factors.get(m, 0) + e
+            continue
+        r, k = perfect_power(m)
+        if k > 1:
+            if trace is not None:
+                trace.append(('Perfekte Potenz', m, r))
+            stack.append((r, e * k))
+            continue
+        d = find_divisor(m, processes, trace)
+        stack.append((d, e))
+        stack.append((m // d, e))
+    return sorted(factors.items())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import shared_functions
+from math import gcd, isqrt
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Small moduli whose quadratic residues filter the candidates before the exact integer square root is calculated
+SIEVE_MODULI = (64, 63, 65, 11)
+SQUARES = {m: frozenset((i * i) % m for i in range(m)) for m in SIEVE_MODULI}
+
+
+# Exact integer square root of y if y is a perfect square (-1 otherwise)
+def square_root(y):
+    if y < 0:
+        return -1
+    for m in SIEVE_MODULI:
+        if y % m not in SQUARES[m]:
+            return -1
+    r = isqrt(y)
+    return r if r * r == y else -1
+
+
+# Fermat's factorization
+def factorization(n, trace=None):
+    # Choose an integer n that is not a prime number (n ≡ 2 mod 4 is not a difference of two squares)
+    if n < 2 or shared_functions.is_prime(n) or n % 4 == 2:
+        return -1
+
+    # Calculate the smallest integer x such that x ≥ √(n)
+    x = isqrt(n)
+    if x * x < n:
+        x += 1
+
+    # Lookup tables of the values of x mod m for which x^2 - n can be a square mod m
+    admissible = [(m, bytes(((i * i - n) % m) in SQUARES[m] for i in range(m))) for m in SIEVE_MODULI]
+
+    # Calculation of y = x^2 - n, which is updated incrementally by (x + 1)^2 - x^2 = 2x + 1
+    y = x * x - n
+    while True:
+        r = -1
+        if all(table[x % m] for m, table in admissible):
+            r = isqrt(y)
+            if r * r != y:
+                r = -1
+
+        # The intermediate results are only recorded on request
+        if trace is not None:
+            trace.append((x, y, r))
+        if r != -1:
+            return x + r, x - r
+        y += 2 * x + 1
+        x += 1
+
+
+# Hart's one line factorization
+def one_line_factorization(n, trace=None):
+    # Choose an integer n that is not a prime number
+    if n < 2 or shared_functions.is_prime(n):
+        return -1
+
+    for i in range(1, n + 1):
+        # Calculation of s = ⌈√(n * i)⌉ and m = s^2 mod n
+        s = isqrt(n * i)
+        if s * s < n * i:
+            s += 1
+        m = (s * s) % n
+        t = square_root(m)
+
+        # The intermediate results are only recorded on request
+        if trace is not None:
+            trace.append((i, s, m, t))
+        if t != -1:
+            d = gcd(s - t, n)
+            if 1 < d < n:
+                return max(d, n // d), min(d, n // d)
+    return -1
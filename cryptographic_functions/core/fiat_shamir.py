@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import shared_functions
+from cryptographic_functions.core import modulo
+import random
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Choose a random integer k such that 1 < k < n and k and n are coprime
+def _coprime_randrange(n):
+    k = random.randrange(2, n)
+    while shared_functions.gcd(k, n) != 1:
+        k = random.randrange(2, n)
+    return k
+
+
+# Fiat-Shamir keypair generation
+def keypair_generation(p, q, s=None, v=None):
+    # Choose two different integers p and q that are prime numbers
+    if not shared_functions.is_prime(p) or not shared_functions.is_prime(q) or p == q:
+        return -1
+
+    # Calculation of n
+    n = p * q
+
+    # Choose an integer s such that 1 < s < n and s and n are coprime
+    if s is None:
+        s = _coprime_randrange(n)
+    elif s not in range(2, n) or shared_functions.gcd(s, n) != 1:
+        return -1
+
+    # Calculation of v
+    v = (s ** 2) % n
+
+    # Verification of v
+    if (s ** 2) * v % n != 1:
+        return -1
+    return (v, n), (s, n)
+
+
+# Fiat-Shamir verification
+def verification(key_a, key_b, k=None, b=None):
+    v, n = key_a
+    s, n_v = key_b
+
+    # The value of n must be identical in both keys
+    if n != n_v:
+        return -1
+
+    # Choose an integer k such that 1 < k < n and k and n are coprime
+    if k is None:
+        k = _coprime_randrange(n)
+    elif k not in range(2, n) or shared_functions.gcd(k, n) != 1:
+        return -1
+
+    # Choose an integer b such that b ∈ {0, 1}
+    if b is None:
+        b = random.randrange(0, 2)
+    elif b not in range(0, 2):
+        return -1
+
+    # Calculation of x and y_v
+    x = (k ** 2) % n
+    return x % n if b == 0 else (x * modulo.mim(n, v)) % n
+
+
+# Fiat-Shamir attack
+def attack_scheme(key_a, y=None, b=None):
+    v, n = key_a
+
+    # Choose an integer y such that 1 < y < n
+    if y is None:
+        y = random.randrange(2, n)
+    elif y not in range(2, n):
+        return -1
+
+    # Choose an integer b such that b ∈ {0, 1}
+    if b is None:
+        b = random.randrange(0, 2)
+    elif b not in range(0, 2):
+        return -1
+
+    # Calculation of x and y_v
+    x = (y ** 2) % n if b == 0 else ((y ** 2) * v) % n
+    return x % n if b == 0 else (x * modulo.mim(n, v)) % n
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import cache
+from functools import lru_cache
+import numpy as np
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Minimum bit length of the modulus from which the fixed-base precomputation outperforms the builtin pow
+FIXED_BASE_THRESHOLD = 512
+
+# Window width of the fixed-base precomputation tables
+FIXED_BASE_WINDOW = 4
+
+# Moduli below 2^32 allow exact uint64 products, moduli below 2^56 are multiplied in 8-bit chunks
+UINT32_LIMIT = 1 << 32
+VECTORIZED_LIMIT = 1 << 56
+
+# Number of values which are processed at once by the vectorized exponentiation
+CHUNK_SIZE = 1 << 16
+
+
+# Modular exponentiation without calculating the full integer base^exp
+def modexp(base, exp, mod):
+    return pow(base, exp, mod)
+
+
+# Window width for the sliding-window exponentiation depending on the bit length of the exponent
+def window_size(bits):
+    for w, limit in enumerate((24, 80, 240, 672, 1792), start=1):
+        if bits <= limit:
+            return w
+    return 6
+
+
+# Modular exponentiation with a left-to-right sliding window over the bits of the exponent
+def sliding_window(base, exp, mod, w=None):
+    if mod == 1:
+        return 0
+
+    # Negative exponents are reduced to the multiplicative inverse of the base
+    if exp < 0:
+        base, exp = pow(base, -1, mod), -exp
+    if w is None:
+        w = window_size(exp.bit_length())
+
+    # Precomputation of the odd powers base^1, base^3, ..., base^(2^w - 1)
+    base %= mod
+    base_2 = (base * base) % mod
+    odd = [base]
+    for _ in range((1 << (w - 1)) - 1):
+        odd.append((odd[-1] * base_2) % mod)
+
+    result = 1
+    i = exp.bit_length() - 1
+    while i >= 0:
+        if not (exp >> i) & 1:
+            result = (result * result) % mod
+            i -= 1
+            continue
+
+        # Find the longest window ending with a set bit
+        j = max(i - w + 1, 0)
+        while not (exp >> j) & 1:
+            j += 1
+        for _ in range(i - j + 1):
+            result = (result * result) % mod
+        result = (result * odd[((exp >> j) & ((1 << (i - j + 1)) - 1)) >> 1]) % mod
+        i = j - 1
+    return result
+
+
+# Precomputation of base^(k * 2^(w * i)) mod mod for all window positions i and digits k
+@lru_cache(maxsize=32)
+def fixed_base_table(base, mod, bits, w=FIXED_BASE_WINDOW):
+    # Warm start from the persistent cache, which stores the table entries as big-endian bytes
+    width = (bits + 7) // 8
+    stored = cache.load_array('fixed_base', (base, mod, bits, w))
+    if stored is not None:
+        return tuple(tuple(int.from_bytes(entry.tobytes(), 'big') for entry in row) for row in stored)
+
+    table = []
+    g = base % mod
+    for _ in range(-(-bits // w)):
+        row = [1, g]
+        for _ in range((1 << w) - 2):
+            row.append((row[-1] * g) % mod)
+        table.append(row)
+        g = (row[-1] * g) % mod
+    stored = np.frombuffer(b''.join(x.to_bytes(width, 'big') for row in table for x in row), dtype=np.uint8)
+    cache.store_array('fixed_base', (base, mod, bits, w), stored.reshape(len(table), -1, width))
+    return tuple(tuple(row) for row in table)
+
+
+# Modular exponentiation for a fixed base with cached precomputation (e.g. the generator g of a group)
+def fixed_base(base, exp, mod, w=FIXED_BASE_WINDOW):
+    bits = mod.bit_length()
+    if bits < FIXED_BASE_THRESHOLD or exp < 0 or exp.bit_length() > bits:
+        return pow(base, exp, mod)
+
+    table = fixed_base_table(base, mod, bits, w)
+    mask = (1 << w) - 1
+    result = 1
+    for row in table:
+        if exp == 0:
+            break
+        k = exp & mask
+        if k:
+            result = (result * row[k]) % mod
+        exp >>= w
+    return result % mod
+
+
+# Conversion of a list, generator or NumPy array into a uint64 array (or an object array for large moduli)
+def as_array(values, mod):
+    dtype = np.uint64 if mod < VECTORIZED_LIMIT else object
+    if isinstance(values, np.ndarray):
+        return values.astype(dtype, copy=False)
+    if dtype is object:
+        return np.array(list(values), dtype=object)
+    return np.fromiter(values, dtype=np.uint64)
+
+
+# Vectorized modular multiplication of two uint64 arrays with values smaller than mod < 2^56
+def mulmod_many(a, b, mod):
+    if mod < UINT32_LIMIT:
+        return (a * b) % np.uint64(mod)
+
+    # Horner scheme over the 8-bit chunks of b, so that no intermediate result exceeds 64 bits
+    m = np.uint64(mod)
+    r = np.zeros_like(a)
+    for shift in range(48, -8, -8):
+        chunk = (b >> np.uint64(shift)) & np.uint64(0xFF)
+        r = ((r << np.uint64(8)) % m + (a * chunk) % m) % m
+    return r
+
+
+# Vectorized square-and-multiply for many bases and a common exponent
+def modexp_many(values, exp, mod, chunk_size=CHUNK_SIZE):
+    values = as_array(values, mod)
+    if mod == 1:
+        return np.zeros(len(values), dtype=values.dtype)
+
+    # Large moduli are exponentiated element-wise with the builtin pow
+    if values.dtype == object:
+        return np.array([pow(int(v), exp, mod) for v in values], dtype=object)
+
+    # The values are processed in chunks to limit the memory used by intermediate arrays
+    result = np.empty_like(values)
+    for start in range(0, len(values), chunk_size):
+        base = values[start:start + chunk_size] % np.uint64(mod)
+        r = np.ones_like(base)
+        e = exp
+        while e:
+            if e & 1:
+                r = mulmod_many(r, base, mod)
+            e >>= 1
+            if e:
+                base = mulmod_many(base, base, mod)
+        result[start:start + chunk_size] = r
+    return result
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import cache
+from cryptographic_functions.core import discrete_log
+from cryptographic_functions.core import factorization
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import primality
+from functools import lru_cache
+from math import gcd, isqrt
+import numpy as np
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Addition in finite sets
+def addition(m, a, b):
+    # Checking whether requirements are met
+    if m < 2 or a not in range(m) or b not in range(m):
+        return -1
+    return (a + b) % m
+
+
+# Subtraction in finite sets
+def subtraction(m, a, b):
+    # Checking whether requirements are met
+    i = mia(m, b)
+    if i == -1:
+        return -1
+    return (a + i) % m
+
+
+# Multiplication in finite sets
+def multiplication(m, a, b):
+    # Checking whether requirements are met
+    if m < 2 or a not in range(1, m) or b not in range(1, m):
+        return -1
+    return (a * b) % m
+
+
+# Division in finite sets
+def division(m, a, b):
+    # Checking whether requirements are met
+    i = mim(m, b)
+    if i == -1:
+        return -1
+    return (a * i) % m
+
+
+# Additive inverse element in finite sets
+def mia(m, a):
+    # Checking whether requirements are met
+    if m < 2 or a not in range(m):
+        return -1
+    return m - a
+
+
+# Multiplicative inverse element in finite sets
+def mim(m, a):
+    # Checking whether requirements are met
+    if m < 2 or a not in range(1, m):
+        return -1
+
+    # Builtin modular inverse without recording the intermediate results (m and a must be coprime)
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        return -1
+
+
+# Multiplicative inverses of many values mod m with Montgomery's trick (-1 for values without an inverse)
+def inverse_many(m, values):
+    if m < 2:
+        return -1
+    if isinstance(values, np.ndarray) and m < modexp.VECTORIZED_LIMIT:
+        return inverse_array(m, values)
+    values = [int(a) % m for a in values]
+    if not values:
+        return []
+
+    # Prefix products c_i = a_0 * a_1 * ... * a_i mod m
+    prefix = []
+    c = 1
+    for a in values:
+        c = (c * a) % m
+        prefix.append(c)
+
+    # A single inversion of the product of all values, unless one of them shares a factor with m
+    try:
+        c_i = pow(c, -1, m)
+    except ValueError:
+        units = [i for i, a in enumerate(values) if gcd(a, m) == 1]
+        result = [-1] * len(values)
+        for i, a_i in zip(units, inverse_many(m, [values[i] for i in units])):
+            result[i] = a_i
+        return result
+
+    # a_i^-1 = c_(i-1) * c_i^-1 and c_(i-1)^-1 = a_i * c_i^-1
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = (c_i * prefix[i - 1]) % m
+        c_i = (c_i * values[i]) % m
+    result[0] = c_i
+    return result
+
+
+# Vectorized Montgomery's trick for an array of values mod m < 2^56 over √n interleaved chains of prefix products
+def inverse_array(m, values):
+    n = len(values)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    lanes = max(1, isqrt(n))
+    steps = -(-n // lanes)
+    grid = np.ones(lanes * steps, dtype=np.uint64)
+    grid[:n] = modexp.as_array(values, m) % np.uint64(m)
+    grid = grid.reshape(steps, lanes)
+
+    # Prefix products of every chain
+    prefix = np.empty_like(grid)
+    c = np.ones(lanes, dtype=np.uint64)
+    for j in range(steps):
+        c = modexp.mulmod_many(c, grid[j], m)
+        prefix[j] = c
+
+    # One inversion per chain (chains with a value that shares a factor with m are inverted element-wise)
+    c_i = np.zeros(lanes, dtype=np.uint64)
+    failed = []
+    for k, c_k in enumerate(prefix[-1].tolist()):
+        try:
+            c_i[k] = pow(c_k, -1, m)
+        except ValueError:
+            failed.append(k)
+
+    result = np.empty((steps, lanes), dtype=np.int64)
+    for j in range(steps - 1, 0, -1):
+        result[j] = modexp.mulmod_many(c_i, prefix[j - 1], m)
+        c_i = modexp.mulmod_many(c_i, grid[j], m)
+    result[0] = c_i
+    for k in failed:
+        result[:, k] = inverse_many(m, grid[:, k].tolist())
+    return result.reshape(-1)[:n]
+
+
+# Smallest quadratic non-residue mod an odd prime p, which is computed once per prime (-1 for p < 3)
+@lru_cache(maxsize=256)
+def non_residue(p):
+    if p < 3:
+        return -1
+    z = 2
+    while primality.jacobi(z, p) != -1:
+        z += 1
+    return z
+
+
+# Decomposition p - 1 = q * 2^s with odd q and the generator c = z^q of the 2-Sylow subgroup for a non-residue z
+@lru_cache(maxsize=256)
+def sylow_decomposition(p):
+    q, s = p - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    return q, s, pow(non_residue(p), q, p)
+
+
+# Square root of a mod p with the Tonelli-Shanks algorithm (O(s^2) multiplications, -1 for quadratic non-residues)
+def tonelli_shanks(p, a):
+    a %= p
+    if a == 0 or p == 2:
+        return a
+
+    q, s, c = sylow_decomposition(p)
+    r = pow(a, (q + 1) // 2, p)
+    t = pow(a, q, p)
+    while t != 1:
+        # Smallest i with t^(2^i) = 1
+        i, t_2 = 0, t
+        while t_2 != 1:
+            t_2 = (t_2 * t_2) % p
+            i += 1
+
+        # The order of t reaches 2^s only for quadratic non-residues
+        if i == s:
+            return -1
+        b = pow(c, 1 << (s - i - 1), p)
+        r = (r * b) % p
+        c = (b * b) % p
+        t = (t * c) % p
+        s = i
+    return r
+
+
+# Square root of a quadratic residue a mod p with Cipolla's algorithm as (t + ω)^((p + 1) / 2) in GF(p^2) with
+# ω^2 = t^2 - a (O(log p) multiplications independent of the power of two in p - 1, -1 for quadratic non-residues)
+def cipolla(p, a):
+    a %= p
+    if a == 0 or p == 2:
+        return a
+
+    t = 0
+    while primality.jacobi((t * t - a) % p, p) != -1:
+        t += 1
+    w = (t * t - a) % p
+
+    # Square-and-multiply on the elements x + y * ω
+    x, y = 1, 0
+    b_x, b_y = t, 1
+    e = (p + 1) // 2
+    while e:
+        if e & 1:
+            x, y = (x * b_x + y * b_y * w) % p, (x * b_y + y * b_x) % p
+        e >>= 1
+        if e:
+            b_x, b_y = (b_x * b_x + b_y * b_y * w) % p, (2 * b_x * b_y) % p
+
+    # For quadratic non-residues the result is not a square root of a
+    return x if (x * x) % p == a else -1
+
+
+# Square root of a quadratic residue a mod p ≡ 5 mod 8 with Atkin's algorithm (a single exponentiation)
+def atkin(p, a):
+    b = pow(2 * a, (p - 5) // 8, p)
+    i = (2 * a * b * b) % p
+    return (a * b * (i - 1)) % p
+
+
+# Square root of a mod a prime p (-1 if a is a quadratic non-residue), with a single exponentiation for p ≡ 3 mod 4
+# and p ≡ 5 mod 8, otherwise Tonelli-Shanks or Cipolla depending on the power of two s in p - 1
+def sqrt_mod(p, a):
+    a %= p
+    if a == 0 or p == 2:
+        return a
+
+    # The candidate root is verified instead of computing the Legendre symbol of a beforehand
+    if p % 4 == 3:
+        r = pow(a, (p + 1) // 4, p)
+    elif p % 8 == 5:
+        r = atkin(p, a)
+    else:
+        s = sylow_decomposition(p)[1]
+        r = cipolla(p, a) if s * (s - 1) > 8 * p.bit_length() + 20 else tonelli_shanks(p, a)
+    return r if r != -1 and (r * r) % p == a else -1
+
+
+# Vectorized square roots of an array of values mod a prime p as (roots, residues), where residues marks the
+# quadratic residues and the roots of non-residues are 0 or undefined (Tonelli-Shanks with a fixed number of steps,
+# which reduces to the single exponentiation a^((p + 1) / 4) for p ≡ 3 mod 4)
+def sqrt_many(p, values):
+    values = modexp.as_array(values, p)
+
+    # Every value is its own square root mod 2
+    if p == 2:
+        return values % 2, np.ones(len(values), dtype=bool)
+
+    # Beyond 2^32 the products of mulmod_many need the chunked Horner scheme, which is slower than pow per element
+    if p >= modexp.UINT32_LIMIT:
+        roots = [sqrt_mod(p, int(v)) for v in values]
+        return (np.array([max(r, 0) for r in roots], dtype=values.dtype),
+                np.array([r != -1 for r in roots], dtype=bool))
+    values %= np.uint64(p)
+
+    # r^2 = a * t with t = a^q in the 2-Sylow subgroup generated by c
+    q, s, c = sylow_decomposition(p)
+    t = modexp.modexp_many(values, q, p)
+    r = modexp.modexp_many(values, (q + 1) // 2, p)
+
+    # Bit k of the exponent e with t * c^e = 1 is set where (t * c^e)^(2^(s - 1 - k)) is not yet 1, every bit k of e
+    # contributes the factor c^(2^(k - 1)) to the root r * c^(e / 2)
+    powers = [c]
+    for _ in range(s - 1):
+        powers.append((powers[-1] * powers[-1]) % p)
+    for k in range(1, s):
+        x = t
+        for _ in range(s - 1 - k):
+            x = modexp.mulmod_many(x, x, p)
+        mask = x != 1
+        t = np.where(mask, modexp.mulmod_many(t, np.full_like(t, powers[k]), p), t)
+        r = np.where(mask, modexp.mulmod_many(r, np.full_like(r, powers[k - 1]), p), r)
+    return r, modexp.mulmod_many(r, r, p) == values
+
+
+# Euler's totient φ(m) and its factorization as (prime, exponent) tuples
+def totient(m):
+    phi = 1
+    factors = {}
+    for p, e in factorization.factorize(m):
+        # φ(p^e) = p^(e - 1) * (p - 1)
+        phi *= p ** (e - 1) * (p - 1)
+        if e > 1:
+            factors[p] = factors.get(p, 0) + e - 1
+        for q, f in factorization.factorize(p - 1):
+            factors[q] = factors.get(q, 0) + f
+    return phi, sorted(factors.items())
+
+
+# Check whether g is a primitive root mod m, i.e. g^(φ / q) ≠ 1 mod m for all prime factors q of φ(m)
+def is_primitive_root(g, m, phi, factors):
+    return gcd(g, m) == 1 and all(pow(g, phi // q, m) != 1 for q, _ in factors)
+
+
+# Smallest primitive root mod m (-1 if the group of units mod m is not cyclic)
+def primitive_root(m, phi=None, factors=None):
+    if phi is None or factors is None:
+        phi, factors = totient(m)
+    for g in range(1, m):
+        if is_primitive_root(g, m, phi, factors):
+            return g
+    return -1
+
+
+# All primitive roots mod m in ascending order as g^k mod m with gcd(k, φ(m)) = 1 for the smallest primitive root g
+def primitive_roots(m):
+    phi, factors = totient(m)
+    g = primitive_root(m, phi, factors)
+    if g == -1:
+        return []
+
+    # The exponents k that are coprime to φ(m) are sieved by the prime factors of φ(m)
+    coprime = np.ones(phi, dtype=bool)
+    for q, _ in factors:
+        coprime[::q] = False
+    if m < modexp.VECTORIZED_LIMIT:
+        roots = discrete_log.powers(g, m, phi)[coprime]
+    else:
+        roots = [pow(g, k, m) for k in np.flatnonzero(coprime).tolist()]
+    return sorted(int(r) for r in roots)
+
+
+# Cyclic groups
+def mcg(m):
+    # Checking whether requirements are met
+    if m < 2:
+        return -1
+
+    # Warm start from the persistent cache
+    stored = cache.load_value('mcg', m)
+    if stored is not None:
+        p, n = stored
+        return p if len(p) > 0 else -1, n if len(n) > 0 else -1
+
+    # Only the multiplicative group of a prime field contains all elements 1, ..., m - 1 as powers of one element
+    p = primitive_roots(m) if primality.is_prime(m) else []
+
+    # All remaining elements are non-primitive
+    is_primitive = np.zeros(m, dtype=bool)
+    is_primitive[p] = True
+    n = (np.flatnonzero(~is_primitive[1:]) + 1).tolist()
+    cache.store_value('mcg', m, (p, n))
+    return p if len(p) > 0 else -1, n if len(n) > 0 else -1
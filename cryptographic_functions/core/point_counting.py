@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import cache
+from cryptographic_functions.core import ecc
+from cryptographic_functions.core import factorization
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import primality
+from cryptographic_functions.core import tables
+from functools import lru_cache
+from math import isqrt
+import numpy as np
+import random
+import secrets
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Fields below 2^13 are counted with the vectorized sum of Legendre symbols (the crossover to Shanks-Mestre)
+LEGENDRE_LIMIT = 1 << 13
+
+# Fields below 2^56 are counted with the baby-step giant-step method of Shanks and Mestre
+SHANKS_MESTRE_LIMIT = 1 << 56
+
+# Maximum number of candidates for the group order which remain for the baby-step giant-step search after Schoof
+SEARCH_LIMIT = 1 << 32
+
+# Fields below 2^24 are enumerated with a table of square roots, larger fields with the vectorized square roots of
+# modulo.sqrt_many
+ROOT_TABLE_LIMIT = 1 << 24
+
+# Number of x coordinates which are evaluated at once
+CHUNK_SIZE = 1 << 20
+
+# Number of giant steps which are normalized with a single inversion
+GIANT_CHUNK = 1024
+
+# Maximum number of random points on the curve and its quadratic twist until the group order is unique
+POINT_ATTEMPTS = 32
+
+
+# Discriminant 4a^3 + 27b^2 mod n (0 for singular curves)
+def discriminant(curve):
+    a, b, n = curve
+    return (4 * a ** 3 + 27 * b ** 2) % n
+
+
+# Table of the smaller square root y ≤ n / 2 of every residue mod n (-1 for quadratic non-residues)
+@lru_cache(maxsize=8)
+def square_roots_table(n):
+    roots = np.full(n, -1, dtype=np.int32 if n < 1 << 31 else np.int64)
+    for start in range(0, n // 2 + 1, CHUNK_SIZE):
+        y = np.arange(start, min(start + CHUNK_SIZE, n // 2 + 1), dtype=np.int64)
+        roots[tables.mulmod(y, y, n)] = y
+    return roots
+
+
+# Right-hand side x^3 + a * x + b mod n of the curve equation for an array of x coordinates
+def right_hand_side(curve, x):
+    a, b, n = curve
+    if n >= modexp.VECTORIZED_LIMIT:
+        x = x.astype(object)
+        return ((x * x % n) * x + a * x + b) % n
+    x_2 = tables.mulmod(x, x, n)
+    return (tables.mulmod(x_2, x, n) + tables.mulmod(np.full_like(x, a % n), x, n) + b % n) % n
+
+
+# Group order from the Legendre symbols of the right-hand side: #E = n + 1 + sum((x^3 + a * x + b / n))
+def legendre_order(curve):
+    n = curve[2]
+    roots = square_roots_table(n)
+    order = 1
+    for start in range(0, n, CHUNK_SIZE):
+        v = right_hand_side(curve, np.arange(start, min(start + CHUNK_SIZE, n), dtype=np.int64))
+        order += 2 * int(np.count_nonzero(roots[v] >= 0)) - int(np.count_nonzero(v == 0))
+    return order
+
+
+# Points (x|y) of the curve for an array of x coordinates as array of shape (k, 2), sorted by x and y
+def points_of(curve, x):
+    n = curve[2]
+    v = right_hand_side(curve, x)
+    if n < ROOT_TABLE_LIMIT:
+        y = square_roots_table(n)[v].astype(np.int64)
+        x, y = x[y >= 0], y[y >= 0]
+    else:
+        # Square roots of all right-hand sides at once, the non-residues are discarded afterwards
+        y, residues = modulo.sqrt_many(n, v)
+        x, y = x[residues], y[residues]
+        y = np.minimum(y, (n - y) % n)
+
+    # Both square roots y and n - y of each residue (a single one for y = 0)
+    x = np.repeat(x, 2)
+    y = np.column_stack([y, (n - y) % n]).ravel()
+    unique = np.ones(len(y), dtype=bool)
+    unique[1::2] = y[1::2] != y[::2]
+    dtype = tables.table_dtype(n) if n <= 1 << 64 else object
+    return np.column_stack([x[unique].astype(dtype), y[unique].astype(dtype)])
+
+
+# Points (x|y) with start ≤ x < stop as stream of compact arrays for chunks of x coordinates (without O)
+def enumerate_points(curve, start=0, stop=None, chunk_size=CHUNK_SIZE):
+    n = curve[2]
+    stop = n if stop is None else min(stop, n)
+    for i in range(start, stop, chunk_size):
+        j = min(i + chunk_size, stop)
+        yield points_of(curve, np.arange(i, j, dtype=np.int64) if n < 1 << 62 else np.array(range(i, j), dtype=object))
+
+
+# All affine points of a non-singular curve over a prime field n > 3 as array of shape (#E - 1, 2)
+def curve_points(curve):
+    n = curve[2]
+    if n < 5 or not primality.is_prime(n) or discriminant(curve) == 0:
+        return -1
+    return np.concatenate(list(enumerate_points(curve)))
+
+
+# Random affine point on the curve
+def random_point(curve):
+    a, b, n = curve
+    while True:
+        x = random.randrange(n)
+        y = modulo.sqrt_mod(n, x ** 3 + a * x + b)
+        if y != -1:
+            return x, y
+
+
+# Quadratic twist y^2 = x^3 + a * d^2 * x + b * d^3 with a quadratic non-residue d (order 2n + 2 - #E)
+def twist(curve):
+    a, b, n = curve
+    d = 2
+    while primality.jacobi(d, n) != -1:
+        d += 1
+    return (a * d * d) % n, (b * d ** 3) % n, n
+
+
+# Solutions k = k_0, k_0 + period, ... < count of (start + k * step) * P = O as (k_0, period), where the period is
+# None if k_0 is the only solution (-1 if there is no solution)
+def interval_search(curve, p, start, step, count):
+    q = ecc.to_jacobian(ecc.scalar_mul(curve, step, p))
+    s = isqrt(count - 1) + 1
+
+    # Baby steps j * Q for j = 0, ..., s - 1 (the first repetition is O at j = ord(Q))
+    baby = [ecc.JACOBIAN_INFINITY]
+    for _ in range(s - 1):
+        baby.append(ecc.jacobian_addition(curve, baby[-1], q))
+    table = {}
+    period = None
+    for j, point in enumerate(ecc.to_affine_many(curve, baby)):
+        if point is ecc.INFINITY and j > 0:
+            period = j
+            break
+        table.setdefault(point, j)
+
+    # Giant steps -start * P - i * s * Q, normalized in chunks with a single inversion per chunk
+    r = ecc.to_jacobian(ecc.scalar_mul(curve, -start, p))
+    giant = ecc.jacobian_negation(curve, ecc.to_jacobian(ecc.scalar_mul(curve, s, ecc.to_affine(curve, q))))
+    solutions = []
+    for i_0 in range(0, -(-count // s), GIANT_CHUNK):
+        chunk = []
+        for _ in range(min(GIANT_CHUNK, -(-count // s) - i_0)):
+            chunk.append(r)
+            r = ecc.jacobian_addition(curve, r, giant)
+        for i, point in enumerate(ecc.to_affine_many(curve, chunk), start=i_0):
+            j = table.get(point)
+            if j is None or i * s + j >= count:
+                continue
+            if period is not None:
+                return i * s + j, period
+            solutions.append(i * s + j)
+            if len(solutions) == 2:
+                return solutions[0], solutions[1] - solutions[0]
+    return (solutions[0], None) if solutions else -1
+
+
+# Group order as the unique candidate start + k * step (k < count) annihilating random points of the curve or, with
+# 2n + 2 - candidate, of its quadratic twist (Mestre)
+def order_search(curve, start, step, count):
+    n = curve[2]
+    twisted = twist(curve)
+    for attempt in range(POINT_ATTEMPTS):
+        if count == 1:
+            return start
+        if attempt % 2 == 0:
+            solution = interval_search(curve, random_point(curve), start, step, count)
+        else:
+            solution = interval_search(twisted, random_point(twisted), 2 * n + 2 - start, -step, count)
+        if solution == -1:
+            return -1
+
+        # The remaining candidates form the subsequence k_0, k_0 + period, ... of the previous candidates
+        k_0, period = solution
+        start += k_0 * step
+        if period is None:
+            return start
+        step *= period
+        count = (count - k_0 - 1) // period + 1
+    return -1
+
+
+# Group order with the baby-step giant-step method of Shanks and Mestre on the Hasse interval n + 1 ± 2√n
+def shanks_mestre_order(curve):
+    n = curve[2]
+    w = isqrt(4 * n)
+    return order_search(curve, n + 1 - w, 1, 2 * w + 1)
+
+
+# Polynomials over GF(n) as lists of coefficients in ascending order without trailing zeros
+def poly_trim(f):
+    while f and f[-1] == 0:
+        f.pop()
+    return f
+
+
+# Sum f + g of two polynomials
+def poly_add(f, g, n):
+    if len(f) < len(g):
+        f, g = g, f
+    return poly_trim([(c + g[i]) % n if i < len(g) else c for i, c in enumerate(f)])
+
+
+# Difference f - g of two polynomials
+def poly_sub(f, g, n):
+    return poly_add(f, [(-c) % n for c in g], n)
+
+
+# Product c * f of a polynomial and a scalar
+def poly_scale(f, c, n):
+    return poly_trim([(c * c_f) % n for c_f in f])
+
+
+# Product f * g of two polynomials with Kronecker substitution (a single multiplication of two large integers)
+def poly_mul(f, g, n):
+    if not f or not g:
+        return []
+    size = (2 * n.bit_length() + min(len(f), len(g)).bit_length() + 7) // 8
+    f_i = int.from_bytes(b''.join(c.to_bytes(size, 'little') for c in f), 'little')
+    g_i = int.from_bytes(b''.join(c.to_bytes(size, 'little') for c in g), 'little')
+    h = (f_i * g_i).to_bytes(size * (len(f) + len(g)), 'little')
+    return poly_trim([int.from_bytes(h[i * size:(i + 1) * size], 'little') % n for i in range(len(f) + len(g) - 1)])
+
+
+# Quotient and remainder of the polynomial division f / g by long division
+def poly_divmod(f, g, n):
+    f = f[:]
+    d = len(g) - 1
+    g_i = pow(g[-1], -1, n)
+    q = [0] * max(len(f) - d, 0)
+    for i in range(len(f) - 1 - d, -1, -1):
+        c = (f[i + d] * g_i) % n
+        q[i] = c
+        if c:
+            for j, c_g in enumerate(g):
+                f[i + j] = (f[i + j] - c * c_g) % n
+    return poly_trim(q), poly_trim(f[:d])
+
+
+# Monic greatest common divisor of two polynomials
+def poly_gcd(f, g, n):
+    while g:
+        f, g = g, poly_divmod(f, g, n)[1]
+    return poly_scale(f, pow(f[-1], -1, n), n) if f else f
+
+
+# Modulus of the polynomial arithmetic as monic polynomial m with the inverse of its reversal mod x^deg(m)
+def poly_modulus(m, n):
+    m = poly_scale(m, pow(m[-1], -1, n), n)
+    d = len(m) - 1
+    reverse = m[::-1]
+
+    # Newton iteration g = g * (2 - reverse * g) doubles the number of correct coefficients in every step
+    inverse = [1]
+    k = 1
+    while k < d:
+        k = min(2 * k, d)
+        e = [(-c) % n for c in poly_mul(inverse, reverse[:k], n)[:k]]
+        e[0] = (e[0] + 2) % n
+        inverse = poly_mul(inverse, e, n)[:k]
+    return m, inverse
+
+
+# Remainder of a polynomial f with deg(f) < 2 * deg(m) modulo m by Barrett reduction with two multiplications
+def poly_mod(f, modulus, n):
+    m, inverse = modulus
+    d = len(m) - 1
+    if len(f) <= d:
+        return f
+    if len(f) > 2 * d:
+        return poly_divmod(f, m, n)[1]
+
+    # Quotient from the reversed polynomials, q = reverse(reverse(f) * reverse(m)^-1 mod x^k)
+    k = len(f) - d
+    q = poly_mul(f[::-1][:k], inverse[:k], n)[:k]
+    q = poly_trim((q + [0] * (k - len(q)))[::-1])
+    return poly_sub(f[:d], poly_mul(q, m, n)[:d], n)
+
+
+# Product f * g mod m
+def poly_mulmod(f, g, modulus, n):
+    return poly_mod(poly_mul(f, g, n), modulus, n)
+
+
+# Power f^e mod m with square-and-multiply
+def poly_powmod(f, e, modulus, n):
+    result = [1]
+    for bit in bin(e)[2:]:
+        result = poly_mulmod(result, result, modulus, n)
+        if bit == '1':
+            result = poly_mulmod(result, f, modulus, n)
+    return result
+
+
+# Inverse of f mod m by the extended Euclidean algorithm (raises ValueError with the monic gcd if it is not 1)
+def poly_inverse(f, modulus, n):
+    r_0, r_1 = modulus[0], f
+    t_0, t_1 = [], [1]
+    while len(r_1) > 1:
+        q, r = poly_divmod(r_0, r_1, n)
+        r_0, r_1 = r_1, r
+        t_0, t_1 = t_1, poly_sub(t_0, poly_mul(q, t_1, n), n)
+    if not r_1:
+        raise ValueError(poly_scale(r_0, pow(r_0[-1], -1, n), n))
+    return poly_scale(t_1, pow(r_1[0], -1, n), n)
+
+
+# Division polynomial ψ_k as polynomial in x (divided by y for even k, with y^2 = x^3 + a * x + b substituted)
+@lru_cache(maxsize=1024)
+def division_polynomial(curve, k):
+    a, b, n = curve
+    if k < 5:
+        return ([], [1], [2], [(-a * a) % n, (12 * b) % n, (6 * a) % n, 0, 3],
+                poly_scale([-8 * b * b - a ** 3, -4 * a * b, -5 * a * a, 20 * b, 5 * a, 0, 1], 4, n))[k]
+
+    f_2 = poly_mul([b % n, a % n, 0, 1], [b % n, a % n, 0, 1], n)
+    m = k // 2
+    psi = [division_polynomial(curve, i) for i in range(m - 2, m + 3)]
+    if k % 2 == 1:
+        # ψ_(2m + 1) = ψ_(m + 2) * ψ_m^3 - ψ_(m - 1) * ψ_(m + 1)^3, where y^4 of the even factors is f^2
+        left = poly_mul(psi[4], poly_mul(psi[2], poly_mul(psi[2], psi[2], n), n), n)
+        right = poly_mul(psi[1], poly_mul(psi[3], poly_mul(psi[3], psi[3], n), n), n)
+        if m % 2 == 0:
+            left = poly_mul(f_2, left, n)
+        else:
+            right = poly_mul(f_2, right, n)
+        return poly_sub(left, right, n)
+
+    # ψ_(2m) = ψ_m / (2y) * (ψ_(m + 2) * ψ_(m - 1)^2 - ψ_(m - 2) * ψ_(m + 1)^2)
+    left = poly_mul(psi[4], poly_mul(psi[1], psi[1], n), n)
+    right = poly_mul(psi[0], poly_mul(psi[3], psi[3], n), n)
+    return poly_scale(poly_mul(psi[2], poly_sub(left, right, n), n), pow(2, -1, n), n)
+
+
+# Addition of two points (X(x)|y * Y(x)) in the ring GF(n)[x, y] / (m(x), y^2 - x^3 - a * x - b)
+def ring_addition(curve, p, q, rhs, modulus):
+    a, _, n = curve
+    if p is ecc.INFINITY:
+        return q
+    if q is ecc.INFINITY:
+        return p
+    x_p, y_p = p
+    x_q, y_q = q
+
+    if x_p == x_q:
+        # Equal x coordinates either belong to P = Q (doubling) or to P = -Q (identity), otherwise the modulus splits
+        if y_p != y_q:
+            if not poly_add(y_p, y_q, n):
+                return ecc.INFINITY
+            poly_inverse(poly_sub(y_p, y_q, n), modulus, n)
+            return ecc.INFINITY
+        if not y_p:
+            return ecc.INFINITY
+        numerator = poly_add(poly_scale(poly_mulmod(x_p, x_p, modulus, n), 3, n), [a % n], n)
+        slope = poly_mulmod(numerator, poly_inverse(poly_scale(poly_mulmod(rhs, y_p, modulus, n), 2, n), modulus, n),
+                            modulus, n)
+    else:
+        slope = poly_mulmod(poly_sub(y_q, y_p, n), poly_inverse(poly_sub(x_q, x_p, n), modulus, n), modulus, n)
+
+    # x_r = λ^2 - x_p - x_q with λ = y * slope and y^2 = x^3 + a * x + b, y_r = λ * (x_p - x_r) - y_p
+    x_r = poly_sub(poly_mulmod(rhs, poly_mulmod(slope, slope, modulus, n), modulus, n), poly_add(x_p, x_q, n), n)
+    y_r = poly_sub(poly_mulmod(slope, poly_sub(x_p, x_r, n), modulus, n), y_p, n)
+    return x_r, y_r
+
+
+# Scalar multiplication k * P in the ring with double-and-add
+def ring_multiplication(curve, k, p, rhs, modulus):
+    r = ecc.INFINITY
+    for bit in bin(k)[2:]:
+        r = ring_addition(curve, r, r, rhs, modulus)
+        if bit == '1':
+            r = ring_addition(curve, r, p, rhs, modulus)
+    return r
+
+
+# Frobenius trace t mod l from the characteristic equation π^2 - t * π + n = 0 on the l-torsion points with
+# x coordinates among the roots of the modulus
+def frobenius_trace(curve, l, modulus):
+    a, b, n = curve
+    rhs = poly_mod([b % n, a % n, 0, 1], modulus, n)
+    x_pi = poly_powmod([0, 1], n, modulus, n)
+    y_pi = poly_powmod(rhs, (n - 1) // 2, modulus, n)
+    pi = (x_pi, y_pi)
+    pi_2 = (poly_powmod(x_pi, n, modulus, n), poly_powmod(y_pi, n + 1, modulus, n))
+
+    # π^2(P) + (n mod l) * P = t * π(P)
+    left = ring_addition(curve, pi_2, ring_multiplication(curve, n % l, (poly_mod([0, 1], modulus, n), [1]), rhs,
+                                                          modulus), rhs, modulus)
+    if left is ecc.INFINITY:
+        return 0
+    r = pi
+    for tau in range(1, (l + 1) // 2):
+        if tau > 1:
+            r = ring_addition(curve, r, pi, rhs, modulus)
+        if r[0] == left[0]:
+            return tau if r[1] == left[1] else l - tau
+    return -1
+
+
+# Frobenius trace t mod l for an odd prime l (Schoof), where a split of the division polynomial ψ_l continues the
+# calculation on the factor
+def schoof_residue(curve, l):
+    n = curve[2]
+    modulus = poly_modulus(division_polynomial(curve, l), n)
+    while True:
+        try:
+            return frobenius_trace(curve, l, modulus)
+        except ValueError as e:
+            modulus = poly_modulus(e.args[0], n)
+
+
+# Frobenius trace t mod 2 (t is even if and only if x^3 + a * x + b has a root in GF(n), i.e. a point of order 2)
+def trace_parity(curve):
+    a, b, n = curve
+    f = [b % n, a % n, 0, 1]
+    x_n = poly_powmod([0, 1], n, poly_modulus(f, n), n)
+    return 0 if len(poly_gcd(poly_sub(x_n, [0, 1], n), f, n)) > 1 else 1
+
+
+# Group order with Schoof's algorithm for the residues t mod l of small primes l, until the remaining candidates
+# n + 1 - t with t ≡ residue mod m are few enough for the baby-step giant-step search
+def schoof_order(curve):
+    n = curve[2]
+    w = isqrt(4 * n)
+    residue, m = trace_parity(curve), 2
+    l = 3
+    while (2 * w + 1) // m > SEARCH_LIMIT:
+        if l != n:
+            t_l = schoof_residue(curve, l)
+            if t_l == -1:
+                return -1
+
+            # Chinese remainder theorem for t mod m and t mod l
+            residue += m * (((t_l - residue) * pow(m, -1, l)) % l)
+            m *= l
+        l += 2
+        while not primality.is_prime(l):
+            l += 2
+
+    # Smallest t ≥ -2√n with t ≡ residue mod m, the candidates for #E are n + 1 - t, n + 1 - t - m, ...
+    t_0 = -w + (residue + w) % m
+    return order_search(curve, n + 1 - t_0, -m, (w - t_0) // m + 1)
+
+
+# Number of points #E(GF(n)) of a non-singular curve over a prime field n > 3 including the point at infinity
+@lru_cache(maxsize=256)
+def curve_order(curve):
+    a, b, n = curve
+    if n < 5 or not primality.is_prime(n) or discriminant(curve) == 0:
+        return -1
+
+    # Warm start from the persistent cache
+    curve = (a % n, b % n, n)
+    order = cache.load_value('curve_order', curve)
+    if order is not None:
+        return order
+
+    if n < LEGENDRE_LIMIT:
+        order = legendre_order(curve)
+    elif n < SHANKS_MESTRE_LIMIT:
+        order = shanks_mestre_order(curve)
+    else:
+        order = schoof_order(curve)
+    if order != -1:
+        cache.store_value('curve_order', curve, order)
+    return order
+
+
+# Random curve over GF(n) with a prime number of points as (curve, order) (-1 if the group order is not prime)
+def prime_order_attempt(n):
+    curve = (secrets.randbelow(n), secrets.randbelow(n), n)
+    if discriminant(curve) == 0:
+        return -1
+    order = curve_order(curve)
+    if order == -1 or not primality.is_prime(order):
+        return -1
+    return curve, order
+
+
+# Search for a random curve over the prime field GF(n) with prime group order, optionally across a process pool
+def prime_order_curve(n, processes=None):
+    if n < 5 or not primality.is_prime(n):
+        return -1
+    if processes is None or processes < 2:
+        while True:
+            result = prime_order_attempt(n)
+            if result != -1:
+                return result
+    return factorization.parallel_search(prime_order_attempt, (n,), processes)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+from math import gcd, isqrt, prod
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Certainty levels of the primality test
+COMPOSITE = 0
+PROBABLE_PRIME = 1
+PRIME = 2
+
+# Upper bound of the small-prime sieve used as a prefilter
+SIEVE_LIMIT = 1000
+
+# Miller-Rabin bases which are deterministic for all n < 3.317 * 10^24 (in particular for all 64-bit integers)
+DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+
+# Sieve of Eratosthenes for all primes smaller than limit
+def sieve(limit):
+    if limit < 3:
+        return []
+    is_composite = bytearray(limit)
+    for i in range(2, isqrt(limit - 1) + 1):
+        if not is_composite[i]:
+            is_composite[i * i::i] = b'\x01' * len(range(i * i, limit, i))
+    return [i for i in range(2, limit) if not is_composite[i]]
+
+
+SMALL_PRIMES = sieve(SIEVE_LIMIT)
+SMALL_PRIMES_SET = frozenset(SMALL_PRIMES)
+SMALL_PRIMES_PRODUCT = prod(SMALL_PRIMES)
+
+
+# Simple primality test by trial division with 6k ± 1 candidates
+def trial_division(n):
+    # Corner cases
+    if n <= 1:
+        return False
+    if n <= 3:
+        return True
+
+    # This is checked so that we can skip middle five numbers in below loop
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i = i + 6
+    return True
+
+
+# Jacobi symbol (a/n) for an odd integer n > 0
+def jacobi(a, n):
+    a %= n
+    result = 1
+    while a != 0:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+# Strong probable prime test to base a for an odd integer n > 2
+def miller_rabin(n, a):
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = (x * x) % n
+        if x == n - 1:
+            return True
+    return False
+
+
+# Strong Lucas probable prime test with the parameters of Selfridge's method A for an odd integer n > 2
+def strong_lucas(n):
+    # A perfect square would never yield a Jacobi symbol of -1
+    if isqrt(n) ** 2 == n:
+        return False
+
+    # Choose D as the first element of 5, -7, 9, -11, ... such that (D/n) = -1
+    d = 5
+    while True:
+        j = jacobi(d, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    p = 1
+    q = (1 - d) // 4
+
+    # Decomposition of n + 1 = k * 2^s with an odd k
+    k = n + 1
+    s = 0
+    while k % 2 == 0:
+        k //= 2
+        s += 1
+
+    # Calculation of U_k, V_k and Q^k mod n from the most significant bit downwards
+    u, v, q_k = 1, p, q % n
+    for bit in bin(k)[3:]:
+        u = (u * v) % n
+        v = (v * v - 2 * q_k) % n
+        q_k = (q_k * q_k) % n
+        if bit == '1':
+            u, v = (p * u + v) % n, (d * u + p * v) % n
+            u = (u + n) // 2 if u % 2 else u // 2
+            v = (v + n) // 2 if v % 2 else v // 2
+            q_k = (q_k * q) % n
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * q_k) % n
+        q_k = (q_k * q_k) % n
+        if v == 0:
+            return True
+    return False
+
+
+# Tiered primality test returning the certainty level COMPOSITE, PROBABLE_PRIME or PRIME
+def certainty(n):
+    # Small-prime sieve prefilter
+    if n < SIEVE_LIMIT:
+        return PRIME if n in SMALL_PRIMES_SET else COMPOSITE
+    if gcd(n, SMALL_PRIMES_PRODUCT) != 1:
+        return COMPOSITE
+    if n < SIEVE_LIMIT * SIEVE_LIMIT:
+        return PRIME
+
+    # Deterministic Miller-Rabin bases for 64-bit inputs and beyond
+    if n < DETERMINISTIC_LIMIT:
+        return PRIME if all(miller_rabin(n, a) for a in DETERMINISTIC_BASES) else COMPOSITE
+
+    # Baillie-PSW for big inputs (no counterexample is known)
+    if miller_rabin(n, 2) and strong_lucas(n):
+        return PROBABLE_PRIME
+    return COMPOSITE
+
+
+# Primality test
+def is_prime(n):
+    return certainty(n) != COMPOSITE
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from cryptographic_functions.core import primality
+from math import gcd
+import secrets
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Small primes used to sieve the candidate windows (2 is skipped because all candidates are odd)
+SIEVE_PRIMES = primality.sieve(1 << 16)[1:]
+
+# Number of odd candidates per sieve window
+WINDOW_SIZE = 4096
+
+
+# Random odd integer with exactly the given bit length and the two most significant bits set
+def random_candidate(bits):
+    return secrets.randbits(bits) | (3 << (bits - 2)) | 1
+
+
+# Incremental sieve over the window n, n + 2, ..., n + 2 * (size - 1) which only keeps offsets without small factors
+def sieve_window(n, size=WINDOW_SIZE):
+    is_composite = bytearray(size)
+    for p in SIEVE_PRIMES:
+        # First offset i with n + 2 * i ≡ 0 mod p
+        i = ((-n % p) * ((p + 1) // 2)) % p
+        is_composite[i::p] = b'\x01' * len(range(i, size, p))
+    return [i for i in range(size) if not is_composite[i]]
+
+
+# Search a single random sieve window for a prime number (-1 if the window does not contain one)
+def search_window(bits, e=None):
+    n = random_candidate(bits)
+    for i in sieve_window(n):
+        p = n + 2 * i
+        if p.bit_length() != bits:
+            break
+        if e is not None and gcd(e, p - 1) != 1:
+            continue
+        if primality.miller_rabin(p, 2) and primality.is_prime(p):
+            return p
+    return -1
+
+
+# Random prime number with exactly the given bit length and the two most significant bits set, so that the product of
+# two such primes has exactly twice the bit length (optionally such that gcd(e, p - 1) = 1)
+def random_prime(bits, e=None):
+    if bits < 2:
+        return -1
+    if bits <= 16:
+        while True:
+            p = secrets.randbits(bits) | (3 << (bits - 2))
+            if primality.is_prime(p) and (e is None or gcd(e, p - 1) == 1):
+                return p
+
+    p = -1
+    while p == -1:
+        p = search_window(bits, e)
+    return p
+
+
+# Random distinct prime numbers with the given bit length, searched in parallel across a process pool
+def random_primes(bits, count=2, e=None, processes=None):
+    primes = []
+    if processes is None or processes < 2 or bits <= 16:
+        while len(primes) < count:
+            p = random_prime(bits, e)
+            if p not in primes:
+                primes.append(p)
+        return primes
+
+    # Every worker sieves and tests its own random window, so outstanding work is at most one window per process
+    with ProcessPoolExecutor(processes) as executor:
+        pending = {executor.submit(search_window, bits, e) for _ in range(processes)}
+        while len(primes) < count:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                p = future.result()
+                if p != -1 and p not in primes and len(primes) < count:
+                    primes.append(p)
+                if len(primes) < count:
+                    pending.add(executor.submit(search_window, bits, e))
+        for future in pending:
+            future.cancel()
+    return primes
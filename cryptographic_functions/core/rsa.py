@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import shared_functions
+from cryptographic_functions.core import factorization
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import prime_generation
+import numpy as np
+import random
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# RSA keypair generation
+def keypair_generation(p, q, e=None):
+    # Choose two different integers p and q that are prime numbers
+    if not shared_functions.is_prime(p) or not shared_functions.is_prime(q) or p == q:
+        return -1
+
+    # Calculation of n and phi_n (phi_n is the totient of n)
+    n = p * q
+    phi_n = (p - 1) * (q - 1)
+
+    # Choose an integer e such that 1 ≤ e < phi_n and e and phi_n are coprime
+    if e is None:
+        e = random.randrange(1, phi_n)
+    elif e not in range(1, phi_n) or shared_functions.gcd(e, phi_n) != 1:
+        return -1
+    while shared_functions.gcd(e, phi_n) != 1:
+        e = random.randrange(1, phi_n)
+
+    # The private key d is the multiplicative inverse of e in GF(phi_n)
+    d = modulo.mim(phi_n, e)
+    if d == -1:
+        return -1
+    return (e, n), (d, n)
+
+
+# RSA keypair generation with random prime numbers (the private key is returned in CRT form)
+def random_keypair_generation(bits=2048, e=65537, processes=None):
+    # Choose an odd public exponent e > 1 and a modulus of at least 16 bits
+    if bits < 16 or e < 3 or e % 2 == 0:
+        return -1
+
+    # Search two distinct prime numbers p and q such that e and (p - 1) * (q - 1) are coprime
+    if bits % 2 == 0:
+        p, q = prime_generation.random_primes(bits // 2, 2, e, processes)
+    else:
+        p = prime_generation.random_prime(bits // 2 + 1, e)
+        q = prime_generation.random_prime(bits // 2, e)
+    if p < q:
+        p, q = q, p
+
+    # Calculation of n, phi_n and the private key d
+    n = p * q
+    phi_n = (p - 1) * (q - 1)
+    d = modulo.mim(phi_n, e % phi_n)
+
+    # Calculation of the CRT components d_p = d mod (p - 1), d_q = d mod (q - 1) and q_i = q^-1 mod p
+    d_p = d % (p - 1)
+    d_q = d % (q - 1)
+    q_i = modulo.mim(p, q)
+    return (e, n), (d, n, p, q, d_p, d_q, q_i)
+
+
+# RSA encryption
+def encryption(public_key, p):
+    e, n = public_key
+
+    # Choose an integer p such that 0 ≤ p < n
+    if p not in range(n):
+        return -1
+    return modexp.modexp(p, e, n)
+
+
+# RSA private key operation m = c^d mod n using the Chinese remainder theorem and Garner's recombination
+def crt_exponentiation(private_key, c):
+    d, n, p, q, d_p, d_q, q_i = private_key
+    m_p = modexp.modexp(c, d_p, p)
+    m_q = modexp.modexp(c, d_q, q)
+    h = (q_i * (m_p - m_q)) % p
+    return m_q + h * q
+
+
+# RSA decryption (private keys in CRT form are decrypted via the Chinese remainder theorem unless crt is False)
+def decryption(private_key, c, crt=True, e=None):
+    d, n = private_key[:2]
+
+    # Choose an integer c such that 0 ≤ c < n
+    if c not in range(n):
+        return -1
+
+    if crt and len(private_key) == 7:
+        p = crt_exponentiation(private_key, c)
+    else:
+        p = modexp.modexp(c, d, n)
+
+    # Optional fault check by re-encrypting the result with the public exponent e
+    if e is not None and modexp.modexp(p, e, n) != c:
+        return -1
+    return p
+
+
+# RSA signing
+def sign(private_key, m, crt=True, e=None):
+    return decryption(private_key, m, crt, e)
+
+
+# RSA signature verification
+def verify(public_key, m, s):
+    e, n = public_key
+
+    # Choose integers m and s such that 0 ≤ {m, s} < n
+    if m not in range(n) or s not in range(n):
+        return False
+    return modexp.modexp(s, e, n) == m
+
+
+# Conversion of many values into an array after checking 0 ≤ v < n (Python values are checked before the conversion,
+# since negative values cannot be converted into a uint64 array)
+def _checked_array(values, n):
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+        if any(v < 0 or v >= n for v in values):
+            return -1
+    values = modexp.as_array(values, n)
+    if len(values) > 0 and (values.min() < 0 or values.max() >= n):
+        return -1
+    return values
+
+
+# RSA encryption of many plaintexts (lists, generators or NumPy uint64 arrays)
+def encrypt_many(public_key, values):
+    e, n = public_key
+
+    # Choose integers p such that 0 ≤ p < n
+    values = _checked_array(values, n)
+    if isinstance(values, int):
+        return -1
+    return modexp.modexp_many(values, e, n)
+
+
+# RSA decryption of many ciphertexts (lists, generators or NumPy uint64 arrays)
+def decrypt_many(private_key, values, crt=True):
+    d, n = private_key[:2]
+
+    # Choose integers c such that 0 ≤ c < n
+    values = _checked_array(values, n)
+    if isinstance(values, int):
+        return -1
+    if not crt or len(private_key) != 7:
+        return modexp.modexp_many(values, d, n)
+
+    # Chinese remainder theorem and Garner's recombination for all values at once
+    d, n, p, q, d_p, d_q, q_i = private_key
+    m_p = modexp.modexp_many(values % p, d_p, p).astype(values.dtype)
+    m_q = modexp.modexp_many(values % q, d_q, q).astype(values.dtype)
+    if values.dtype == object:
+        h = (q_i * (m_p - m_q)) % p
+    else:
+        h = modexp.mulmod_many((m_p + (p - m_q % p)) % p, np.full_like(m_p, q_i), p)
+    return m_q + h * q
+
+
+# RSA Pollard's rho algorithm
+def pollard_rho(n, x=None, c=23):
+    # Choose an integer n ≥ 2 that is not a prime number
+    if n < 2 or shared_functions.is_prime(n):
+        return -1
+
+    # Brent's variant with automatic restarts for new values of c
+    d = factorization.pollard_rho(n, x, c)
+    if d == -1:
+        return -1
+
+    # Both factors must be prime numbers
+    if not shared_functions.is_prime(d) or not shared_functions.is_prime(n // d):
+        return -1
+    return n // d, d
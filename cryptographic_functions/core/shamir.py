@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions import shared_functions
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import modulo
+import random
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Shamir three-pass keypair generation
+def keypair_generation(p, a=None, b=None):
+    # Choose an integer p that is a prime number
+    if not shared_functions.is_prime(p):
+        return -1
+
+    # Choose an integer a such that 1 ≤ a < p
+    if a is None:
+        a = random.randrange(1, p)
+
+    # Choose an integer b such that 1 ≤ b < p and a != b
+    if b is None:
+        b = a
+        while b == a:
+            b = random.randrange(1, p)
+
+    if a == b or a not in range(1, p) or b not in range(1, p):
+        return -1
+
+    # Secret generation
+    a_i = modulo.mim(p - 1, a)
+    b_i = modulo.mim(p - 1, b)
+    return (a, a_i, p), (b, b_i, p)
+
+
+# Shamir three-pass key exchange
+def key_exchange(key_a, key_b, k=None):
+    a, a_i, p = key_a
+    b, b_i, b_p = key_b
+
+    # The value of p must be identical in both keys
+    if p != b_p:
+        return -1
+
+    # Choose an integer k such that 1 ≤ k < p
+    if k is None:
+        k = random.randrange(1, p)
+
+    if k not in range(1, p):
+        return -1
+
+    # Key exchange
+    a_y1 = modexp.modexp(k, a, p)
+    b_y1 = modexp.modexp(a_y1, b, p)
+    a_y2 = modexp.modexp(b_y1, a_i, p)
+    b_y2 = modexp.modexp(a_y2, b_i, p)
+
+    if k != b_y2:
+        return -1
+    return k
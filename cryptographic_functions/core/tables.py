@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import modexp
+import numpy as np
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Moduli below 2^31 allow exact products of two residues in int64
+INT64_LIMIT = 1 << 31
+
+# Maximum number of table entries per block of rows
+BLOCK_ENTRIES = 1 << 22
+
+
+# Smallest unsigned integer type which holds all residues mod m
+def table_dtype(m):
+    if m <= 1 << 8:
+        return np.uint8
+    if m <= 1 << 16:
+        return np.uint16
+    if m <= 1 << 32:
+        return np.uint32
+    return np.uint64
+
+
+# Number of rows per block such that a block has at most BLOCK_ENTRIES entries
+def block_rows(m):
+    return max(1, BLOCK_ENTRIES // m)
+
+
+# Vectorized modular multiplication with broadcasting (int64 for m < 2^31, 8-bit chunks for m < 2^56)
+def mulmod(a, b, m):
+    if m < INT64_LIMIT:
+        return (a.astype(np.int64) * b.astype(np.int64)) % m
+    return modexp.mulmod_many(a.astype(np.uint64), b.astype(np.uint64), m)
+
+
+# Addition table (y + x) mod m for the rows y and the columns x = 0, ..., m - 1
+def addition_table(m, rows=None):
+    y = np.arange(m, dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+    return ((y[:, None] + np.arange(m, dtype=np.int64)) % m).astype(table_dtype(m))
+
+
+# Multiplication table (y * x) mod m for the rows y and the columns x = 0, ..., m - 1
+def multiplication_table(m, rows=None):
+    y = np.arange(m, dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+    return mulmod(y[:, None], np.arange(m, dtype=np.int64)[None, :], m).astype(table_dtype(m))
+
+
+# Power table x^y mod m for the rows x and the columns y = 1, ..., m - 1 as modular cumulative products
+def power_table(m, rows=None):
+    x = np.arange(1, m, dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+    table = np.empty((len(x), m - 1), dtype=np.int64 if m < INT64_LIMIT else np.uint64)
+    if m < 2:
+        return table.astype(table_dtype(m))
+
+    # The columns x^(k + 1), ..., x^(2k) are the columns x^1, ..., x^k multiplied by x^k
+    table[:, 0] = x % m
+    k = 1
+    while k < m - 1:
+        n = min(k, m - 1 - k)
+        table[:, k:k + n] = mulmod(table[:, :n], table[:, k - 1:k], m)
+        k += n
+    return table.astype(table_dtype(m))
+
+
+# Blocks of consecutive rows of a table, so that large tables are processed with constant memory
+def blocks(table, m, rows):
+    size = block_rows(m)
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size], table(m, rows[start:start + size])
+
+
+# Multiplicative orders of x = 1, ..., m - 1 from the power table (0 for elements which are not units)
+def orders(m):
+    result = np.zeros(max(m - 1, 0), dtype=np.int64)
+    for x, block in blocks(power_table, m, np.arange(1, m)):
+        one = block == 1
+        result[x - 1] = np.where(one.any(axis=1), one.argmax(axis=1) + 1, 0)
+    return result
+
+
+# Multiplicative inverses of a = 0, ..., m - 1 from the multiplication table (-1 if no inverse exists)
+def inverses(m):
+    result = np.full(m, -1, dtype=np.int64)
+    for a, block in blocks(multiplication_table, m, np.arange(m)):
+        one = block == 1
+        result[a] = np.where(one.any(axis=1), one.argmax(axis=1), -1)
+    return result
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+from array import array
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Minimum bit length of the inputs from which Lehmer's algorithm outperforms the plain Euclidean algorithm
+LEHMER_THRESHOLD = 3072
+
+# Bit length of the leading digits on which Lehmer's algorithm simulates the Euclidean steps
+DIGIT_BITS = 62
+
+# Largest value that fits into the signed 64-bit entries of array('q')
+INT64_MAX = (1 << 63) - 1
+
+
+# Extended Euclidean algorithm without recording the intermediate results (returns g, x, y with a*x + b*y = g)
+def euclid(a, b):
+    x_0, x_1 = 1, 0
+    y_0, y_1 = 0, 1
+    while b != 0:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x_0, x_1 = x_1, x_0 - q * x_1
+        y_0, y_1 = y_1, y_0 - q * y_1
+    return a, x_0, y_0
+
+
+# Lehmer's extended Euclidean algorithm, which replaces runs of steps on large numbers by steps on their leading digits
+def lehmer(a, b):
+    a_0, b_0 = a, b
+    y_0, y_1 = 0, 1
+    while b.bit_length() > DIGIT_BITS:
+        shift = a.bit_length() - DIGIT_BITS
+        a_h = a >> shift
+        b_h = b >> shift
+
+        # Simulation of the Euclidean steps on the leading digits as long as both quotient bounds agree
+        m_a, m_b, m_c, m_d = 1, 0, 0, 1
+        while b_h + m_c != 0 and b_h + m_d != 0:
+            q = (a_h + m_a) // (b_h + m_c)
+            if q != (a_h + m_b) // (b_h + m_d):
+                break
+            m_a, m_c = m_c, m_a - q * m_c
+            m_b, m_d = m_d, m_b - q * m_d
+            a_h, b_h = b_h, a_h - q * b_h
+
+        # Apply the accumulated step matrix or fall back to a single full step
+        if m_b == 0:
+            q, r = divmod(a, b)
+            a, b = b, r
+            y_0, y_1 = y_1, y_0 - q * y_1
+        else:
+            a, b = m_a * a + m_b * b, m_c * a + m_d * b
+            y_0, y_1 = m_a * y_0 + m_b * y_1, m_c * y_0 + m_d * y_1
+
+    # The remaining small numbers are finished by the plain Euclidean algorithm
+    g, x, y = euclid(a, b)
+    y = x * y_0 + y * y_1
+    return g, (g - b_0 * y) // a_0 if a_0 != 0 else 0, y
+
+
+# Extended Euclidean algorithm with the method selected by the size of the inputs
+def xgcd(a, b):
+    if a < b:
+        g, y, x = xgcd(b, a)
+        return g, x, y
+    if b.bit_length() >= LEHMER_THRESHOLD:
+        return lehmer(a, b)
+    return euclid(a, b)
+
+
+# Compact record of the Euclidean steps of m and a as array of the quotients (list for quotients beyond 64 bits)
+def trace(m, a):
+    quotients = array('q') if m <= INT64_MAX else []
+    while True:
+        q, r = divmod(m, a)
+        quotients.append(q)
+        if r == 0:
+            return quotients
+        m, a = a, r
+
+
+# Rows i, m, a, q, r, x, y_calc, y of the gcd and linear factorization table rendered from the recorded quotients
+def linear_factorization(m, a, quotients):
+    # Back substitution of the coefficients x and y from the last step to the first one
+    n = len(quotients)
+    list_x = [0] * n
+    list_y = [1] * n
+    list_y_calc = ['1'] * n
+    for i in range(n - 2, -1, -1):
+        list_x[i] = list_y[i + 1]
+        list_y[i] = list_x[i + 1] - quotients[i] * list_x[i]
+        list_y_calc[i] = f'{list_x[i + 1]} - {quotients[i]} * ({list_x[i]}) = {list_y[i]}'
+
+    # The remainders are recalculated step by step from the quotients
+    for i, q in enumerate(quotients):
+        r = m - q * a
+        yield i + 1, m, a, q, r, list_x[i], list_y_calc[i], list_y[i]
+        m, a = a, r
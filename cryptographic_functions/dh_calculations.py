@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 from cryptographic_functions import shared_functions
+from cryptographic_functions.core import dh
+from cryptographic_functions.core import modexp
 from tabulate import tabulate
 import random
 
@@ -10,7 +12,11 @@ __license__ = "GNU GPLv3"
 
 
 # Diffie–Hellman key exchange
-def key_exchange(p, g, a=None, b=None):
+def key_exchange(p, g, a=None, b=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return dh.key_exchange(p, g, a, b)
+
     print(tabulate([['Diffie-Hellman-Schlüsselaustausch']], tablefmt='fancy_grid'))
 
     # Choose an integer p that is a prime number
@@ -49,10 +55,10 @@ def key_exchange(p, g, a=None, b=None):
         return -1
 
     # Secret generation
-    a_secret = (g ** a) % p
-    b_secret = (g ** b) % p
-    a_shared_key = (b_secret ** a) % p
-    b_shared_key = (a_secret ** b) % p
+    a_secret = modexp.fixed_base(g, a, p)
+    b_secret = modexp.fixed_base(g, b, p)
+    a_shared_key = modexp.modexp(b_secret, a, p)
+    b_shared_key = modexp.modexp(a_secret, b, p)
 
     if not a_shared_key == b_shared_key:
         print(f'Bei der Generierung des gemeinsamen Schlüssels ist ein Fehler aufgetreten, da das Ergebnis für '
@@ -77,5 +83,5 @@ def key_exchange(p, g, a=None, b=None):
         f'(A) Berechne: K = β^a mod p = {b_secret}^{a} mod {p} = {a_shared_key}\n'
         f'(B) Berechne: K = α^b mod p = {a_secret}^{b} mod {p} = {b_shared_key}', end='\n\n')
     print(
-        f'Verifikation: K = g^(a * b) mod p = {g}^({a} * {b}) mod {p} = {g ** (a * b) % p}', end='\n\n')
+        f'Verifikation: K = g^(a * b) mod p = {g}^({a} * {b}) mod {p} = {modexp.modexp(g, a * b, p)}', end='\n\n')
     return a_shared_key
@@ -2,21 +2,49 @@
 
 from cryptographic_functions import modulo_inverse_multiplicative
 from cryptographic_functions import shared_functions
+from cryptographic_functions import table_writer
+from cryptographic_functions.core import ecc
+from cryptographic_functions.core import ecdh
+from cryptographic_functions.core import ecdlp
+from cryptographic_functions.core import ecdsa
+from cryptographic_functions.core import factorization
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import point_counting
+from cryptographic_functions.core import primality
+from math import isqrt
 from tabulate import tabulate
+import numpy as np
+import secrets
 
 __author__ = "Lukas Zorn"
 __copyright__ = "Copyright 2021 Lukas Zorn"
 __license__ = "GNU GPLv3"
 
 
+# Notation of an affine point (x|y) or of the point at infinity O
+def point_string(p):
+    return 'O' if p is ecc.INFINITY else f'({p[0]}|{p[1]})'
+
+
 # Extended elliptic curve point verification
-def on_curve(curve, p, print_header=None):
+def on_curve(curve, p, print_header=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecc.on_curve(curve, p)
+
     if not print_header:
         print(tabulate([['Verifikation eines Punktes auf der elliptischen Kurve']], tablefmt='fancy_grid'))
     else:
         print(tabulate([[f'<AUXILIARY {print_header}>Verifikation eines Punktes auf der elliptischen Kurve']],
                        tablefmt='fancy_grid'))
 
+    # The point at infinity is the identity element and lies on every elliptic curve by definition
+    if p is ecc.INFINITY:
+        print('Der Punkt im Unendlichen O ist das neutrale Element und liegt per Definition auf jeder elliptischen '
+              'Kurve.')
+        shared_functions.print_auxiliary(print_header)
+        return True
+
     # Unpack all curve parameters and the point into its components
     a, b, n = curve
     x_p, y_p = p
@@ -42,9 +70,23 @@ def on_curve(curve, p, print_header=None):
 
 
 # Elliptic curve point addition
-def addition(curve, p, q, print_matrix=False, print_linear_factorization=True):
+def addition(curve, p, q, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecc.addition(curve, p, q)
+
     print(tabulate([['Addition von Punkten auf der elliptischen Kurve']], tablefmt='fancy_grid'))
 
+    # The point at infinity O is the identity element of the addition
+    if p is ecc.INFINITY or q is ecc.INFINITY:
+        r = ecc.addition(curve, p, q)
+        if r == -1:
+            print('Beide Punkte müssen auf der elliptischen Kurve liegen.')
+            return -1
+        print(f'Da der Punkt im Unendlichen O das neutrale Element der Addition ist, gilt R = P + Q = '
+              f'{point_string(r)}.', end='\n\n')
+        return r
+
     # Unpack all curve parameters and both points into its components
     a, b, n = curve
     x_p, y_p = p
@@ -60,9 +102,21 @@ def addition(curve, p, q, print_matrix=False, print_linear_factorization=True):
         print(f'Der Punkt Q = ({x_q}|{y_q}) muss auf der elliptischen Kurve liegen.')
         return -1
 
-    # Calculation of m
-    m_n = (y_p - y_q) % n
-    m_d = modulo_inverse_multiplicative.mim(n, (x_p - x_q) % n, print_matrix, print_linear_factorization, 3)
+    # Points with equal x coordinates and opposite y coordinates add up to the point at infinity
+    if x_p % n == x_q % n and (y_p + y_q) % n == 0:
+        print(
+            f'Im endlichen Zahlenkörper GF({n}) gilt Q = ({x_q}|{y_q}) = -P = ({x_p}|{-y_p % n}), sodass die Gerade '
+            f'durch P und Q senkrecht verläuft und R = P + Q der Punkt im Unendlichen O ist.', end='\n\n')
+        return ecc.INFINITY
+
+    # Calculation of m (slope of the secant or of the tangent for P = Q)
+    doubling = p == q
+    if doubling:
+        m_n = (3 * (x_p ** 2) + a) % n
+        m_d = modulo_inverse_multiplicative.mim(n, (2 * y_p) % n, print_matrix, print_linear_factorization, 3)
+    else:
+        m_n = (y_p - y_q) % n
+        m_d = modulo_inverse_multiplicative.mim(n, (x_p - x_q) % n, print_matrix, print_linear_factorization, 3)
     m = (m_n * m_d) % n
 
     # Calculation of x_r, y_r and y_r_i
@@ -85,15 +139,27 @@ def addition(curve, p, q, print_matrix=False, print_linear_factorization=True):
         f'<AUXILIARY 1>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 1>\n'
         f'(2) Verifiziere, dass Q = ({x_q}|{y_q}) auf der elliptischen Kurve liegt:\n'
         f'<AUXILIARY 2>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 2>', end='\n\n')
-    print(
-        f'Für die additive Verknüpfung der beiden Punkte wird nun die Steigung m in GF({n}) berechnet:\n'
-        f'm = (y_p - y_q) / (x_p - x_q) % n\n'
-        f'm = (y_p - y_q) * (x_p - x_q)^-1 % n\n'
-        f'm = ({y_p} - {y_q}) * ({x_p} - {x_q})^-1 % {n}\n'
-        f'm = {m_n} * {x_p - x_q}^-1 % {n}\n'
-        f'<AUXILIARY 3>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 3>\n'
-        f'm = {m_n} * {m_d} % {n}\n'
-        f'm = {m}', end='\n\n')
+    if doubling:
+        print(
+            f'Da P = Q gilt, wird für die Verdopplung des Punktes nun die Steigung m der Tangente in GF({n}) '
+            f'berechnet:\n'
+            f'm = (3 * x_p^2 + a) / (2 * y_p) % n\n'
+            f'm = (3 * x_p^2 + a) * (2 * y_p)^-1 % n\n'
+            f'm = (3 * {x_p}^2 + {a}) * (2 * {y_p})^-1 % {n}\n'
+            f'm = {m_n} * {2 * y_p}^-1 % {n}\n'
+            f'<AUXILIARY 3>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 3>\n'
+            f'm = {m_n} * {m_d} % {n}\n'
+            f'm = {m}', end='\n\n')
+    else:
+        print(
+            f'Für die additive Verknüpfung der beiden Punkte wird nun die Steigung m in GF({n}) berechnet:\n'
+            f'm = (y_p - y_q) / (x_p - x_q) % n\n'
+            f'm = (y_p - y_q) * (x_p - x_q)^-1 % n\n'
+            f'm = ({y_p} - {y_q}) * ({x_p} - {x_q})^-1 % {n}\n'
+            f'm = {m_n} * {x_p - x_q}^-1 % {n}\n'
+            f'<AUXILIARY 3>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 3>\n'
+            f'm = {m_n} * {m_d} % {n}\n'
+            f'm = {m}', end='\n\n')
     print(
         f'Daraus folgt für die Berechnung von -R = (x_r|y_r):\n'
         f'x_r = ((m ** 2) - x_p - x_q) % n\n'
@@ -114,3 +180,575 @@ def addition(curve, p, q, print_matrix=False, print_linear_factorization=True):
         f'(3) Verifiziere, dass R = ({x_r}|{y_r_i}) auf der elliptischen Kurve liegt:\n'
         f'<AUXILIARY 4>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 4>', end='\n\n')
     return x_r, y_r_i
+
+
+# Elliptic curve scalar multiplication
+def scalar_mul(curve, k, p, mode='wnaf', quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecc.scalar_mul(curve, k, p, mode)
+
+    print(tabulate([['Skalarmultiplikation von Punkten auf der elliptischen Kurve']], tablefmt='fancy_grid'))
+
+    # Choose a point p that lies on the elliptic curve
+    if not on_curve(curve, p, 1):
+        print(f'Der Punkt P = {point_string(p)} muss auf der elliptischen Kurve liegen.')
+        return -1
+
+    # Calculation of k * P with the intermediate results of every step
+    trace = []
+    r = ecc.scalar_mul(curve, k, p, mode, trace)
+    if r == -1:
+        print(f'Das Vielfache k * P = {k} * {point_string(p)} konnte nicht berechnet werden.')
+        return -1
+
+    # Calculation path output
+    a, b, n = curve
+    print(
+        f'Im endlichen Zahlenkörper GF({n}) soll auf Basis der Kurve y^2 = x^3 + {a} * x + {b} das Vielfache '
+        f'R = k * P = {k} * {point_string(p)} berechnet werden.\n'
+        f'(1) Verifiziere, dass P = {point_string(p)} auf der elliptischen Kurve liegt:\n'
+        f'<AUXILIARY 1>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 1>', end='\n\n')
+    if k < 0:
+        print(f'Da k = {k} negativ ist, wird R = {-k} * (-P) = {-k} * {point_string(ecc.negation(curve, p))} '
+              f'berechnet.', end='\n\n')
+    if mode == 'ladder':
+        print(
+            f'Die Montgomery-Leiter durchläuft alle Bits von |k| = {abs(k)} = {abs(k):b}_2 und führt für jedes Bit '
+            f'genau eine Addition und eine Verdopplung aus (R_0 = O, R_1 = P):\n'
+            f'Bit 0: R_1 = R_0 + R_1, R_0 = 2 * R_0\n'
+            f'Bit 1: R_0 = R_0 + R_1, R_1 = 2 * R_1', end='\n\n')
+        headers = ['Schritt', 'Bit', 'R_0']
+    elif mode == 'comb':
+        print(
+            f'Für den festen Basispunkt P wird die Kammtabelle T_j der Summen von 2^(i * d) * P einmalig berechnet. '
+            f'Anschließend werden für jede Spalte j der Bits von |k| = {abs(k)} eine Verdopplung und eine Addition '
+            f'des Tabelleneintrags T_j ausgeführt:', end='\n\n')
+        headers = ['Schritt', 'j', 'R = 2 * R + T_j']
+    else:
+        digits = ecc.wnaf(abs(k))
+        print(
+            f'Der Skalar |k| = {abs(k)} wird in der Non-Adjacent-Form der Breite w = {ecc.WNAF_WIDTH} dargestellt, '
+            f'sodass höchstens eine von w aufeinanderfolgenden Ziffern ungleich 0 ist:\n'
+            f'|k| = {" + ".join(f"({d}) * 2^{i}" for i, d in reversed(list(enumerate(digits))) if d)}\n'
+            f'Für jede Ziffer d wird R verdoppelt und anschließend d * P aus der Tabelle der ungeraden Vielfachen '
+            f'P, 3P, ..., {(1 << (ecc.WNAF_WIDTH - 1)) - 1}P addiert:', end='\n\n')
+        headers = ['Schritt', 'd', 'R = 2 * R + d * P']
+
+    # The intermediate results are normalized with a single inversion for all of them
+    points = ecc.to_affine_many(curve, [q for _, q in trace])
+    print(tabulate([(i + 1, d, point_string(q)) for i, ((d, _), q) in enumerate(zip(trace, points))],
+                   headers=headers, tablefmt='pretty'), end='\n\n')
+    print(f'Daraus folgt R = k * P = {k} * {point_string(p)} = {point_string(r)}.', end='\n\n')
+    return r
+
+
+# Elliptic curve multi-scalar multiplication
+def multi_scalar_mul(curve, scalars, points, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecc.multi_scalar_mul(curve, scalars, points)
+
+    print(tabulate([['Mehrfach-Skalarmultiplikation von Punkten auf der elliptischen Kurve']], tablefmt='fancy_grid'))
+
+    scalars, points = list(scalars), list(points)
+    r = ecc.multi_scalar_mul(curve, scalars, points)
+    if r == -1:
+        print('Alle Punkte P_i müssen auf der elliptischen Kurve liegen und zu jedem Punkt muss genau ein Skalar k_i '
+              'gegeben sein.')
+        return -1
+
+    # Calculation path output
+    a, b, n = curve
+    method = 'Straus (gemeinsame Verdopplungen)' if len(points) <= ecc.STRAUS_LIMIT else 'Pippenger (Buckets)'
+    print(
+        f'Im endlichen Zahlenkörper GF({n}) soll auf Basis der Kurve y^2 = x^3 + {a} * x + {b} die Summe '
+        f'R = k_1 * P_1 + ... + k_{len(points)} * P_{len(points)} mit dem Verfahren von {method} berechnet werden.',
+        end='\n\n')
+    print(tabulate([(i + 1, k, point_string(q)) for i, (k, q) in enumerate(zip(scalars, points))],
+                   headers=['i', 'k_i', 'P_i'], tablefmt='pretty'), end='\n\n')
+    print(f'Daraus folgt R = {point_string(r)}.', end='\n\n')
+    return r
+
+
+# Number of points of an elliptic curve
+def curve_order(curve, print_matrix=False, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return point_counting.curve_order(curve)
+
+    print(tabulate([['Bestimmung der Gruppenordnung der elliptischen Kurve']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    a, b, n = curve
+    if n < 5 or not primality.is_prime(n):
+        print(f'Die Variable n = {n} muss eine Primzahl größer 3 sein.')
+        return -1
+
+    if point_counting.discriminant(curve) == 0:
+        print(f'Die Kurve y^2 = x^3 + {a} * x + {b} ist im GF({n}) singulär, da 4 * a^3 + 27 * b^2 ≡ 0 mod {n}.')
+        return -1
+
+    order = point_counting.curve_order(curve)
+    if order == -1:
+        print(f'Die Gruppenordnung der Kurve y^2 = x^3 + {a} * x + {b} im GF({n}) konnte nicht bestimmt werden.')
+        return -1
+
+    # Calculation path output
+    w = isqrt(4 * n)
+    print(
+        f'Nach dem Satz von Hasse liegt die Anzahl #E der Punkte der Kurve y^2 = x^3 + {a} * x + {b} im GF({n}) '
+        f'einschließlich des Punktes im Unendlichen O im Intervall n + 1 - 2√n ≤ #E ≤ n + 1 + 2√n:\n'
+        f'{n + 1 - w} ≤ #E ≤ {n + 1 + w}', end='\n\n')
+    if n < point_counting.LEGENDRE_LIMIT:
+        print(
+            f'Zu jedem x gibt es 1 + (x^3 + a * x + b / n) Punkte, wobei das Legendre-Symbol (v / n) für quadratische '
+            f'Reste 1, für Nichtreste -1 und für v = 0 den Wert 0 annimmt. Die Summe wird für alle x gleichzeitig aus '
+            f'der Tabelle der Quadrate mod {n} berechnet:\n'
+            f'#E = n + 1 + Σ (x^3 + a * x + b / n)\n'
+            f'#E = {n} + 1 + ({order - n - 1})\n'
+            f'#E = {order}', end='\n\n')
+        if print_matrix:
+            # Table matrix output
+            x = np.arange(n, dtype=np.int64)
+            v = point_counting.right_hand_side(curve, x)
+            symbols = np.where(v == 0, 0, np.where(point_counting.square_roots_table(n)[v] >= 0, 1, -1))
+            print(tabulate(zip(x.tolist(), v.tolist(), symbols.tolist(), (symbols + 1).tolist()),
+                           headers=['x', 'x^3 + a * x + b', '(x^3 + a * x + b / n)', 'Punkte'], tablefmt='pretty'),
+                  end='\n\n')
+    elif n < point_counting.SHANKS_MESTRE_LIMIT:
+        print(
+            f'Für zufällige Punkte P der Kurve und ihres quadratischen Twists wird mittels Babystep-Giantstep das '
+            f'Vielfache k * P = O im Hasse-Intervall bestimmt, bis nur noch ein Kandidat übrig ist (Shanks-Mestre):\n'
+            f'#E = {order}', end='\n\n')
+    else:
+        print(
+            f'Mittels des Schoof-Algorithmus wird die Spur t = n + 1 - #E modulo kleiner Primzahlen l aus der '
+            f'Gleichung π^2 - t * π + n = 0 auf den l-Torsionspunkten bestimmt. Die verbleibenden Kandidaten im '
+            f'Hasse-Intervall werden mittels Babystep-Giantstep geprüft:\n'
+            f'#E = {order}', end='\n\n')
+
+    factors = factorization.factorize(order)
+    print(
+        f'Daraus folgt die Spur t = n + 1 - #E = {n + 1 - order} und die Primfaktorzerlegung '
+        f'#E = {" * ".join(f"{q}^{e}" if e > 1 else f"{q}" for q, e in factors)}.')
+    if len(factors) == 1 and factors[0][1] == 1:
+        print('Die Gruppenordnung ist eine Primzahl, sodass jeder Punkt P ≠ O die Gruppe erzeugt.', end='\n\n')
+    else:
+        print(f'Die Ordnung eines Punktes ist ein Teiler von #E = {order}.', end='\n\n')
+    return order
+
+
+# Search for an elliptic curve with a prime number of points
+def prime_order_curve(n, processes=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return point_counting.prime_order_curve(n, processes)
+
+    print(tabulate([['Suche einer elliptischen Kurve mit Primzahlordnung']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    if n < 5 or not primality.is_prime(n):
+        print(f'Die Variable n = {n} muss eine Primzahl größer 3 sein.')
+        return -1
+
+    result = point_counting.prime_order_curve(n, processes)
+    if result == -1:
+        print(f'Es konnte keine elliptische Kurve mit Primzahlordnung im GF({n}) gefunden werden.')
+        return -1
+
+    # Calculation path output
+    (a, b, _), order = result
+    print(
+        f'Für zufällige Kurven y^2 = x^3 + a * x + b im GF({n}) wird die Gruppenordnung #E bestimmt, bis sie eine '
+        f'Primzahl ist:\n'
+        f'y^2 = x^3 + {a} * x + {b} mit #E = {order}', end='\n\n')
+    return result
+
+
+# All points of an elliptic curve
+def curve_points(curve, print_matrix=True, matrix_output=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return point_counting.curve_points(curve)
+
+    print(tabulate([['Punkte der elliptischen Kurve']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    a, b, n = curve
+    if n < 5 or not primality.is_prime(n):
+        print(f'Die Variable n = {n} muss eine Primzahl größer 3 sein.')
+        return -1
+
+    if point_counting.discriminant(curve) == 0:
+        print(f'Die Kurve y^2 = x^3 + {a} * x + {b} ist im GF({n}) singulär, da 4 * a^3 + 27 * b^2 ≡ 0 mod {n}.')
+        return -1
+
+    points = point_counting.curve_points(curve)
+
+    # Calculation path output
+    if n < point_counting.ROOT_TABLE_LIMIT:
+        method = f'in der einmalig berechneten Tabelle der Quadratwurzeln mod {n} nachgeschlagen'
+    else:
+        method = 'mittels des Euler-Kriteriums geprüft und mit dem Tonelli-Shanks-Algorithmus berechnet'
+    print(
+        f'Für alle x = 0, ..., {n - 1} wird die rechte Seite x^3 + {a} * x + {b} mod {n} gleichzeitig berechnet und '
+        f'ihre Quadratwurzeln y und {n} - y werden {method}. Die Kurve besitzt {len(points)} affine Punkte und '
+        f'zusammen mit dem Punkt im Unendlichen O somit #E = {len(points) + 1} Punkte.', end='\n\n')
+    if print_matrix:
+        # Table matrix output, whose rows are generated and written lazily
+        headers = ['i', 'x', 'y']
+        shared_functions.print_table(f'Punktetabelle der Kurve y^2 = x^3 + {a} * x + {b} im GF({n})', headers,
+                                     table_writer.curve_point_rows(curve),
+                                     [max(len(str(len(points))), 1)] + table_writer.column_widths(headers[1:], n),
+                                     matrix_output)
+    return points
+
+
+# Elliptic curve discrete logarithm k with k * P = Q
+def discrete_log(curve, p, q, processes=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecdlp.discrete_log(curve, p, q, processes)
+
+    print(tabulate([['Diskreter Logarithmus auf der elliptischen Kurve']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    a, b, n = curve
+    if n < 5 or not primality.is_prime(n):
+        print(f'Die Variable n = {n} muss eine Primzahl größer 3 sein.')
+        return -1
+
+    if not ecc.on_curve(curve, p) or not ecc.on_curve(curve, q):
+        print(f'Die Punkte P = {point_string(p)} und Q = {point_string(q)} müssen auf der Kurve '
+              f'y^2 = x^3 + {a} * x + {b} im GF({n}) liegen.')
+        return -1
+
+    # Calculation of k with the intermediate results of every prime power r^e of ord(P)
+    trace = []
+    k = ecdlp.discrete_log(curve, p, q, processes, trace)
+    if k == -1:
+        print(f'Es existiert kein k mit k * P = Q für P = {point_string(p)} und Q = {point_string(q)}.')
+        return -1
+
+    # Calculation path output
+    order = 1
+    for r, e, _, _, _, _ in trace:
+        order *= r ** e
+    print(
+        f'Gegeben sind die Punkte P = {point_string(p)} und Q = {point_string(q)} der Kurve '
+        f'y^2 = x^3 + {a} * x + {b} im GF({n}). Die Ordnung von P zerfällt in ord(P) = {order} = '
+        f'{" * ".join(f"{r}^{e}" if e > 1 else f"{r}" for r, e, _, _, _, _ in trace) or "1"}, sodass der diskrete '
+        f'Logarithmus für jede Primzahlpotenz r^e einzeln bestimmt werden kann (Babystep-Giantstep mit '
+        f'Negationsabbildung für kleine r, Pollard-Rho mit ausgezeichneten Punkten für große r).', end='\n\n')
+    print(tabulate([(f'{r}^{e}', k_r, method, iterations, expected)
+                    for r, e, k_r, method, iterations, expected in trace],
+                   headers=['r^e', 'k_r ≡ k mod r^e', 'Verfahren', 'Iterationen', 'Erwartete Iterationen'],
+                   tablefmt='pretty'), end='\n\n')
+    print(
+        f'Mittels des chinesischen Restsatzes ergibt sich aus den Kongruenzen k ≡ k_r mod r^e der diskrete Logarithmus '
+        f'k = {k}.', end='\n\n')
+    print(
+        f'Verifikation:\n'
+        f'Q = k * P\n'
+        f'Q = {k} * {point_string(p)}\n'
+        f'{point_string(q)} = {point_string(ecc.scalar_mul(curve, k, p))}', end='\n\n')
+    return k
+
+
+# Checking the domain parameters with the calculation path output of a violated requirement
+def _valid_domain(curve, g, n):
+    a, b, p = curve
+    if p < 5 or not primality.is_prime(p):
+        print(f'Die Variable p = {p} muss eine Primzahl größer 3 sein.')
+        return False
+    if n < 5 or not primality.is_prime(n):
+        print(f'Die Variable n = {n} muss eine Primzahl größer 3 sein.')
+        return False
+    if not ecdh.valid_domain(curve, g, n):
+        print(f'Der Punkt G = {point_string(g)} muss auf der Kurve y^2 = x^3 + {a} * x + {b} im GF({p}) liegen und '
+              f'die Ordnung n = {n} besitzen.')
+        return False
+    return True
+
+
+# Elliptic curve Diffie–Hellman key exchange
+def key_exchange(curve, g, n, a=None, b=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecdh.key_exchange(curve, g, n, a, b)
+
+    print(tabulate([['ECDH-Schlüsselaustausch']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    if not _valid_domain(curve, g, n):
+        return -1
+
+    # Choose integers a and b such that 1 ≤ {a, b} < n and a != b
+    if a is None:
+        a = secrets.randbelow(n - 1) + 1
+    if b is None:
+        b = a
+        while b == a:
+            b = secrets.randbelow(n - 1) + 1
+
+    if a == b:
+        print(f'Die Variablen a = {a} und b = {b} dürfen nicht identisch sein.')
+        return -1
+
+    if a not in range(1, n) or b not in range(1, n):
+        print(f'Für die Variablen a = {a} und b = {b} muss gelten 1 ≤ {{a, b}} < {n}.')
+        return -1
+
+    # Secret generation
+    a_secret = ecc.scalar_mul(curve, a, g, 'comb')
+    b_secret = ecc.scalar_mul(curve, b, g, 'comb')
+    a_shared_key = ecc.scalar_mul(curve, a, b_secret)
+    b_shared_key = ecc.scalar_mul(curve, b, a_secret)
+
+    # Calculation path output
+    c_a, c_b, p = curve
+    print(
+        f'A und B vereinbaren öffentlich die Kurve y^2 = x^3 + {c_a} * x + {c_b} im GF({p}) und den Basispunkt '
+        f'G = {point_string(g)} der Primzahlordnung n = {n}.', end='\n\n')
+    print(
+        f'(A) Wähle: a = {a}\n'
+        f'(B) Wähle: b = {b}', end='\n\n')
+    print(
+        f'(A) Berechne: α = a * G = {a} * {point_string(g)} = {point_string(a_secret)}\n'
+        f'(B) Berechne: β = b * G = {b} * {point_string(g)} = {point_string(b_secret)}', end='\n\n')
+    print(
+        f'(A) Berechne: K = a * β = {a} * {point_string(b_secret)} = {point_string(a_shared_key)}\n'
+        f'(B) Berechne: K = b * α = {b} * {point_string(a_secret)} = {point_string(b_shared_key)}', end='\n\n')
+
+    if a_shared_key != b_shared_key or a_shared_key is ecc.INFINITY:
+        print('Bei der Generierung des gemeinsamen Schlüssels ist ein Fehler aufgetreten.')
+        return -1
+
+    print(f'Der gemeinsame Schlüssel ist die x-Koordinate von K, also K_x = {a_shared_key[0]}.', end='\n\n')
+    return a_shared_key[0]
+
+
+# ECDSA keypair generation
+def keypair_generation(curve, g, n, d=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecdsa.keypair_generation(curve, g, n, d)
+
+    print(tabulate([['ECDSA Schlüsselgenerierung']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    if not _valid_domain(curve, g, n):
+        return -1
+
+    # Choose an integer d such that 1 ≤ d < n
+    if d is None:
+        d = secrets.randbelow(n - 1) + 1
+
+    if d not in range(1, n):
+        print(f'Für die Variable d = {d} muss gelten 1 ≤ {d} < {n}.')
+        return -1
+
+    public_key, private_key = ecdsa.keypair_generation(curve, g, n, d)
+
+    # Calculation path output
+    q = public_key[3]
+    print(
+        f'Der private Schlüssel d = {d} wird zufällig aus 1 ≤ d < n = {n} gewählt, der öffentliche Schlüssel ist der '
+        f'Punkt Q = d * G:\n'
+        f'Q = {d} * {point_string(g)}\n'
+        f'Q = {point_string(q)}', end='\n\n')
+    print(
+        f'K(pub) = {{E, G, n, Q}} = {{{curve}, {point_string(g)}, {n}, {point_string(q)}}}\n'
+        f'K(priv) = {{n, d}} = {{{n}, {d}}}', end='\n\n')
+    return public_key, private_key
+
+
+# ECDSA signature signing
+def sign(public_key, private_key, m, k=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecdsa.sign(public_key, private_key, m, k)
+
+    print(tabulate([['ECDSA Signierung']], tablefmt='fancy_grid'))
+
+    # Unpack both keys into its components
+    curve, g, n, q = public_key
+    n_v, d = private_key
+
+    # The value of n must be identical in both keys
+    if n != n_v:
+        print(f'Die Variablen n = {n} und n_v = {n_v} müssen identisch sein.')
+        return -1
+
+    # Choose an integer k such that 1 ≤ k < n
+    if k is not None and k not in range(1, n):
+        print(f'Für die Variable k = {k} muss gelten 1 ≤ {k} < {n}.')
+        return -1
+
+    # Signing, the random number is drawn here, so that it can be shown in the calculation path
+    if k is None:
+        signature = -1
+        while signature == -1:
+            k = secrets.randbelow(n - 1) + 1
+            signature = ecdsa.sign(public_key, private_key, m, k)
+    else:
+        signature = ecdsa.sign(public_key, private_key, m, k)
+    if signature == -1:
+        print(f'Das selbstgewählte k = {k} führt zu r = 0 oder s = 0 und muss neu gewählt werden.')
+        return -1
+
+    # Calculation path output
+    r, s, v = signature
+    k_point = ecc.scalar_mul(curve, k, g, 'comb')
+    print(
+        f'Die Signierung für den Hashwert m = {m} mittels K(priv) = {{n, d}} = {{{n}, {d}}} mit der Zufallszahl '
+        f'k = {k}.', end='\n\n')
+    print(
+        f'R = k * G\n'
+        f'R = {k} * {point_string(g)}\n'
+        f'R = {point_string(k_point)}\n'
+        f'r = x_R mod n = {k_point[0]} mod {n} = {r}', end='\n\n')
+    print(
+        f's = k^-1 * (m + r * d) mod n\n'
+        f's = {modulo.mim(n, k)} * ({m % n} + {r} * {d}) mod {n}\n'
+        f's = {s}', end='\n\n')
+    print(
+        f'Die Signatur (r, s, v) = ({r}, {s}, {v}) enthält zusätzlich das Flag v, welches die Parität von y_R und '
+        f'x_R ≥ n kodiert, sodass der Punkt R für die Stapelverifizierung wiederhergestellt werden kann.', end='\n\n')
+    return signature
+
+
+# ECDSA signature verifying
+def verify(public_key, m, signature, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecdsa.verify(public_key, m, signature)
+
+    print(tabulate([['ECDSA Verifizierung']], tablefmt='fancy_grid'))
+
+    # Unpack the public key and the signature into its components
+    curve, g, n, q = public_key
+    r, s = signature[0], signature[1]
+
+    # Choose integers r and s such that 1 ≤ {r, s} < n
+    if r not in range(1, n) or s not in range(1, n):
+        print(f'Für die Variablen r = {r} und s = {s} muss gelten 1 ≤ {{r, s}} < {n}.')
+        return False
+
+    # The public key Q must be a point on the curve other than O
+    if q is ecc.INFINITY or not ecc.on_curve(curve, q):
+        a, b, p = curve
+        print(f'Der öffentliche Schlüssel Q = {point_string(q)} muss ein Punkt ungleich O auf der Kurve y^2 = x^3 + '
+              f'{a} * x + {b} im GF({p}) sein.')
+        return False
+
+    # The verification point can only be computed for valid domain parameters
+    x = ecdsa.verification_point(public_key, m, signature)
+    if x == -1:
+        print(f'Der Punkt X = u_1 * G + u_2 * Q kann für den Basispunkt G = {point_string(g)} nicht berechnet werden.')
+        return False
+
+    valid = ecdsa.verify(public_key, m, signature)
+
+    # Calculation path output
+    w = modulo.mim(n, s)
+    u_1, u_2 = (m * w) % n, (r * w) % n
+    print(
+        f'Zur Verifizierung der Signatur (r, s) = ({r}, {s}) für den Hashwert m = {m} mittels K(pub) = '
+        f'{{E, G, n, Q}} = {{{curve}, {point_string(g)}, {n}, {point_string(q)}}} wird geprüft, ob die '
+        f'x-Koordinate von X = u_1 * G + u_2 * Q kongruent zu r ist.', end='\n\n')
+    print(
+        f'w = s^-1 mod n = {w}\n'
+        f'u_1 = m * w mod n = {u_1}\n'
+        f'u_2 = r * w mod n = {u_2}\n'
+        f'X = {u_1} * {point_string(g)} + {u_2} * {point_string(q)} = {point_string(x)}', end='\n\n')
+    if valid:
+        print(f'Aufgrund von x_X ≡ r = {r} mod {n} kann die Integrität der Signatur bestätigt werden.', end='\n\n')
+    else:
+        print(f'Da x_X ≢ r = {r} mod {n}, kann die Integrität der Signatur nicht bestätigt werden.', end='\n\n')
+    return valid
+
+
+# ECDSA batch verification of (public key, m, signature) triples
+def batch_verify(batch, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecdsa.batch_verify(batch)
+
+    print(tabulate([['ECDSA Stapelverifizierung']], tablefmt='fancy_grid'))
+
+    batch = list(batch)
+    combined = ecdsa.batch_equation(batch)
+    valid = combined or all(ecdsa.verify(public_key, m, signature) for public_key, m, signature in batch)
+
+    # Calculation path output
+    print(
+        f'Die {len(batch)} Signaturen werden gemeinsam geprüft: Für jede Signatur wird der Punkt R_i aus r_i und dem '
+        f'Flag v_i wiederhergestellt und mit einem zufälligen {ecdsa.BATCH_WEIGHT_BITS}-Bit-Gewicht z_i versehen. '
+        f'Die Summe sum(z_i * (u_1,i * G + u_2,i * Q_i - R_i)) wird als eine einzige Mehrfach-Skalarmultiplikation '
+        f'berechnet und muss den Punkt im Unendlichen O ergeben.', end='\n\n')
+    if combined:
+        print(f'Die Summe ergibt O, alle {len(batch)} Signaturen sind gültig.', end='\n\n')
+    elif valid:
+        print(
+            f'Die Summe ergibt nicht O, da mindestens eine Signatur kein passendes Flag v_i besitzt. Die einzelne '
+            f'Verifizierung bestätigt jedoch alle {len(batch)} Signaturen.', end='\n\n')
+    else:
+        print('Die Summe ergibt nicht O und mindestens eine Signatur ist auch einzeln ungültig.', end='\n\n')
+    return valid
+
+
+# Compressed point encoding
+def compress(curve, p, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecc.compress(curve, p)
+
+    print(tabulate([['Punktkompression']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    a, b, n = curve
+    if not ecc.on_curve(curve, p):
+        print(f'Der Punkt P = {point_string(p)} liegt nicht auf der Kurve y^2 = x^3 + {a} * x + {b} im GF({n}).')
+        return -1
+
+    data = ecc.compress(curve, p)
+
+    # Calculation path output
+    if p is ecc.INFINITY:
+        print('Der Punkt im Unendlichen O wird als einzelnes Byte 00 kodiert.', end='\n\n')
+    else:
+        print(
+            f'Von P = {point_string(p)} wird nur die x-Koordinate mit {ecc.field_bytes(curve)} Bytes und die Parität '
+            f'von y im Präfix gespeichert (02 für gerades, 03 für ungerades y):\n'
+            f'P = {data.hex().upper()}', end='\n\n')
+    return data
+
+
+# Decompression of a compressed point encoding
+def decompress(curve, data, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return ecc.decompress(curve, data)
+
+    print(tabulate([['Punktdekompression']], tablefmt='fancy_grid'))
+
+    a, b, n = curve
+    p = ecc.decompress(curve, data)
+    if p == -1:
+        print(f'Die Kodierung {data.hex().upper()} gehört zu keinem Punkt der Kurve y^2 = x^3 + {a} * x + {b} im '
+              f'GF({n}).')
+        return -1
+
+    # Calculation path output
+    if p is ecc.INFINITY:
+        print('Das Byte 00 kodiert den Punkt im Unendlichen O.', end='\n\n')
+    else:
+        x, y = p
+        print(
+            f'Aus x = {x} ergibt sich die rechte Seite y^2 = x^3 + {a} * x + {b} mod {n} = '
+            f'{(x ** 3 + a * x + b) % n}, deren Quadratwurzeln y und {n} - y sind. Das Präfix {data[0]:02X} wählt die '
+            f'Wurzel mit {"ungerader" if data[0] == 3 else "gerader"} Parität:\n'
+            f'P = {point_string(p)}', end='\n\n')
+    return p
@@ -2,6 +2,8 @@
 
 from cryptographic_functions import modulo_inverse_multiplicative
 from cryptographic_functions import shared_functions
+from cryptographic_functions.core import elgamal
+from cryptographic_functions.core import modexp
 from math import ceil, sqrt
 from tabulate import tabulate
 import random
@@ -12,7 +14,11 @@ __license__ = "GNU GPLv3"
 
 
 # ElGamal keypair generation
-def keypair_generation(p, g, d=None):
+def keypair_generation(p, g, d=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.keypair_generation(p, g, d)
+
     print(tabulate([['ElGamal Schlüsselerzeugung']], tablefmt='fancy_grid'))
 
     # Choose an integer p that is a prime number
@@ -34,7 +40,7 @@ def keypair_generation(p, g, d=None):
         return -1
 
     # Secret generation
-    e = (g ** d) % p
+    e = modexp.fixed_base(g, d, p)
 
     # Calculation path output
     print(
@@ -52,7 +58,11 @@ def keypair_generation(p, g, d=None):
 
 
 # ElGamal encryption
-def encryption(public_key, m, k=None):
+def encryption(public_key, m, k=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.encryption(public_key, m, k)
+
     print(tabulate([['ElGamal Verschlüsselung']], tablefmt='fancy_grid'))
 
     # Unpack the public key into its components
@@ -80,8 +90,7 @@ def encryption(public_key, m, k=None):
         return -1
 
     # Encryption
-    a = (g ** k) % p
-    b = ((e ** k) * m) % p
+    a, b = elgamal.encryption(public_key, m, k)
 
     # Calculation path output
     print(
@@ -97,12 +106,16 @@ def encryption(public_key, m, k=None):
         f'b = {e}^{k} ⊙ {m} mod {p}\n'
         f'b = {b}', end='\n\n')
     print(
-        f'K = e^k = {e}^{k} = {(e ** k) % p} mod {p}', end='\n\n')
+        f'K = e^k = {e}^{k} = {modexp.modexp(e, k, p)} mod {p}', end='\n\n')
     return a, b
 
 
 # ElGamal decryption
-def decryption(private_key, c, print_matrix=False, print_linear_factorization=True):
+def decryption(private_key, c, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.decryption(private_key, c)
+
     print(tabulate([['ElGamal Entschlüsselung']], tablefmt='fancy_grid'))
 
     # Unpack the private key into its components
@@ -122,7 +135,7 @@ def decryption(private_key, c, print_matrix=False, print_linear_factorization=Tr
         return -1
 
     # Decryption
-    a_d = (a ** d) % p
+    a_d = modexp.modexp(a, d, p)
     a_i = modulo_inverse_multiplicative.mim(p, a_d, print_matrix, print_linear_factorization, 1)
     m = (a_i * b) % p
 
@@ -147,7 +160,11 @@ def decryption(private_key, c, print_matrix=False, print_linear_factorization=Tr
 
 
 # ElGamal signature signing
-def sign(public_key, private_key, m, r=None, print_matrix=False, print_linear_factorization=True):
+def sign(public_key, private_key, m, r=None, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.sign(public_key, private_key, m, r)
+
     print(tabulate([['ElGamal Signierung']], tablefmt='fancy_grid'))
 
     # Unpack both keys into its components
@@ -184,8 +201,7 @@ def sign(public_key, private_key, m, r=None, print_matrix=False, print_linear_fa
     r_i = modulo_inverse_multiplicative.mim(p - 1, r, print_matrix, print_linear_factorization, 1)
 
     # Signing
-    p_nb = (g ** r) % p
-    s = ((m - d * p_nb) * r_i) % (p - 1)
+    m, p_nb, s = elgamal.sign(public_key, private_key, m, r)
 
     # Calculation path output
     print(
@@ -218,7 +234,11 @@ def sign(public_key, private_key, m, r=None, print_matrix=False, print_linear_fa
 
 
 # ElGamal signature verifying
-def verify(public_key, signed_message):
+def verify(public_key, signed_message, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.verify(public_key, signed_message)
+
     print(tabulate([['ElGamal Verifizierung']], tablefmt='fancy_grid'))
 
     # Unpack the public key into its components
@@ -228,8 +248,7 @@ def verify(public_key, signed_message):
     m, p_nb, s = signed_message
 
     # Calculation of a and b
-    a = (g ** m) % p
-    b = (e ** p_nb) * (p_nb ** s) % p
+    a, b = elgamal.verify(public_key, signed_message)
 
     # Calculation path output
     print(
@@ -242,7 +261,7 @@ def verify(public_key, signed_message):
     print(
         f'b = e^p_n * p_n^s mod p\n'
         f'b = {e}^{p_nb} * {p_nb}^{s} mod {p}\n'
-        f'b = {(e ** p_nb) % p} * {(p_nb ** s) % p} mod {p}\n'
+        f'b = {modexp.modexp(e, p_nb, p)} * {modexp.modexp(p_nb, s, p)} mod {p}\n'
         f'b = {b}', end='\n\n')
     if a == b:
         print(
@@ -257,7 +276,11 @@ def verify(public_key, signed_message):
 
 # ElGamal homomorphic multiplicative scheme
 def homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2, print_matrix=False,
-                                      print_linear_factorization=True):
+                                      print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2)
+
     print(tabulate([['Homomorphes multiplikatives Schema']], tablefmt='fancy_grid'))
 
     # Unpack both keys into its components
@@ -274,7 +297,7 @@ def homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2, print_m
         return -1
 
     # Calculation of m
-    a_1_a_2 = ((a_1 * a_2) ** d) % p
+    a_1_a_2 = modexp.modexp(a_1 * a_2, d, p)
     a_i = modulo_inverse_multiplicative.mim(p, a_1_a_2, print_matrix, print_linear_factorization, 1)
     m = (a_i * (b_1 * b_2)) % p
 
@@ -293,8 +316,8 @@ def homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2, print_m
         f'(a_1 * a_2)^d * m = (b_1 * b_2) mod p\n'
         f'({a_1} * {a_2})^{d} * m = ({b_1} * {b_2}) mod {p}\n'
         f'{(a_1 * a_2) % p}^{d} * m = {(b_1 * b_2) % p}\n'
-        f'{((a_1 * a_2) ** d) % p} * m = {(b_1 * b_2) % p}\n'
-        f'm = {((a_1 * a_2) ** d) % p}^-1 * {(b_1 * b_2) % p}\n'
+        f'{modexp.modexp(a_1 * a_2, d, p)} * m = {(b_1 * b_2) % p}\n'
+        f'm = {modexp.modexp(a_1 * a_2, d, p)}^-1 * {(b_1 * b_2) % p}\n'
         f'<AUXILIARY 1>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 1>\n'
         f'm = {a_i} * {(b_1 * b_2) % p}\n'
         f'm = {m}', end='\n\n')
@@ -303,7 +326,11 @@ def homomorphic_multiplicative_scheme(public_key, private_key, c_1, c_2, print_m
 
 # ElGamal homomorphic ciphertext extension
 def homomorphic_ciphertext_extension(public_key, private_key, m_1, a_b, print_matrix=False,
-                                     print_linear_factorization=True):
+                                     print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.homomorphic_ciphertext_extension(public_key, private_key, m_1, a_b)
+
     print(tabulate([['Homomorphe Erweiterung des Geheimtextes']], tablefmt='fancy_grid'))
 
     # Unpack both keys into its components
@@ -319,7 +346,7 @@ def homomorphic_ciphertext_extension(public_key, private_key, m_1, a_b, print_ma
         return -1
 
     # Calculation of m
-    a_d = (a ** d) % p
+    a_d = modexp.modexp(a, d, p)
     a_i = modulo_inverse_multiplicative.mim(p, a_d, print_matrix, print_linear_factorization, 1)
     m = (a_i * b) % p
 
@@ -359,7 +386,11 @@ def homomorphic_ciphertext_extension(public_key, private_key, m_1, a_b, print_ma
 
 # ElGamal homomorphic multiplicative decryption
 def homomorphic_multiplicative_decryption(public_key, private_key, m_1, c_1, c_2, print_matrix=False,
-                                          print_linear_factorization=True):
+                                          print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.homomorphic_multiplicative_decryption(public_key, private_key, m_1, c_1, c_2)
+
     print(tabulate([['Homomorphe multiplikative Entschlüsselung']], tablefmt='fancy_grid'))
 
     # Unpack both keys into its components
@@ -376,7 +407,7 @@ def homomorphic_multiplicative_decryption(public_key, private_key, m_1, c_1, c_2
         return -1
 
     # Calculation of m
-    a_1_a_2 = ((a_1 * a_2) ** d) % p
+    a_1_a_2 = modexp.modexp(a_1 * a_2, d, p)
     a_i = modulo_inverse_multiplicative.mim(p, a_1_a_2, print_matrix, print_linear_factorization, 1)
     m = (a_i * (b_1 * b_2)) % p
 
@@ -401,8 +432,8 @@ def homomorphic_multiplicative_decryption(public_key, private_key, m_1, c_1, c_2
         f'(a_1 * a_2)^d * m = (b_1 * b_2) mod p\n'
         f'({a_1} * {a_2})^{d} * m = ({b_1} * {b_2}) mod {p}\n'
         f'{(a_1 * a_2) % p}^{d} * m = {(b_1 * b_2) % p}\n'
-        f'{((a_1 * a_2) ** d) % p} * m = {(b_1 * b_2) % p}\n'
-        f'm = {((a_1 * a_2) ** d) % p}^-1 * {(b_1 * b_2) % p}\n'
+        f'{modexp.modexp(a_1 * a_2, d, p)} * m = {(b_1 * b_2) % p}\n'
+        f'm = {modexp.modexp(a_1 * a_2, d, p)}^-1 * {(b_1 * b_2) % p}\n'
         f'<AUXILIARY 1>Achtung: Die Namen der Variablen können abweichen!</AUXILIARY 1>\n'
         f'm = {a_i} * {(b_1 * b_2) % p}\n'
         f'm = {m}', end='\n\n')
@@ -422,7 +453,11 @@ def homomorphic_multiplicative_decryption(public_key, private_key, m_1, c_1, c_2
 
 # ElGamal homomorphic multiplicative decryption with identical random value
 def homomorphic_multiplicative_decryption_k(public_key, m_1, c_1, c_2, print_matrix=False,
-                                            print_linear_factorization=True):
+                                            print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.homomorphic_multiplicative_decryption_k(public_key, m_1, c_1, c_2)
+
     print(tabulate([['Homomorphe multiplikative Entschlüsselung mit identischem Zufallswert']], tablefmt='fancy_grid'))
 
     # Unpack the public key into its components
@@ -463,7 +498,11 @@ def homomorphic_multiplicative_decryption_k(public_key, m_1, c_1, c_2, print_mat
 
 
 # ElGamal baby-step giant-step
-def bsgs(public_key, print_matrix=False, print_linear_factorization=True):
+def bsgs(public_key, print_matrix=False, print_linear_factorization=True, processes=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.bsgs(public_key, processes=processes)
+
     print(tabulate([['ElGamal Babystep-Giantstep-Algorithmus']], tablefmt='fancy_grid'))
 
     # Unpack the public key into its components
@@ -475,18 +514,8 @@ def bsgs(public_key, print_matrix=False, print_linear_factorization=True):
     # Calculation of m
     m = ceil(sqrt(p - 1))
 
-    # Calculation of g^{0...(m-1)} mod p (baby-step)
-    tab = {(g ** r) % p: r for r in range(m)}
-
-    # Calculation of y
-    y = (g ** (m * (p - 2))) % p
-
-    # Find match in table (giant-step)
-    for q in range(m):
-        z = (e * (y ** q)) % p
-        if z in tab:
-            d = q * m + tab[z]
-            break
+    # Calculation of the discrete logarithm d (baby-step giant-step)
+    d = elgamal.bsgs(public_key, processes=processes)
 
     # Removal of the calculation message
     print(' ' * len('Berechnung, bitte warten...'), end='\r')
@@ -494,8 +523,8 @@ def bsgs(public_key, print_matrix=False, print_linear_factorization=True):
     # Calculation of g_i
     g_i = modulo_inverse_multiplicative.mim(p, g, print_matrix, print_linear_factorization, 1)
 
-    # Check the local existence of d
-    if not 'd' in locals():
+    # Check the existence of d
+    if d == -1:
         print(f'Der zum öffentlichen Schlüssel K(pub) = {{p, g, e}} = {{{p}, {g}, {e}}} zugehörige private Schlüssel '
               f'K(priv) = {{p, d}} konnte nicht mittels des Babystep-Giantstep-Algorithmus bestimmt werden.')
         return -1
@@ -517,16 +546,62 @@ def bsgs(public_key, print_matrix=False, print_linear_factorization=True):
         f'({e} * {g}^-{0}, {0}) = ({e} * {g_i ** 0}, {0}) = ({(e * (g_i ** 0)) % p}, {0}) mod {p}\n'
         f'[...]\n'
         f'({e} * {g}^-{d - 1}, {d - 1}) = ({e} * ({g}^-1)^{d - 1}, {d - 1}) = ({e} * {g_i}^{d - 1}, {d - 1}) = '
-        f'({(e * (g_i ** (d - 1))) % p}, {d - 1}) mod {p}\n'
-        f'({e} * {g}^-{d}, {d}) = ({e} * ({g}^-1)^{d}, {d}) = ({e} * {g_i}^{d}, {d}) = ({(e * (g_i ** d)) % p}, {d}) '
-        f'mod {p}', end='\n\n')
+        f'({(e * modexp.modexp(g_i, d - 1, p)) % p}, {d - 1}) mod {p}\n'
+        f'({e} * {g}^-{d}, {d}) = ({e} * ({g}^-1)^{d}, {d}) = ({e} * {g_i}^{d}, {d}) = '
+        f'({(e * modexp.modexp(g_i, d, p)) % p}, {d}) mod {p}', end='\n\n')
+    print(
+        f'Dabei ist zu erkennen, dass das Paar ({(e * modexp.modexp(g_i, d, p)) % p}, {d}) die Lösung für den '
+        f'diskreten Logarithmus darstellt. Folglich entspricht der private Schlüssel K(priv) = {{p, d}} = '
+        f'{{{p}, {d}}}.', end='\n\n')
+    print(
+        f'Verifikation mit K(pub) = {{p, g, e}} = {{{p}, {g}, {e}}}:\n'
+        f'e = g^d mod p\n'
+        f'e = {g}^{d} mod {p}\n'
+        f'e = {modexp.fixed_base(g, d, p)}\n'
+        f'{e} = {modexp.fixed_base(g, d, p)}', end='\n\n')
+    return d
+
+
+# ElGamal discrete logarithm with Pohlig-Hellman decomposition
+def discrete_logarithm(public_key, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return elgamal.discrete_logarithm(public_key)
+
+    print(tabulate([['ElGamal Pohlig-Hellman-Algorithmus']], tablefmt='fancy_grid'))
+
+    # Unpack the public key into its components
+    p, g, e = public_key
+
+    # Calculation of the discrete logarithm d with the intermediate results of every prime power q^k of ord(g)
+    trace = []
+    d = elgamal.discrete_logarithm(public_key, trace)
+
+    # Check the existence of d
+    if d == -1:
+        print(f'Der zum öffentlichen Schlüssel K(pub) = {{p, g, e}} = {{{p}, {g}, {e}}} zugehörige private Schlüssel '
+              f'K(priv) = {{p, d}} konnte nicht mittels des Pohlig-Hellman-Algorithmus bestimmt werden.')
+        return -1
+
+    # Calculation path output
+    order = 1
+    for q, k, _, _, _ in trace:
+        order *= q ** k
+    print(
+        f'Gegeben ist der öffentliche Schlüssel K(pub) = {{p, g, e}} = {{{p}, {g}, {e}}}. Die Ordnung von g zerfällt '
+        f'in ord(g) = {order} = {" * ".join(f"{q}^{k}" if k > 1 else f"{q}" for q, k, _, _, _ in trace)}, sodass '
+        f'der diskrete Logarithmus für jede Primzahlpotenz q^k einzeln bestimmt werden kann (Babystep-Giantstep für '
+        f'kleine q, Pollard-Rho für große q).', end='\n\n')
+    print(tabulate([(f'{q}^{k}', g_q, e_q, d_q) for q, k, g_q, e_q, d_q in trace],
+                   headers=['q^k', 'g_q = g^(ord(g) / q^k)', 'e_q = e^(ord(g) / q^k)', 'd_q ≡ d mod q^k'],
+                   tablefmt='pretty'), end='\n\n')
     print(
-        f'Dabei ist zu erkennen, dass das Paar ({(e * (g_i ** d)) % p}, {d}) die Lösung für den diskreten Logarithmus '
-        f'darstellt. Folglich entspricht der private Schlüssel K(priv) = {{p, d}} = {{{p}, {d}}}.', end='\n\n')
+        f'Mittels des chinesischen Restsatzes ergibt sich aus den Kongruenzen d ≡ d_q mod q^k der private Schlüssel '
+        f'K(priv) = {{p, d}} = {{{p}, {d}}}.', end='\n\n')
     print(
         f'Verifikation mit K(pub) = {{p, g, e}} = {{{p}, {g}, {e}}}:\n'
         f'e = g^d mod p\n'
         f'e = {g}^{d} mod {p}\n'
-        f'e = {(g ** d) % p}\n'
-        f'{e} = {(g ** d) % p}', end='\n\n')
+        f'e = {modexp.fixed_base(g, d, p)}\n'
+        f'{e} = {modexp.fixed_base(g, d, p)}', end='\n\n')
     return d
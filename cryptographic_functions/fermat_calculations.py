@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
 from cryptographic_functions import shared_functions
+from cryptographic_functions.core import fermat
 from tabulate import tabulate
-import math
 
 __author__ = "Lukas Zorn"
 __copyright__ = "Copyright 2021 Lukas Zorn"
@@ -10,31 +10,41 @@ __license__ = "GNU GPLv3"
 
 
 # Fermat's factorization
-def factorization(n):
+def factorization(n, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return fermat.factorization(n)
+
     print(tabulate([['Faktorisierungsmethode von Fermat']], tablefmt='fancy_grid'))
 
+    # Choose an integer n such that n ≥ 2
+    if n < 2:
+        print(f'Das Modul n = {n} muss für eine Faktorisierung größer 1 sein.')
+        return -1
+
     # Choose an integer n that is not a prime number
     if shared_functions.is_prime(n):
         print(f'Das Modul n = {n} darf für eine Faktorisierung keine Primzahl sein.')
         return -1
 
-    # Calculate an integer x such that x > √(x)
-    x = math.ceil(math.sqrt(n))
-
-    # Calculation of y
-    y = (x ** 2) - n
+    # Choose an integer n such that n mod 4 != 2
+    if n % 4 == 2:
+        print(f'Das Modul n = {n} lässt sich wegen n ≡ 2 mod 4 nicht als Differenz zweier Quadratzahlen darstellen.')
+        return -1
 
     # Save all intermediate results
-    list_x = [x]
-    list_q_x = [f'{y} = {x}^2 - {n}']
-    list_y_2 = [f'{int(math.sqrt(y))}^2' if math.sqrt(y).is_integer() else '-']
-
-    while not math.sqrt(y).is_integer():
-        x += 1
-        list_x.append(x)
-        y = x ** 2 - n
-        list_q_x.append(f'{y} = {x}^2 - {n}')
-        list_y_2.append(f'{int(math.sqrt(y))}^2' if math.sqrt(y).is_integer() else '-')
+    trace = []
+    result = fermat.factorization(n, trace)
+    if result == -1:
+        print(
+            f'Für das Modul n = {n} konnte mittels der Faktorisierungsmethode von Fermat kein Faktor bestimmt '
+            f'werden.', end='\n\n')
+        return -1
+    p, q = result
+    x, y, r = trace[-1]
+    list_x = [t[0] for t in trace]
+    list_q_x = [f'{t[1]} = {t[0]}^2 - {n}' for t in trace]
+    list_y_2 = [f'{t[2]}^2' if t[2] != -1 else '-' for t in trace]
 
     print(f'Faktorisierungstabelle nach Fermat für n = {n}:')
     print(tabulate(zip(*(list_x, list_q_x, list_y_2)),
@@ -42,21 +52,59 @@ def factorization(n):
 
     # Calculation path output
     print(
-        f'Gemäß der Faktorisierungstabelle lässt sich q(x) für x = {list_x[-1]} somit als Quadratzahl darstellen:\n'
-        f'q({list_x[-1]}) = {list_q_x[-1]} = {list_y_2[-1]}', end='\n\n')
+        f'Gemäß der Faktorisierungstabelle lässt sich q(x) für x = {x} somit als Quadratzahl darstellen:\n'
+        f'q({x}) = {list_q_x[-1]} = {list_y_2[-1]}', end='\n\n')
     print(
         f'Daraus folgt:\n'
         f'(1): x^2 - n = y^2\n'
-        f'(1): {list_x[-1]}^2 - {n} = {list_y_2[-1]}\n'
-        f'(1): {list_x[-1] ** 2} - {n} = {y}\n\n'
+        f'(1): {x}^2 - {n} = {list_y_2[-1]}\n'
+        f'(1): {x ** 2} - {n} = {y}\n\n'
         f'(2): x^2 - y^2 = n\n'
-        f'(2): {list_x[-1]}^2 - {list_y_2[-1]} = {n}\n'
-        f'(2): {list_x[-1] ** 2} - {y} = {n}', end='\n\n')
+        f'(2): {x}^2 - {list_y_2[-1]} = {n}\n'
+        f'(2): {x ** 2} - {y} = {n}', end='\n\n')
     print(
         f'Damit lassen sich nun die Faktoren von p und q bestimmen:\n'
         f'x^2 - y^2 = (x + y) * (x - y) = p * q = n\n'
-        f'{list_x[-1]}^2 - {int(math.sqrt(y))}^2 = ({list_x[-1]} + {int(math.sqrt(y))}) * ({list_x[-1]} - '
-        f'{int(math.sqrt(y))}) = {list_x[-1] + int(math.sqrt(y))} * {list_x[-1] - int(math.sqrt(y))} = {n}', end='\n\n')
+        f'{x}^2 - {r}^2 = ({x} + {r}) * ({x} - {r}) = {p} * {q} = {n}', end='\n\n')
+    print(
+        f'Daraus folgt p = {p} und q = {q}.', end='\n\n')
+    return p, q
+
+
+# Hart's one line factorization
+def one_line_factorization(n, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return fermat.one_line_factorization(n)
+
+    print(tabulate([['Ein-Zeilen-Faktorisierungsmethode von Hart']], tablefmt='fancy_grid'))
+
+    # Choose an integer n that is not a prime number
+    if n < 2 or shared_functions.is_prime(n):
+        print(f'Das Modul n = {n} darf für eine Faktorisierung keine Primzahl sein.')
+        return -1
+
+    # Save all intermediate results
+    trace = []
+    result = fermat.one_line_factorization(n, trace)
+
+    print(f'Faktorisierungstabelle nach Hart für n = {n}:')
+    print(tabulate([(i, s, f'{m} = {s}^2 mod {n}', f'{t}^2' if t != -1 else '-') for i, s, m, t in trace],
+                   headers=['i', 's = ⌈√(n * i)⌉', 'm = s^2 mod n', 't^2'], tablefmt='pretty'), end='\n\n')
+
+    if result == -1:
+        print(f'Für das Modul n = {n} konnte mittels der Ein-Zeilen-Faktorisierung kein Faktor bestimmt werden.',
+              end='\n\n')
+        return -1
+
+    # Calculation path output
+    i, s, m, t = trace[-1]
+    p, q = result
+    print(
+        f'Gemäß der Faktorisierungstabelle ist m = s^2 mod n für i = {i} mit m = {m} = {t}^2 eine Quadratzahl. Daraus '
+        f'folgt s^2 ≡ t^2 mod n und somit:\n'
+        f'ggT(s - t, n) = ggT({s} - {t}, {n}) = {shared_functions.gcd(s - t, n)}', end='\n\n')
     print(
-        f'Daraus folgt p = {list_x[-1] + int(math.sqrt(y))} und q = {list_x[-1] - int(math.sqrt(y))}.', end='\n\n')
-    return list_x[-1] + int(math.sqrt(y)), list_x[-1] - int(math.sqrt(y))
+        f'Daraus folgt p = {p} und q = {q}, da gilt:\n'
+        f'p * q = {p} * {q} = {n}', end='\n\n')
+    return p, q
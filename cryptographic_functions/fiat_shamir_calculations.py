@@ -2,6 +2,7 @@
 
 from cryptographic_functions import modulo_inverse_multiplicative
 from cryptographic_functions import shared_functions
+from cryptographic_functions.core import fiat_shamir
 from tabulate import tabulate
 import random
 
@@ -11,7 +12,11 @@ __license__ = "GNU GPLv3"
 
 
 # Fiat-Shamir keypair generation
-def keypair_generation(p, q, s=None, v=None):
+def keypair_generation(p, q, s=None, v=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return fiat_shamir.keypair_generation(p, q, s, v)
+
     print(tabulate([['Fiat-Shamir-Protokoll Schlüsselerzeugung']], tablefmt='fancy_grid'))
 
     # Choose an integer p that is a prime number
@@ -81,7 +86,11 @@ def keypair_generation(p, q, s=None, v=None):
 
 
 # Fiat-Shamir verification
-def verification(key_a, key_b, k=None, b=None, print_matrix=False, print_linear_factorization=True):
+def verification(key_a, key_b, k=None, b=None, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return fiat_shamir.verification(key_a, key_b, k, b)
+
     print(tabulate([['Fiat-Shamir-Protokoll Verifikation']], tablefmt='fancy_grid'))
 
     # Unpack both keys into its components
@@ -172,7 +181,11 @@ def verification(key_a, key_b, k=None, b=None, print_matrix=False, print_linear_
 
 
 # Fiat-Shamir attack
-def attack_scheme(key_a, y=None, b=None, print_matrix=False, print_linear_factorization=True):
+def attack_scheme(key_a, y=None, b=None, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return fiat_shamir.attack_scheme(key_a, y, b)
+
     print(tabulate([['Fiat-Shamir-Protokoll Angriffsmuster']], tablefmt='fancy_grid'))
 
     # Unpack the public key into its components
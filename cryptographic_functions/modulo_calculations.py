@@ -2,6 +2,8 @@
 
 from cryptographic_functions import modulo_inverse_additive
 from cryptographic_functions import modulo_inverse_multiplicative
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import primality
 from tabulate import tabulate
 
 __author__ = "Lukas Zorn"
@@ -10,7 +12,11 @@ __license__ = "GNU GPLv3"
 
 
 # Addition in finite sets
-def addition(m, a, b):
+def addition(m, a, b, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.addition(m, a, b)
+
     print(tabulate([['Addition in endlichen Mengen']], tablefmt='fancy_grid'))
 
     # Checking whether requirements are met
@@ -27,7 +33,7 @@ def addition(m, a, b):
         return -1
 
     q = (a + b) // m
-    r = (a + b) % m
+    r = modulo.addition(m, a, b)
 
     # Calculation path output
     print(f'Die modulo m = {m} Addition von {a} ⊕ {b} = {r}, da gilt:\n'
@@ -38,7 +44,11 @@ def addition(m, a, b):
 
 
 # Subtraction in finite sets
-def subtraction(m, a, b, print_matrix=False):
+def subtraction(m, a, b, print_matrix=False, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.subtraction(m, a, b)
+
     print(tabulate([['Subtraktion in endlichen Mengen']], tablefmt='fancy_grid'))
 
     # Checking whether requirements are met
@@ -63,7 +73,11 @@ def subtraction(m, a, b, print_matrix=False):
 
 
 # Multiplication in finite sets
-def multiplication(m, a, b):
+def multiplication(m, a, b, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.multiplication(m, a, b)
+
     print(tabulate([['Multiplikation in endlichen Mengen']], tablefmt='fancy_grid'))
 
     # Checking whether requirements are met
@@ -80,7 +94,7 @@ def multiplication(m, a, b):
         return -1
 
     q = (a * b) // m
-    r = (a * b) % m
+    r = modulo.multiplication(m, a, b)
 
     # Calculation path output
     print(f'Die modulo m = {m} Multiplikation von {a} ⊙ {b} = {r}, da gilt:\n'
@@ -91,7 +105,11 @@ def multiplication(m, a, b):
 
 
 # Division in finite sets
-def division(m, a, b, print_matrix=False, print_linear_factorization=True):
+def division(m, a, b, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.division(m, a, b)
+
     print(tabulate([['Division in endlichen Mengen']], tablefmt='fancy_grid'))
 
     # Checking whether requirements are met
@@ -113,3 +131,44 @@ def division(m, a, b, print_matrix=False, print_linear_factorization=True):
             f'Die modulo m = {m} Division von {a} ⊘ {b} kann nicht durchgeführt werden, da m und b nicht teilerfremd '
             f'sind und folglich das multiplikativ inverse Element nicht definiert ist.', end='\n\n')
         return -1
+
+
+# Square root in prime fields
+def square_root(p, a, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.sqrt_mod(p, a)
+
+    print(tabulate([['Quadratwurzel in endlichen Körpern']], tablefmt='fancy_grid'))
+
+    # Checking whether requirements are met
+    if p < 3 or not primality.is_prime(p):
+        print(f'Die Variable p = {p} muss eine ungerade Primzahl sein.')
+        return -1
+
+    a %= p
+    r = modulo.sqrt_mod(p, a)
+    if r == -1:
+        print(f'Die Zahl a = {a} ist ein quadratischer Nichtrest mod {p}, da für das Legendre-Symbol gilt:\n'
+              f'({a} / {p}) = {a}^(({p} - 1) / 2) mod {p} = -1', end='\n\n')
+        return -1
+
+    # Calculation path output
+    q, s, _ = modulo.sylow_decomposition(p)
+    if p % 4 == 3:
+        method = (f'Wegen p ≡ 3 mod 4 ergibt sich die Wurzel direkt als r = a^((p + 1) / 4) mod p = '
+                  f'{a}^{(p + 1) // 4} mod {p}.')
+    elif p % 8 == 5:
+        method = (f'Wegen p ≡ 5 mod 8 ergibt sich die Wurzel mit dem Algorithmus von Atkin aus b = (2a)^((p - 5) / 8) '
+                  f'mod p = {pow(2 * a, (p - 5) // 8, p)} und i = 2a * b^2 mod p als r = a * b * (i - 1) mod p.')
+    elif s * (s - 1) > 8 * p.bit_length() + 20:
+        method = (f'Wegen p - 1 = {q} * 2^{s} mit großem Exponenten s = {s} wird die Wurzel mit dem '
+                  f'Cipolla-Algorithmus als (t + ω)^((p + 1) / 2) im GF({p}^2) bestimmt.')
+    else:
+        method = (f'Wegen p - 1 = {q} * 2^{s} wird die Wurzel mit dem Tonelli-Shanks-Algorithmus und dem einmalig '
+                  f'berechneten quadratischen Nichtrest z = {modulo.non_residue(p)} bestimmt.')
+    print(
+        f'{method}\n'
+        f'Die Quadratwurzeln von a = {a} mod {p} sind r = {r} und p - r = {(p - r) % p}, da gilt:\n'
+        f'{r}^2 mod {p} = {(r * r) % p}', end='\n\n')
+    return r
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from cryptographic_functions import shared_functions
+from cryptographic_functions import table_writer
+from cryptographic_functions.core import modulo
 from tabulate import tabulate
 
 __author__ = "Lukas Zorn"
@@ -8,7 +11,11 @@ __license__ = "GNU GPLv3"
 
 
 # Cyclic groups
-def mcg(m, print_matrix=False):
+def mcg(m, print_matrix=False, matrix_output=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.mcg(m)
+
     print(tabulate([['Primitive und nicht-primitive Elemente in zyklischen Gruppen']], tablefmt='fancy_grid'))
 
     # Checking whether requirements are met
@@ -16,42 +23,36 @@ def mcg(m, print_matrix=False):
         print(f'Die Variable m = {m} muss größer gleich 2 sein.')
         return -1
 
-    # Table calculation
-    table = [list(range(1, m))]
-    for y in range(1, m):
-        table.append([(x ** y) % m for x in range(1, m)])
-
-    # Table matrix output
+    # The O(m^2) table of all powers is only calculated for the matrix output
     if print_matrix:
-        print(f'modulo-{m}-Zyklustabelle:')
-        print(tabulate(zip(*table), headers=tuple(['z'] + ['z' + str(z) for z in range(1, m)]), tablefmt='pretty'),
-              end='\n\n')
-
-    p = []
-    n = []
-
-    # Identify the primitive and non-primitive elements
-    for i, x in enumerate([sorted(z) for z in zip(*table[1:])], start=1):
-        if x == list(range(1, m)):
-            p.append(i)
-        else:
-            n.append(i)
+        headers = ['z'] + ['z' + str(z) for z in range(1, m)]
+        shared_functions.print_table(f'modulo-{m}-Zyklustabelle', headers, table_writer.power_rows(m),
+                                     table_writer.column_widths(headers, m), matrix_output)
+
+    # Identify the primitive and non-primitive elements by the order of the elements
+    p, n = modulo.mcg(m)
+    if p != -1:
+        phi, factors = modulo.totient(m)
+        print(
+            f'Die Ordnung der Gruppe beträgt φ(m) = m - 1 = {phi} = '
+            f'{" * ".join(f"{q}^{e}" if e > 1 else f"{q}" for q, e in factors) or "1"}. Ein Element g ist genau dann '
+            f'primitiv, wenn g^(φ(m) / q) ≠ 1 mod m für alle Primfaktoren q von φ(m) gilt. Ausgehend vom kleinsten '
+            f'primitiven Element g = {p[0]} ergeben sich alle primitiven Elemente als g^k mod m mit '
+            f'ggT(k, φ(m)) = 1.', end='\n\n')
 
     # Calculation path output
-    if len(p) > 0:
+    if p != -1:
         print(
             f'Die Elemente g = {{{", ".join(map(str, p))}}} sind primitive Elemente der zyklischen Gruppe der Ordnung '
             f'm = {m}.', end='\n\n')
     else:
         print(f'Für die zyklische Gruppe der Ordnung m = {m} konnten keine primitiven Elemente ermittelt werden.',
               end='\n\n')
-        p = -1
-    if len(n) > 0:
+    if n != -1:
         print(
             f'Die Elemente g = {{{", ".join(map(str, n))}}} sind nicht-primitive Elemente der zyklischen Gruppe der '
             f'Ordnung m = {m}.', end='\n\n')
     else:
         print(f'Für die zyklische Gruppe der Ordnung m = {m} konnten keine nicht-primitiven Elemente ermittelt werden.',
               end='\n\n')
-        n = -1
     return p, n
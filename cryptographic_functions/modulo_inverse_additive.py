@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 from cryptographic_functions import shared_functions
+from cryptographic_functions import table_writer
+from cryptographic_functions.core import modulo
 from tabulate import tabulate
 
 __author__ = "Lukas Zorn"
@@ -9,7 +11,11 @@ __license__ = "GNU GPLv3"
 
 
 # Additive inverse element in finite sets
-def mia(m, a, print_matrix=False, print_header=None):
+def mia(m, a, print_matrix=False, print_header=None, matrix_output=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.mia(m, a)
+
     if not print_header:
         print(tabulate([['Additives inverses Element in endlichen Mengen']], tablefmt='fancy_grid'))
     else:
@@ -25,16 +31,12 @@ def mia(m, a, print_matrix=False, print_header=None):
         return -1
 
     if print_matrix:
-        # Table calculation
-        table = [list(range(m))]
-        for x in range(m):
-            table.append([(x + y) % m for y in range(m)])
-
-        # Table matrix output
-        print(f'modulo-{m}-Additionstabelle:')
-        print(tabulate(zip(*table), headers=tuple(['⊕'] + list(range(m))), tablefmt='pretty'), end='\n\n')
+        # Table matrix output, whose rows are generated and written lazily
+        headers = ['⊕'] + list(range(m))
+        shared_functions.print_table(f'modulo-{m}-Additionstabelle', headers, table_writer.addition_rows(m),
+                                     table_writer.column_widths(headers, m), matrix_output)
 
-    i = m - a
+    i = modulo.mia(m, a)
     q = (a + i) // m
     r = (a + i) % m
 
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
 from cryptographic_functions import shared_functions
+from cryptographic_functions import table_writer
+from cryptographic_functions.core import modulo
+from cryptographic_functions.core import xgcd
 from tabulate import tabulate
 
 __author__ = "Lukas Zorn"
@@ -9,7 +12,12 @@ __license__ = "GNU GPLv3"
 
 
 # Multiplicative inverse element in finite sets
-def mim(m, a, print_matrix=False, print_linear_factorization=True, print_header=None):
+def mim(m, a, print_matrix=False, print_linear_factorization=True, print_header=None, matrix_output=None,
+        quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return modulo.mim(m, a)
+
     if not print_header:
         print(tabulate([['Multiplikativ inverses Element in endlichen Mengen']], tablefmt='fancy_grid'))
     else:
@@ -25,47 +33,42 @@ def mim(m, a, print_matrix=False, print_linear_factorization=True, print_header=
         return -1
 
     if print_matrix:
-        # Table calculation
-        table = [list(range(m)), [0] * m]
-        for x in range(1, m):
-            table.append([0] + [(x * y) % m for y in range(1, m)])
-
-        # Table matrix output
-        print(f'modulo-{m}-Multiplikationstabelle:')
-        print(tabulate(zip(*table), headers=tuple(['⊙'] + list(range(m))), tablefmt='pretty'), end='\n\n')
+        # Table matrix output, whose rows are generated and written lazily (the column of 0 only contains zeros)
+        headers = ['⊙'] + list(range(m))
+        widths = table_writer.column_widths(headers, m)
+        widths[1] = 1
+        shared_functions.print_table(f'modulo-{m}-Multiplikationstabelle', headers, table_writer.multiplication_rows(m),
+                                     widths, matrix_output)
 
-    list_m, list_a, list_q, list_r, list_x, list_y_calc, list_y = \
-        shared_functions.linear_factorization(*shared_functions.gcd_extended(m, a))
+    # Only the quotients of the Euclidean steps are recorded, the table rows are rendered on demand
+    quotients = xgcd.trace(m, a)
 
     # Linear factorization output
     if print_linear_factorization:
         print(f'ggT- und Linearfaktorzerlegungstabelle für m = {m} und a = {a}:')
-        print(tabulate(zip(*(range(1, len(list_m) + 1), list_m, list_a, list_q, list_r, list_x, list_y_calc, list_y)),
+        print(tabulate(xgcd.linear_factorization(m, a, quotients),
                        headers=['i', 'm', 'a', 'q', 'r', 'x', 'y_calc', 'y'], tablefmt='pretty'))
         print('Die Berechnungstabelle des erweiterten euklidschen Algorithmus entspricht dem Muster m = a * q + r.',
               end='\n\n')
 
-    # Correction of the gcd in very small finite fields
-    if len(list_r) < 2:
-        gcd = a
-    else:
-        gcd = list_r[-2]
+    # The coefficients of the first step follow from the extended Euclidean algorithm
+    gcd, x, y = xgcd.xgcd(m, a)
 
     # Calculation path output
     print(
         f'Aus den Ergebnissen der ggT- und Linearfaktorzerlegungstabelle folgt somit:\n'
-        f'ggT({m},{a}) = {gcd} = m1 * (x1) + a1 * (y1) = {list_m[0]} * ({list_x[0]}) + {list_a[0]} * ({list_y[0]})',
+        f'ggT({m},{a}) = {gcd} = m1 * (x1) + a1 * (y1) = {m} * ({x}) + {a} * ({y})',
         end='\n\n')
     if gcd == 1:
-        if list_y[0] < 0:
-            print(f'Da nach der Linearfaktorzerlegung das multiplikativ inverse Element a^-1 = {list_y[0]} negativ '
-                  f'ist, entspricht dessen tatsächlicher Wert a^-1 = a^-1 + m = {list_y[0]} + {m} = {list_y[0] + m}.')
-            list_y[0] = list_y[0] + m
+        if y < 0:
+            print(f'Da nach der Linearfaktorzerlegung das multiplikativ inverse Element a^-1 = {y} negativ '
+                  f'ist, entspricht dessen tatsächlicher Wert a^-1 = a^-1 + m = {y} + {m} = {y + m}.')
+            y = y + m
         print(
-            f'Das in modulo m = {m} multiplikativ inverse Element zu a = {a} ist a^-1 = {list_y[0]}, da gilt:\n'
-            f'a ⊙ a^-1 = {list_y[0]} ⊙ {a} = {list_y[0] * a} mod {m} = {(list_y[0] * a) % m}')
+            f'Das in modulo m = {m} multiplikativ inverse Element zu a = {a} ist a^-1 = {y}, da gilt:\n'
+            f'a ⊙ a^-1 = {y} ⊙ {a} = {y * a} mod {m} = {(y * a) % m}')
         shared_functions.print_auxiliary(print_header)
-        return list_y[0]
+        return y
     else:
         print(
             f'Das in modulo m = {m} multiplikativ inverse Element zu a = {a} kann folglich nicht bestimmt werden, da m '
@@ -2,6 +2,9 @@
 
 from cryptographic_functions import modulo_inverse_multiplicative
 from cryptographic_functions import shared_functions
+from cryptographic_functions.core import factorization as factorization_core
+from cryptographic_functions.core import modexp
+from cryptographic_functions.core import rsa
 from tabulate import tabulate
 import random
 
@@ -11,7 +14,11 @@ __license__ = "GNU GPLv3"
 
 
 # RSA keypair generation
-def keypair_generation(p, q, e=None, print_matrix=False, print_linear_factorization=True):
+def keypair_generation(p, q, e=None, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.keypair_generation(p, q, e)
+
     print(tabulate([['RSA Schlüsselerzeugung']], tablefmt='fancy_grid'))
 
     # Choose an integer p that is a prime number
@@ -84,8 +91,55 @@ def keypair_generation(p, q, e=None, print_matrix=False, print_linear_factorizat
         return -1
 
 
+# RSA keypair generation with random prime numbers
+def random_keypair_generation(bits=2048, e=65537, processes=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.random_keypair_generation(bits, e, processes)
+
+    print(tabulate([['RSA Schlüsselerzeugung mit zufälligen Primzahlen']], tablefmt='fancy_grid'))
+
+    # Choose a modulus of at least 16 bits
+    if bits < 16:
+        print(f'Die Bitlänge = {bits} des Moduls n muss mindestens 16 betragen.')
+        return -1
+
+    # Choose an odd integer e such that e > 1
+    if e < 3 or e % 2 == 0:
+        print(f'Die Variable e = {e} muss eine ungerade Zahl größer 1 sein.')
+        return -1
+
+    # Keypair generation
+    public_key, private_key = rsa.random_keypair_generation(bits, e, processes)
+    d, n, p, q, d_p, d_q, q_i = private_key
+
+    # Calculation path output
+    print(
+        f'Wähle: p = {p} und q = {q} sind zufällige Primzahlen mit {p.bit_length()} bzw. {q.bit_length()} Bit, für '
+        f'die gilt:\n'
+        f'ggT({e}, p - 1) = ggT({e}, q - 1) = 1', end='\n\n')
+    print(
+        f'Berechne: n = p * q = {n} ({n.bit_length()} Bit)', end='\n\n')
+    print(
+        f'Berechne: d = e^-1 mod Φ(n) = {d}', end='\n\n')
+    print(
+        f'Berechne für die Entschlüsselung mittels Chinesischem Restsatz:\n'
+        f'd_p = d mod (p - 1) = {d_p}\n'
+        f'd_q = d mod (q - 1) = {d_q}\n'
+        f'q^-1 = q^-1 mod p = {q_i}', end='\n\n')
+    print(
+        f'Der öffentliche Schlüssel K(pub) = {{e, n}} entspricht somit K(pub) = {{{e}, {n}}} und der private '
+        f'Schlüssel K(priv) = {{d, n, p, q, d_p, d_q, q^-1}} folglich K(priv) = {{{d}, {n}, {p}, {q}, {d_p}, {d_q}, '
+        f'{q_i}}}.', end='\n\n')
+    return public_key, private_key
+
+
 # RSA encryption
-def encryption(public_key, p):
+def encryption(public_key, p, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.encryption(public_key, p)
+
     print(tabulate([['RSA Verschlüsselung']], tablefmt='fancy_grid'))
 
     # Unpack the public key into its components
@@ -97,7 +151,7 @@ def encryption(public_key, p):
         return -1
 
     # Encryption
-    c = (p ** e) % n
+    c = rsa.encryption(public_key, p)
 
     # Calculation path output
     print(
@@ -109,12 +163,47 @@ def encryption(public_key, p):
     return c
 
 
+# RSA private key operation output using the Chinese remainder theorem
+def print_crt_exponentiation(private_key, c, x, y):
+    d, n, p, q, d_p, d_q, q_i = private_key
+    y_p = modexp.modexp(c, d_p, p)
+    y_q = modexp.modexp(c, d_q, q)
+    h = (q_i * (y_p - y_q)) % p
+    print(
+        f'Da der private Schlüssel die Komponenten p = {p}, q = {q}, d_p = {d_p}, d_q = {d_q} und q^-1 = {q_i} '
+        f'enthält, wird {y} = {x}^d mod n mittels Chinesischem Restsatz in GF(p) und GF(q) berechnet:\n'
+        f'{y}_p = {x}^d_p mod p = {c}^{d_p} mod {p} = {y_p}\n'
+        f'{y}_q = {x}^d_q mod q = {c}^{d_q} mod {q} = {y_q}', end='\n\n')
+    print(
+        f'Die Rekombination nach Garner ergibt:\n'
+        f'h = q^-1 * ({y}_p - {y}_q) mod p = {q_i} * ({y_p} - {y_q}) mod {p} = {h}\n'
+        f'{y} = {y}_q + h * q = {y_q} + {h} * {q} = {y_q + h * q}', end='\n\n')
+
+
+# RSA fault check output by re-encrypting the result of a private key operation
+def print_fault_check(n, e, x, y, x_value, y_value):
+    x_v = modexp.modexp(y_value, e, n)
+    if x_v == x_value:
+        print(
+            f'Fehlerprüfung: {x}_v = {y}^e mod n = {y_value}^{e} mod {n} = {x_v} = {x}, das Ergebnis ist somit '
+            f'korrekt.', end='\n\n')
+    else:
+        print(
+            f'Fehlerprüfung: {x}_v = {y}^e mod n = {y_value}^{e} mod {n} = {x_v} != {x} = {x_value}, das Ergebnis ist '
+            f'somit fehlerhaft und wird verworfen.', end='\n\n')
+    return x_v == x_value
+
+
 # RSA decryption
-def decryption(private_key, c):
+def decryption(private_key, c, crt=True, e=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.decryption(private_key, c, crt, e)
+
     print(tabulate([['RSA Entschlüsselung']], tablefmt='fancy_grid'))
 
     # Unpack the private key into its components
-    d, n = private_key
+    d, n = private_key[:2]
 
     # Choose an integer c such that 0 ≤ c < n
     if c not in range(n):
@@ -122,20 +211,98 @@ def decryption(private_key, c):
         return -1
 
     # Decryption
-    p = (c ** d) % n
+    p = rsa.decryption(private_key, c, crt)
 
     # Calculation path output
+    if crt and len(private_key) == 7:
+        print_crt_exponentiation(private_key, c, 'c', 'p')
     print(
         f'Die Entschlüsselung am Beispiel von K(priv) = {{{d}, {n}}} für den Geheimtext c = {c} ergibt den Klartext '
         f'p = {p}, da gilt:\n'
         f'p = c^e mod n\n'
         f'p = {c}^{d} mod {n}\n'
         f'p = {p}', end='\n\n')
+    if e is not None and not print_fault_check(n, e, 'c', 'p', c, p):
+        return -1
     return p
 
 
+# RSA signing
+def sign(private_key, m, crt=True, e=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.sign(private_key, m, crt, e)
+
+    print(tabulate([['RSA Signierung']], tablefmt='fancy_grid'))
+
+    # Unpack the private key into its components
+    d, n = private_key[:2]
+
+    # Choose an integer m such that 0 ≤ m < n
+    if m not in range(n):
+        print(f'Für die Variable m = {m} muss gelten 0 ≤ {m} < {n}.')
+        return -1
+
+    # Signing
+    s = rsa.sign(private_key, m, crt)
+
+    # Calculation path output
+    if crt and len(private_key) == 7:
+        print_crt_exponentiation(private_key, m, 'm', 's')
+    print(
+        f'Die Signierung am Beispiel von K(priv) = {{{d}, {n}}} für die Nachricht m = {m} ergibt die Signatur '
+        f's = {s}, da gilt:\n'
+        f's = m^d mod n\n'
+        f's = {m}^{d} mod {n}\n'
+        f's = {s}', end='\n\n')
+    if e is not None and not print_fault_check(n, e, 'm', 's', m, s):
+        return -1
+    return s
+
+
+# RSA signature verification
+def verify(public_key, m, s, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.verify(public_key, m, s)
+
+    print(tabulate([['RSA Verifizierung']], tablefmt='fancy_grid'))
+
+    # Unpack the public key into its components
+    e, n = public_key
+
+    # Choose integers m and s such that 0 ≤ {m, s} < n
+    if m not in range(n) or s not in range(n):
+        print(f'Für die Variablen m = {m} und s = {s} muss gelten 0 ≤ {{{m}, {s}}} < {n}.')
+        return False
+
+    # Verification
+    m_v = modexp.modexp(s, e, n)
+
+    # Calculation path output
+    print(
+        f'Zur Verifizierung der Signatur s = {s} für die Nachricht m = {m} mittels K(pub) = {{{e}, {n}}} muss der '
+        f'Ausdruck m = s^e mod n bestätigt werden:\n'
+        f'm_v = s^e mod n\n'
+        f'm_v = {s}^{e} mod {n}\n'
+        f'm_v = {m_v}', end='\n\n')
+    if m_v == m:
+        print(
+            f'Aufgrund der Kongruenz von m = {m} und m_v = {m_v} kann die Integrität der signierten Nachricht '
+            f'bestätigt werden.', end='\n\n')
+    else:
+        print(
+            f'Aufgrund der Inkongruenz von m = {m} und m_v = {m_v} kann die Integrität der signierten Nachricht nicht '
+            f'bestätigt werden.', end='\n\n')
+    return m_v == m
+
+
 # RSA Pollard's rho algorithm
-def pollard_rho(n, x=None, c=23):
+def pollard_rho(n, x=None, c=23, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return rsa.pollard_rho(n, x, c)
+
     print(tabulate([['RSA Pollard-Rho-Methode']], tablefmt='fancy_grid'))
 
     # Choose an integer n such that n < 2
@@ -154,9 +321,11 @@ def pollard_rho(n, x=None, c=23):
     list_x = []
     list_y = []
     list_d = []
-    while list_x.count(x) != 2:
+    set_x = set()
+    while len(set_x) == len(list_x):
         x = (x * x + c) % n
         list_x.append(x)
+        set_x.add(x)
         y = (y * y + c) % n
         y = (y * y + c) % n
         list_y.append(y)
@@ -171,12 +340,12 @@ def pollard_rho(n, x=None, c=23):
     for d in list_d:
         if d == 1 or d == n:
             continue
-        if not shared_functions.is_prime(n / d):
+        if not shared_functions.is_prime(n // d):
             continue
-        if n / d * d == n:
+        if n % d == 0:
             if shared_functions.is_prime(d):
-                p = int(n / d)
-                q = int(d)
+                p = n // d
+                q = d
             else:
                 print(f'In diesem speziellen Fall ist der gefundene Faktor mit dem Wert {d} keine Primzahl. Dieser '
                       f'kann jedoch durch die Wiederholung der Funktion mit n = {d} weiter faktorisiert werden.')
@@ -198,3 +367,40 @@ def pollard_rho(n, x=None, c=23):
         f'Verifikation:\n'
         f'p * q = {p} * {q} = {n}', end='\n\n')
     return p, q
+
+
+# Complete prime factorization with automatic selection of the method
+def factorization(n, processes=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return factorization_core.factorize(n, processes)
+
+    print(tabulate([['Primfaktorzerlegung']], tablefmt='fancy_grid'))
+
+    # Choose an integer n such that n ≥ 1
+    if n < 1:
+        print(f'Die Zahl n = {n} muss größer 0 sein.')
+        return -1
+
+    trace = []
+    factors = factorization_core.factorize(n, processes, trace)
+
+    # The methods are named in the order in which they first split a number
+    methods = list(dict.fromkeys(step[0] for step in trace))
+    if not methods:
+        method = 'Primzahltest' if n > 1 else '-'
+    elif len(methods) == 1:
+        method = methods[0]
+    else:
+        method = f'{", ".join(methods[:-1])} und {methods[-1]}'
+
+    # Calculation path output
+    if trace:
+        print('Zerlegungsschritte:')
+        print(tabulate(trace, headers=['Methode', 'Zahl m', 'Teiler d'], tablefmt='pretty'), end='\n\n')
+    print(f'Primfaktoren von n = {n} ({method}):')
+    print(tabulate(factors, headers=['Primfaktor p', 'Exponent e'], tablefmt='pretty'), end='\n\n')
+    print(
+        f'Verifikation:\n'
+        f'n = {" * ".join(f"{p}^{e}" if e > 1 else f"{p}" for p, e in factors) or "1"} = {n}', end='\n\n')
+    return factors
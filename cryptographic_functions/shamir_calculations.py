@@ -2,6 +2,8 @@
 
 from cryptographic_functions import modulo_inverse_multiplicative
 from cryptographic_functions import shared_functions
+from cryptographic_functions.core import shamir
+from cryptographic_functions.core import modexp
 from tabulate import tabulate
 import random
 
@@ -11,7 +13,11 @@ __license__ = "GNU GPLv3"
 
 
 # Shamir three-pass keypair generation
-def keypair_generation(p, a=None, b=None, print_matrix=False, print_linear_factorization=True):
+def keypair_generation(p, a=None, b=None, print_matrix=False, print_linear_factorization=True, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return shamir.keypair_generation(p, a, b)
+
     print(tabulate([['Shamir’s No-Key Schlüsselerzeugung']], tablefmt='fancy_grid'))
 
     # Choose an integer p that is a prime number
@@ -68,7 +74,11 @@ def keypair_generation(p, a=None, b=None, print_matrix=False, print_linear_facto
 
 
 # Shamir three-pass key exchange
-def key_exchange(key_a, key_b, k=None):
+def key_exchange(key_a, key_b, k=None, quiet=False):
+    # Silent calculation without any calculation path output
+    if quiet:
+        return shamir.key_exchange(key_a, key_b, k)
+
     print(tabulate([['Shamir’s No-Key Schlüsselaustausch']], tablefmt='fancy_grid'))
 
     # Unpack both keys into its components
@@ -90,10 +100,10 @@ def key_exchange(key_a, key_b, k=None):
         return -1
 
     # Key exchange
-    a_y1 = (k ** a) % p
-    b_y1 = (a_y1 ** b) % p
-    a_y2 = (b_y1 ** a_i) % p
-    b_y2 = (a_y2 ** b_i) % p
+    a_y1 = modexp.modexp(k, a, p)
+    b_y1 = modexp.modexp(a_y1, b, p)
+    a_y2 = modexp.modexp(b_y1, a_i, p)
+    b_y2 = modexp.modexp(a_y2, b_i, p)
 
     if not k == b_y2:
         print(f'Bei der Generierung des gemeinsamen Schlüssels ist ein Fehler aufgetreten, da das Ergebnis für '
@@ -120,6 +130,6 @@ def key_exchange(key_a, key_b, k=None):
         f'(B) Berechne: b_y2 = a_y2^b_i mod p = {a_y2}^{b_i} mod {p} = {b_y2}\n'
         f'B erhält den Sitzungsschlüssel k = b_y2 = {k}.', end='\n\n')
     print(
-        f'Verifikation 1: k = k^(a * a^-1) mod p = {(k ** (a * a_i)) % p}\n'
-        f'Verifikation 2: k = k^(b * b^-1) mod p = {(k ** (b * b_i)) % p}', end='\n\n')
+        f'Verifikation 1: k = k^(a * a^-1) mod p = {modexp.modexp(k, a * a_i, p)}\n'
+        f'Verifikation 2: k = k^(b * b^-1) mod p = {modexp.modexp(k, b * b_i, p)}', end='\n\n')
     return k
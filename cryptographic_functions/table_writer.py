@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import point_counting
+from cryptographic_functions.core import tables
+import csv
+import numpy as np
+import sys
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+# Number of rows which are formatted and written at once
+CHUNK_ROWS = 256
+
+
+# Rows y, (0 + y) mod m, ..., (m - 1 + y) mod m of the addition table
+def addition_rows(m):
+    for rows, block in tables.blocks(tables.addition_table, m, np.arange(m)):
+        for y, row in zip(rows.tolist(), block.tolist()):
+            yield [y] + row
+
+
+# Rows y, (0 * y) mod m, ..., ((m - 1) * y) mod m of the multiplication table
+def multiplication_rows(m):
+    for rows, block in tables.blocks(tables.multiplication_table, m, np.arange(m)):
+        for y, row in zip(rows.tolist(), block.tolist()):
+            yield [y] + row
+
+
+# Rows x, x^1 mod m, ..., x^(m - 1) mod m of the power table
+def power_rows(m):
+    for rows, block in tables.blocks(tables.power_table, m, np.arange(1, m)):
+        for x, row in zip(rows.tolist(), block.tolist()):
+            yield [x] + row
+
+
+# Rows i, x, y of the affine points of an elliptic curve
+def curve_point_rows(curve):
+    i = 0
+    for chunk in point_counting.enumerate_points(curve):
+        for x, y in chunk.tolist():
+            i += 1
+            yield [i, x, y]
+
+
+# Column widths of a modulo m table derived from the headers and the largest possible value m - 1
+def column_widths(headers, m):
+    digits = len(str(m - 1))
+    return [max(len(str(h)), digits) for h in headers]
+
+
+# Streaming output of a table in the layout of tabulate(tablefmt='pretty') with fixed column widths
+def write_pretty(headers, rows, widths, file=None, chunk_rows=CHUNK_ROWS):
+    file = sys.stdout if file is None else file
+    separator = '+' + '+'.join('-' * (w + 2) for w in widths) + '+\n'
+
+    # Format string of one line with centered cells
+    line = '| ' + ' | '.join(f'{{:^{w}}}' for w in widths) + ' |\n'
+
+    file.write(separator + line.format(*map(str, headers)) + separator)
+    chunk = []
+    for row in rows:
+        chunk.append(line.format(*row))
+        if len(chunk) >= chunk_rows:
+            file.write(''.join(chunk))
+            chunk = []
+    file.write(''.join(chunk) + separator)
+
+
+# Streaming output of a table as CSV
+def write_csv(headers, rows, file, chunk_rows=CHUNK_ROWS):
+    writer = csv.writer(file)
+    writer.writerow(headers)
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            writer.writerows(chunk)
+            chunk = []
+    writer.writerows(chunk)
+
+
+# Streaming output of a table as Parquet with one row group per chunk (requires the optional package pyarrow)
+def write_parquet(headers, rows, path, chunk_rows=CHUNK_ROWS):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return -1
+
+    schema = pa.schema([(str(h), pa.int64()) for h in headers])
+    with pq.ParquetWriter(path, schema) as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                writer.write_table(pa.Table.from_pylist([dict(zip(schema.names, r)) for r in chunk], schema))
+                chunk = []
+        if chunk:
+            writer.write_table(pa.Table.from_pylist([dict(zip(schema.names, r)) for r in chunk], schema))
+    return 0
+
+
+# Output of a table to stdout, a file object or a file path (format chosen by the extension .csv, .parquet or text)
+def write_table(headers, rows, widths, output=None, chunk_rows=CHUNK_ROWS):
+    if output is None or not isinstance(output, str):
+        write_pretty(headers, rows, widths, output, chunk_rows)
+        return 0
+    if output.endswith('.parquet'):
+        return write_parquet(headers, rows, output, chunk_rows)
+    with open(output, 'w', newline='', encoding='utf-8') as f:
+        if output.endswith('.csv'):
+            write_csv(headers, rows, f, chunk_rows)
+        else:
+            write_pretty(headers, rows, widths, f, chunk_rows)
+    return 0
@@ -34,6 +34,7 @@ if __name__ == '__main__':
     # modulo_calculations.subtraction(modulo_m, modulo_a, modulo_b, print_matrix)
     # modulo_calculations.multiplication(modulo_m, modulo_a, modulo_b)
     # modulo_calculations.division(modulo_m, modulo_a, modulo_b, print_matrix, print_linear_factorization)
+    # modulo_calculations.square_root(modulo_m, modulo_a)
     # modulo_cyclic_groups.mcg(modulo_m, print_matrix)
     # modulo_inverse_additive.mia(modulo_m, modulo_a, print_matrix)
     # modulo_inverse_multiplicative.mim(modulo_m, modulo_a, print_matrix, print_linear_factorization)
@@ -50,13 +51,19 @@ if __name__ == '__main__':
     rsa_private_key = (rsa_d, rsa_n)
     rsa_plaintext = 4
     rsa_ciphertext = 31
+    rsa_signature = 16
     rsa_x = 1  # Optional argument
     rsa_c = 23  # Optional argument
+    rsa_bits = 2048
 
     # rsa_calculations.keypair_generation(rsa_p, rsa_q, rsa_e, print_matrix, print_linear_factorization)
+    # rsa_calculations.random_keypair_generation(rsa_bits)
     # rsa_calculations.encryption(rsa_public_key, rsa_plaintext)
     # rsa_calculations.decryption(rsa_private_key, rsa_ciphertext)
+    # rsa_calculations.sign(rsa_private_key, rsa_plaintext)
+    # rsa_calculations.verify(rsa_public_key, rsa_plaintext, rsa_signature)
     # rsa_calculations.pollard_rho(rsa_n, rsa_x, rsa_c)
+    # rsa_calculations.factorization(rsa_n)
 
     #################################
     # Diffie–Hellman initial values #
@@ -127,6 +134,7 @@ if __name__ == '__main__':
     #                                                              elgamal_homomorphic_c_1, elgamal_homomorphic_c_2,
     #                                                              print_matrix, print_linear_factorization)
     # elgamal_calculations.bsgs(elgamal_public_key, print_matrix, print_linear_factorization)
+    # elgamal_calculations.discrete_logarithm(elgamal_public_key)
 
     #########################################
     # Fermat's factorization initial values #
@@ -134,6 +142,7 @@ if __name__ == '__main__':
     fermat_n = 33
 
     # fermat_calculations.factorization(fermat_n)
+    # fermat_calculations.one_line_factorization(fermat_n)
 
     #################################
     # Elliptic curve initial values #
@@ -145,9 +154,41 @@ if __name__ == '__main__':
     ecc_curve = (ecc_a, ecc_b, ecc_n)
     ecc_p = (2, 0)
     ecc_q = (1, 3)
+    ecc_k = 5
+    ecc_mode = 'wnaf'  # Optional argument ('wnaf', 'ladder' or 'comb')
 
     # ecc_calculations.on_curve(ecc_curve, ecc_p)
     # ecc_calculations.addition(ecc_curve, ecc_p, ecc_q, print_matrix, print_linear_factorization)
+    # ecc_calculations.scalar_mul(ecc_curve, ecc_k, ecc_q, ecc_mode)
+    # ecc_calculations.multi_scalar_mul(ecc_curve, [ecc_k, 3], [ecc_p, ecc_q])
+    # ecc_calculations.curve_order(ecc_curve, print_matrix)
+    # ecc_calculations.prime_order_curve(ecc_n)
+    # ecc_calculations.curve_points(ecc_curve)
+    # ecc_calculations.discrete_log(ecc_curve, ecc_q, ecc_calculations.scalar_mul(ecc_curve, ecc_k, ecc_q, quiet=True))
+    # ecc_calculations.compress(ecc_curve, ecc_q)
+    # ecc_calculations.decompress(ecc_curve, ecc_calculations.compress(ecc_curve, ecc_q, quiet=True))
+
+    #################################
+    # ECDH and ECDSA initial values #
+    #################################
+    # Base point ecdsa_g of prime order ecdsa_order on y^2 = x^3 + 2 * x + 2 (mod 17)
+    ecdsa_curve = (2, 2, 17)
+    ecdsa_g = (5, 1)
+    ecdsa_order = 19
+    ecdsa_a = 3  # Optional argument
+    ecdsa_b = 7  # Optional argument
+    ecdsa_d = 7  # Optional argument
+    ecdsa_k = 8  # Optional argument
+    ecdsa_public_key = (ecdsa_curve, ecdsa_g, ecdsa_order, (0, 6))
+    ecdsa_private_key = (ecdsa_order, ecdsa_d)
+    ecdsa_m = 10
+    ecdsa_signature = (13, 15, 1)
+
+    # ecc_calculations.key_exchange(ecdsa_curve, ecdsa_g, ecdsa_order, ecdsa_a, ecdsa_b)
+    # ecc_calculations.keypair_generation(ecdsa_curve, ecdsa_g, ecdsa_order, ecdsa_d)
+    # ecc_calculations.sign(ecdsa_public_key, ecdsa_private_key, ecdsa_m, ecdsa_k)
+    # ecc_calculations.verify(ecdsa_public_key, ecdsa_m, ecdsa_signature)
+    # ecc_calculations.batch_verify([(ecdsa_public_key, ecdsa_m, ecdsa_signature)])
 
     ####################################################
     # Fiat-Shamir identification scheme initial values #
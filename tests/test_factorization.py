@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import factorization
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# A failing Pollard's rho stage falls through to ECM instead of returning the sentinel as a factor
+def test_factorize_without_rho(monkeypatch):
+    monkeypatch.setattr(factorization, 'pollard_rho', lambda n: -1)
+    assert factorization.factorize(1000003 * 1000033) == [(1000003, 1), (1000033, 1)]
+
+
+# The trace records the method that actually split each number
+def test_factorize_trace(monkeypatch):
+    trace = []
+    assert factorization.factorize(2 ** 200 * 3, trace=trace) == [(2, 200), (3, 1)]
+    assert trace == [('Probedivision', 2 ** 200 * 3, 2)]
+
+    trace = []
+    monkeypatch.setattr(factorization, 'pollard_rho', lambda n: -1)
+    factorization.factorize(1000003 * 1000033, trace=trace)
+    assert [step[0] for step in trace] == ['Elliptische-Kurven-Methode']
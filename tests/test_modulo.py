@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+from cryptographic_functions.core import modulo
+
+__author__ = "Lukas Zorn"
+__copyright__ = "Copyright 2021 Lukas Zorn"
+__license__ = "GNU GPLv3"
+
+
+# Tonelli-Shanks and Cipolla return 0 for a ≡ 0 and -1 for quadratic non-residues
+def test_square_root_edge_cases():
+    for sqrt in (modulo.tonelli_shanks, modulo.cipolla):
+        assert sqrt(17, 0) == 0
+        assert sqrt(17, 34) == 0
+        assert sqrt(17, 3) == -1
+        assert sqrt(17, 2) in (6, 11)